@@ -6,6 +6,15 @@ Written by Lucas Sinclair and Paul Rougieux.
 
 JRC Biomass Project.
 Unit D1 Bioeconomy.
+
+By default, importing this package will immediately make sure that the cache
+directory exists (cloning it if needed). If the environment variable
+`FOREST_PULLER_LAZY` is set, importing is instead free of side effects and
+the cache directory is only resolved the first time `cache_dir` is accessed:
+
+    $ export FOREST_PULLER_LAZY=1
+    >>> import forest_puller
+    >>> print(forest_puller.cache_dir)
 """
 
 # Special variables #
@@ -15,8 +24,7 @@ __version__ = '1.4.2'
 import os, sys
 
 # First party modules #
-from autopaths    import Path
-from plumbing.git import GitRepo
+from autopaths import Path
 
 # Constants #
 project_name  = 'forest_puller'
@@ -30,35 +38,69 @@ module_dir = Path(os.path.dirname(self.__file__))
 # The repository directory #
 repos_dir = module_dir.directory
 
-# The module is maybe in a git repository #
-git_repo = GitRepo(repos_dir, empty=True)
-
 # Determine where to cache things #
 env_var_name = "FOREST_PULLER_CACHE"
 
-# If it is specified by user #
-if env_var_name in os.environ:
-    cache_dir = os.environ[env_var_name]
-    if not cache_dir.endswith('/'): cache_dir += '/'
-
-# If it is not specified by user #
-else:
-    cache_dir = os.path.expanduser('~/.forest_puller/')
-
-# It is a git repository that can be empty at first #
-cache_dir = GitRepo(cache_dir, empty=True)
-
-# Guarantee it exists #
-cache_dir.create_if_not_exists()
-
-# If it's empty: clone it #
-if cache_dir.empty:
-    print("Cloning forest puller cache repository into '%s'." % cache_dir)
-    cache_dir.clone_from(cache_git_url, shell=True)
-
-# If it's not a repository: raise #
-if not cache_dir.is_a_repos:
-    raise Exception("It appears the cache directory was not cloned successfully.")
-
-# Monkey patch pandas library #
-import plumbing.pandas_patching
+# Determine if we should postpone all initialization #
+lazy_var_name = "FOREST_PULLER_LAZY"
+lazy_mode     = os.environ.get(lazy_var_name, '') not in ('', '0')
+
+###############################################################################
+def load_git_repo():
+    """The module is maybe in a git repository."""
+    from plumbing.git import GitRepo
+    return GitRepo(repos_dir, empty=True)
+
+def load_cache_dir():
+    """
+    Find the cache directory, clone it if it is empty, and check that it is
+    indeed a git repository. We also monkey patch the pandas library here as
+    every use of the cached data relies on it.
+    """
+    # Import #
+    from plumbing.git import GitRepo
+    # If it is specified by user #
+    if env_var_name in os.environ:
+        path = os.environ[env_var_name]
+        if not path.endswith('/'): path += '/'
+    # If it is not specified by user #
+    else:
+        path = os.path.expanduser('~/.forest_puller/')
+    # It is a git repository that can be empty at first #
+    path = GitRepo(path, empty=True)
+    # Guarantee it exists #
+    path.create_if_not_exists()
+    # If it's empty: clone it #
+    if path.empty:
+        print("Cloning forest puller cache repository into '%s'." % path)
+        path.clone_from(cache_git_url, shell=True)
+    # If it's not a repository: raise #
+    if not path.is_a_repos:
+        raise Exception("It appears the cache directory was not cloned successfully.")
+    # Monkey patch pandas library #
+    import plumbing.pandas_patching
+    # Return #
+    return path
+
+###############################################################################
+# The attributes that are computed on first access and how to compute them #
+lazy_attributes = {'git_repo':  load_git_repo,
+                   'cache_dir': load_cache_dir}
+
+def __getattr__(name):
+    """
+    Called only when `name` is not found in the module namespace.
+    See PEP 562 for more information.
+    """
+    if name not in lazy_attributes:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    # Compute it once and store it in the module namespace #
+    value = lazy_attributes[name]()
+    setattr(self, name, value)
+    # Return #
+    return value
+
+# Unless told otherwise, we initialize everything right away #
+if not lazy_mode:
+    git_repo  = load_git_repo()
+    cache_dir = load_cache_dir()
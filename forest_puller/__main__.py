@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+Makes the package runnable as a command, see `forest_puller.build`:
+
+    $ python -m forest_puller build manuscript
+"""
+
+# Built-in modules #
+import sys
+
+# Internal modules #
+from forest_puller.build import main
+
+###############################################################################
+sys.exit(main())
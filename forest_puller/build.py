@@ -0,0 +1,494 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+The derived data frames, figures and tables depend on each other: the BCEFs
+are computed from the SOEF tables, the root to shoot ratios from the BCEFs,
+the conversion to tons from both of them and from the increments, and the
+figures and tables from all of these. Every one of them is registered here
+as a node of a graph, with the nodes it depends on.
+
+From a command line, you can build a single figure, a single table or a
+whole report, together with everything it depends on:
+
+    $ forest_puller build manuscript
+    $ forest_puller build table_average_growth
+    $ forest_puller build fig_dynamics_mass/AT --processes 4
+    $ forest_puller list
+
+Or, from python:
+
+    >>> from forest_puller.build import scheduler
+    >>> scheduler.build(['fig_dynamics_mass'], processes=4)
+
+A node is only rebuilt if one of its outputs is missing, or is older than
+the source code of the node or than the outputs of the nodes it depends on
+(as `make` does). Nodes that don't depend on each other, and the graphs of
+a same figure, are built at the same time on a pool of processes.
+
+Nodes that only exist in memory (e.g. `converted_to_tons`) have no outputs.
+They are never run by themselves: every process computes them when a figure
+or a table needs them. They still propagate the changes of their source
+code and of their dependencies. The raw data of the IPCC, FAOSTAT, FRA and
+HPFFRE is stored by `scripts/dev/regen_prop_pickled.py` and is not part
+of this graph.
+"""
+
+# Built-in modules #
+import os, sys, argparse, importlib.util
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+# Internal modules #
+
+# First party modules #
+
+# Third party modules #
+
+###############################################################################
+def resolve(target):
+    """
+    Find the object designated by a string such as
+    'forest_puller.viz.increments:legend' or 'module:obj.attribute'.
+    """
+    module, _, attributes = target.partition(':')
+    obj = importlib.import_module(module)
+    for attribute in attributes.split('.') if attributes else []:
+        obj = getattr(obj, attribute)
+    return obj
+
+def source_file(target):
+    """The python file of the module in `target`, without importing it."""
+    module = target.partition(':')[0]
+    return importlib.util.find_spec(module).origin
+
+def mtime(path):
+    """The modification time of a file or `None` if it is missing."""
+    try: return os.path.getmtime(str(path))
+    except OSError: return None
+
+def newest_in(directory):
+    """The newest modification time of all files inside a directory."""
+    times = [mtime(os.path.join(root, name))
+             for root, dirs, names in os.walk(str(directory)) for name in names]
+    times = [t for t in times if t is not None]
+    return max(times) if times else None
+
+###############################################################################
+class Node:
+    """
+    One step of the build. A node has zero or more items, each with its own
+    output files, that can be built independently of each other (e.g. the
+    graphs of every country). Subclasses define `items`, `outputs` and `run`.
+    """
+
+    # Should the node run in the main process instead of a worker #
+    local = False
+
+    # Does the node decide by itself what to rebuild when it runs #
+    self_checking = False
+
+    def __init__(self, name, deps=(), sources=()):
+        # The name used on the command line #
+        self.name    = name
+        # The names of the nodes that must be built before #
+        self.deps    = list(deps)
+        # The 'module:attribute' strings whose source files are inputs #
+        self.sources = list(sources)
+
+    def __repr__(self):
+        return '<%s node "%s">' % (self.__class__.__name__, self.name)
+
+    #----------------------------- Subclassable ------------------------------#
+    def items(self):
+        """The keys of the items that can be built separately."""
+        return [None]
+
+    def outputs(self, item):
+        """The files produced by one item. None means the node is phony."""
+        return None
+
+    def run(self, item, processes=None, rerun=False):
+        """
+        Build one item. The nodes that are `local` also receive the number
+        of `processes` and the `rerun` flag of the build.
+        """
+        pass
+
+    #------------------------------- Freshness -------------------------------#
+    @property
+    def phony(self):
+        """A node without outputs is never built by itself."""
+        return all(self.outputs(item) is None for item in self.items())
+
+    def source_time(self):
+        """The newest modification time of the source code of this node."""
+        times = [mtime(source_file(s)) for s in self.sources]
+        return max([t for t in times if t is not None], default=None)
+
+    def stamp(self, upstream=None):
+        """
+        The time at which this node last changed. For phony nodes it is the
+        time at which its sources or any of its dependencies last changed.
+        """
+        times = [self.source_time(), upstream]
+        if self.phony: return max([t for t in times if t is not None], default=None)
+        for item in self.items():
+            times += [mtime(path) for path in self.outputs(item)]
+        return max([t for t in times if t is not None], default=None)
+
+    def stale_items(self, upstream=None, rerun=False):
+        """
+        The items that must be built given the newest modification time
+        `upstream` of the nodes this node depends on.
+        """
+        if self.phony: return []
+        newest = max([t for t in (self.source_time(), upstream) if t is not None], default=None)
+        stale  = []
+        for item in self.items():
+            times = [mtime(path) for path in self.outputs(item)]
+            if rerun or not times or None in times: stale.append(item); continue
+            if newest is not None and min(times) < newest: stale.append(item)
+        return stale
+
+#-----------------------------------------------------------------------------#
+class DataNode(Node):
+    """
+    A data frame computed by a property of an object. If the property is
+    pickled, its pickle file is the output of the node. Otherwise the node
+    is phony. Alternatively, a `function` can be given that takes care of
+    its own freshness, such as the `build_all` functions, together with the
+    `directory` of the cache where it writes its results.
+    """
+
+    def __init__(self, name, target=None, prop=None, function=None, directory=None,
+                 deps=(), sources=()):
+        # The object and the name of its property #
+        self.target    = target
+        self.prop      = prop
+        # The function that stores the data frames #
+        self.function  = function
+        self.directory = directory
+        # Functions run their own pool and check their own freshness #
+        self.local         = function is not None
+        self.self_checking = function is not None
+        # Super #
+        super().__init__(name, deps, list(sources) + [target or function])
+
+    def outputs(self, item):
+        if self.function is not None: return []
+        if self.prop is None: return None
+        # Pickled properties are stored at the path of another attribute #
+        prop = getattr(type(resolve(self.target)), self.prop)
+        return [prop.get_pickle_path(resolve(self.target))]
+
+    def stamp(self, upstream=None):
+        if self.function is None: return super().stamp(upstream)
+        import forest_puller
+        times = [self.source_time(), upstream, newest_in(forest_puller.cache_dir + self.directory)]
+        return max([t for t in times if t is not None], default=None)
+
+    def stale_items(self, upstream=None, rerun=False):
+        # The function decides by itself what is out of date #
+        if self.function is not None: return [None]
+        return super().stale_items(upstream, rerun)
+
+    def run(self, item, processes=None, rerun=False):
+        # Functions #
+        if self.function is not None:
+            return resolve(self.function)(processes=processes, rerun=rerun)
+        # Remove the previous value, from memory and from disk #
+        obj = resolve(self.target)
+        obj.__dict__.get('__cache__', {}).pop(self.prop, None)
+        for path in self.outputs(item):
+            if os.path.exists(str(path)): os.remove(str(path))
+        # Compute it again #
+        return getattr(obj, self.prop)
+
+#-----------------------------------------------------------------------------#
+class GraphsNode(Node):
+    """
+    A figure made of one or more graphs. Each graph is an item, named after
+    its `short_name`, e.g. 'AT' or 'legend'. The `graphs` are strings
+    designating either one graph or a list of graphs.
+    """
+
+    def __init__(self, name, graphs, deps=()):
+        self.graphs = list(graphs)
+        super().__init__(name, deps, self.graphs)
+
+    @property
+    def all_graphs(self):
+        """Every graph of this figure indexed by short name."""
+        result = {}
+        for target in self.graphs:
+            found = resolve(target)
+            if not isinstance(found, (list, tuple)): found = [found]
+            for graph in found: result[graph.short_name] = graph
+        return result
+
+    def items(self):              return list(self.all_graphs)
+    def outputs(self, item):      return [self.all_graphs[item].path]
+    def run(self, item):          return self.all_graphs[item].plot(rerun=True)
+
+#-----------------------------------------------------------------------------#
+class TableNode(Node):
+    """A table exported to CSV and to TeX."""
+
+    def __init__(self, name, table, deps=()):
+        self.table = table
+        super().__init__(name, deps, [table])
+
+    def outputs(self, item):
+        table = resolve(self.table)
+        paths = {'tex': table.path, 'csv': table.csv_path}
+        return [paths[f] for f in table.formats]
+
+    def run(self, item): return resolve(self.table).save()
+
+#-----------------------------------------------------------------------------#
+class Group(Node):
+    """A phony node that only gathers other nodes, e.g. a report."""
+
+###############################################################################
+class Scheduler:
+    """
+    Builds nodes in the order given by their dependencies. Whenever a node
+    has all its dependencies built, its stale items are sent to a pool of
+    processes. Independent nodes are therefore built at the same time.
+    """
+
+    def __init__(self, nodes):
+        # Every node indexed by name #
+        self.nodes = {node.name: node for node in nodes}
+
+    def __repr__(self):
+        return '%s object with %i nodes' % (self.__class__, len(self.nodes))
+
+    def __getitem__(self, name): return self.nodes[name]
+    def __iter__(self):          return iter(self.nodes)
+    def __len__(self):           return len(self.nodes)
+
+    def closure(self, targets):
+        """The targets and everything they depend on, dependencies first."""
+        order, visiting, done = [], set(), set()
+        def visit(name):
+            if name in done: return
+            if name not in self.nodes:
+                raise KeyError("Unknown node '%s', choose among %s." % (name, sorted(self.nodes)))
+            if name in visiting: raise ValueError("The node '%s' depends on itself." % name)
+            visiting.add(name)
+            for dep in self.nodes[name].deps: visit(dep)
+            visiting.remove(name)
+            done.add(name)
+            order.append(name)
+        for target in targets: visit(target)
+        return order
+
+    def plan(self, targets, rerun=False, only=None):
+        """
+        Without building anything, return the list of (node name, items)
+        that would be built. The nodes that depend on a node that would be
+        built are considered entirely stale.
+        """
+        result, changed = [], set()
+        for name in self.closure(targets):
+            node = self.nodes[name]
+            if any(dep in changed for dep in node.deps): items = node.stale_items(rerun=True)
+            else: items = node.stale_items(self.upstream(node, {}), rerun)
+            items = self.restrict(node, items, targets, only)
+            if node.self_checking: items = [None]
+            elif items or (node.phony and any(dep in changed for dep in node.deps)): changed.add(name)
+            if items: result.append((name, items))
+        return result
+
+    #------------------------------- Running ---------------------------------#
+    def upstream(self, node, stamps):
+        """The newest stamp of the dependencies of a node."""
+        times = [stamps[dep] if dep in stamps else self.nodes[dep].stamp() for dep in node.deps]
+        return max([t for t in times if t is not None], default=None)
+
+    @staticmethod
+    def restrict(node, items, targets, only):
+        """Keep only the item asked for, when the node is a target."""
+        if only is None or node.name not in targets: return items
+        return [item for item in items if item == only]
+
+    def build(self, targets, processes=None, rerun=False, only=None, verbose=True):
+        """
+        Build the `targets` (node names) and everything they depend on.
+        If `only` is given, only that item of the targets is built (e.g.
+        the graph of one country). Returns the list of (node name, item)
+        that were built.
+        """
+        # The nodes involved #
+        order   = self.closure(targets)
+        waiting = {name: set(self.nodes[name].deps) for name in order}
+        stamps  = {}
+        built   = []
+        # Default number of processes #
+        if processes is None: processes = os.cpu_count()
+        pool    = None
+        if processes > 1: pool = ProcessPoolExecutor(processes, initializer=init_worker)
+        running = {}
+        # Every node that has no dependencies left to build #
+        def ready(): return [name for name in order if name in waiting and not waiting[name]]
+        # Mark a node as finished #
+        def finish(name):
+            node = self.nodes[name]
+            stamps[name] = node.stamp(self.upstream(node, stamps))
+            for other in waiting.values(): other.discard(name)
+        try:
+            while waiting or running:
+                # Start every node that can start #
+                for name in ready():
+                    del waiting[name]
+                    node  = self.nodes[name]
+                    items = node.stale_items(self.upstream(node, stamps), rerun)
+                    items = self.restrict(node, items, targets, only)
+                    if not items: finish(name); continue
+                    if verbose: print("Building %s (%i items)." % (name, len(items)))
+                    # Some nodes run here, or everything when there is no pool #
+                    if pool is None or node.local:
+                        options = dict(processes=processes, rerun=rerun) if node.local else {}
+                        for item in items: run_task(node, item, **options); built.append((name, item))
+                        finish(name)
+                        continue
+                    running[name] = {pool.submit(run_task, node, item): item for item in items}
+                # Wait for one item to finish #
+                if not running: continue
+                futures = [f for fs in running.values() for f in fs]
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for name in list(running):
+                    for future in [f for f in running[name] if f in done]:
+                        future.result()
+                        built.append((name, running[name].pop(future)))
+                    if not running[name]:
+                        del running[name]
+                        finish(name)
+        finally:
+            if pool is not None: pool.shutdown(cancel_futures=True)
+        # Return #
+        return built
+
+###############################################################################
+def init_worker():
+    """Called once in every worker process."""
+    import matplotlib
+    matplotlib.use('Agg')
+
+def run_task(node, item, **options):
+    """Build one item of one node. This runs inside each worker process."""
+    node.run(item, **options)
+    return node.name, item
+
+###############################################################################
+# Every node of the graph #
+nodes = [
+    #--------------------------------- Data ----------------------------------#
+    DataNode('soef',
+             function  = 'forest_puller.soef.parallel:build_all',
+             directory = 'soef/df/'),
+    DataNode('bcef',
+             target = 'forest_puller.conversion.bcef_by_country:country_bcef',
+             prop   = 'by_country_year',
+             deps   = ['soef']),
+    DataNode('root_ratio',
+             target = 'forest_puller.conversion.root_ratio_by_country:country_root_ratio',
+             deps   = ['bcef']),
+    DataNode('increments',
+             target = 'forest_puller.viz.increments_df:increments_data',
+             deps   = ['soef']),
+    DataNode('converted_to_tons',
+             target = 'forest_puller.viz.converted_to_tons:converted_tons_data',
+             deps   = ['bcef', 'root_ratio', 'increments']),
+    DataNode('area_comp',
+             target = 'forest_puller.viz.area_comp:area_comp_data',
+             deps   = ['soef']),
+    #-------------------------------- Figures --------------------------------#
+    GraphsNode('fig_area',
+               ['forest_puller.viz.area_comp:all_graphs',
+                'forest_puller.viz.area_comp:legend'],
+               deps = ['area_comp']),
+    GraphsNode('fig_increments',
+               ['forest_puller.viz.increments:all_graphs',
+                'forest_puller.viz.increments:legend'],
+               deps = ['increments']),
+    GraphsNode('fig_converted_tons',
+               ['forest_puller.viz.converted_to_tons:all_graphs',
+                'forest_puller.viz.converted_to_tons:legend'],
+               deps = ['converted_to_tons']),
+    GraphsNode('fig_area_comparison',
+               ['forest_puller.viz.manuscript.area_comparison:all_graphs',
+                'forest_puller.viz.manuscript.area_comparison:legend'],
+               deps = ['area_comp']),
+    GraphsNode('fig_dynamics_volume',
+               ['forest_puller.viz.manuscript.dynamics_volume:all_graphs'],
+               deps = ['increments', 'fig_increments']),
+    GraphsNode('fig_dynamics_mass',
+               ['forest_puller.viz.manuscript.dynamics_mass:all_graphs'],
+               deps = ['converted_to_tons', 'fig_converted_tons']),
+    #-------------------------------- Tables ---------------------------------#
+    TableNode('table_max_area',
+              'forest_puller.tables.max_area_over_time:max_area',
+              deps = ['area_comp']),
+    TableNode('table_avail_for_supply',
+              'forest_puller.tables.available_for_supply:afws_comp',
+              deps = ['soef']),
+    TableNode('table_average_growth',
+              'forest_puller.tables.average_growth:avg_tons',
+              deps = ['converted_to_tons']),
+    #-------------------------------- Reports --------------------------------#
+    Group('manuscript',
+          deps = ['fig_area_comparison', 'fig_dynamics_volume', 'fig_dynamics_mass',
+                  'table_max_area', 'table_avail_for_supply', 'table_average_growth']),
+]
+
+# Create a singleton #
+scheduler = Scheduler(nodes)
+
+###############################################################################
+def main(args=None):
+    """The `forest_puller` command line entry point."""
+    # Parse #
+    parser   = argparse.ArgumentParser(prog='forest_puller')
+    commands = parser.add_subparsers(dest='command', required=True)
+    build    = commands.add_parser('build', help="Build targets and what they depend on.")
+    build.add_argument('targets', nargs='+',
+                       help="Node names, or 'node/item' for a single graph, e.g. 'fig_dynamics_mass/AT'.")
+    build.add_argument('--processes', type=int, default=None)
+    build.add_argument('--rerun',   action='store_true', help="Rebuild even what is up to date.")
+    build.add_argument('--dry-run', action='store_true', help="Only print what would be built.")
+    commands.add_parser('list', help="Show every node and its dependencies.")
+    args = parser.parse_args(args)
+    # List #
+    if args.command == 'list':
+        for name in scheduler:
+            deps = scheduler[name].deps
+            print(name + (' <- ' + ', '.join(deps) if deps else ''))
+        return 0
+    # Split the items from the targets #
+    targets = [t.partition('/')[0] for t in args.targets]
+    items   = {t.partition('/')[2] for t in args.targets} - {''}
+    if len(items) > 1: parser.error("Only one item can be asked for at a time.")
+    only = items.pop() if items else None
+    unknown = [t for t in targets if t not in scheduler.nodes]
+    if unknown: parser.error("Unknown targets %s, see 'forest_puller list'." % unknown)
+    # Faceless plotting #
+    init_worker()
+    # Dry run #
+    if args.dry_run:
+        for name, items in scheduler.plan(targets, args.rerun, only):
+            if items == [None]: print(name)
+            else: print("%s: %s" % (name, ', '.join(items)))
+        return 0
+    # Build #
+    built = scheduler.build(targets, args.processes, args.rerun, only)
+    print("Built %i items." % len(built))
+    return 0
+
+if __name__ == '__main__': sys.exit(main())
@@ -9,16 +9,131 @@ Unit D1 Bioeconomy.
 """
 
 # Built-in modules #
+import os, sys, pickle, tempfile
+from abc import ABC, abstractmethod
 
 # Internal modules #
 from forest_puller import module_dir
 
+# First party modules #
+from plumbing.cache import property_cached
+
 # Third party modules #
 import numpy, pandas
 
-# Load country codes #
-country_codes = module_dir + 'extra_data/country_codes.csv'
-country_codes = pandas.read_csv(str(country_codes))
+###############################################################################
+class ExtraData:
+    """
+    Gives access to the CSV files that are shipped with the package in the
+    `extra_data` directory. Each file is only read the first time it is
+    accessed.
+    """
+
+    def __init__(self, base_dir):
+        # Record where the CSV files are located #
+        self.base_dir = base_dir
+
+    def path(self, name):
+        """The location of one of the CSV files."""
+        return self.base_dir + name + '.csv'
+
+    def load(self, name):
+        """Read one of the CSV files into a data frame."""
+        return pandas.read_csv(str(self.path(name)))
+
+    @property_cached
+    def country_codes(self):  return self.load('country_codes')
+
+    @property_cached
+    def ipcc_columns(self):   return self.load('ipcc_columns')
+
+    @property_cached
+    def ipcc_rows(self):      return self.load('ipcc_rows')
+
+    @property_cached
+    def ipcc_layouts(self):   return self.load('ipcc_layouts')
+
+    @property_cached
+    def soef_columns(self):   return self.load('soef_columns')
+
+    @property_cached
+    def soef_rows(self):      return self.load('soef_rows')
+
+    @property_cached
+    def hpffre_columns(self): return self.load('hpffre_columns')
+
+    #------------------------------ Derived ----------------------------------#
+    @property_cached
+    def ipcc_row_names(self):
+        """The `ipcc_rows` mapping as a dictionary of long to short names."""
+        rows = self.ipcc_rows
+        return dict(zip(rows['ipcc'], rows['forest_puller']))
+
+    @property_cached
+    def ipcc_unit_ratios(self):
+        """
+        The `unit_convert_ratio` of every IPCC column that needs converting,
+        as a series indexed by the short column names.
+        """
+        cols   = self.ipcc_columns.dropna(subset=['unit_convert_ratio'])
+        ratios = pandas.Series(cols['unit_convert_ratio'].values,
+                               index = cols['forest_puller'].values,
+                               dtype = 'float64')
+        return ratios
+
+# Create a singleton #
+extra_data = ExtraData(module_dir + 'extra_data/')
+
+###############################################################################
+def lazy_attributes(module_name, names, create):
+    """
+    Returns a function that can be used as a module level `__getattr__`
+    (see PEP 562). The first time that any of the attributes in `names` is
+    accessed, the `create` function is called. It must return a dictionary
+    containing every one of `names`. These are then stored in the module's
+    namespace so that `create` is never called again.
+    """
+    def __getattr__(name):
+        if name not in names:
+            raise AttributeError("module %r has no attribute %r" % (module_name, name))
+        module = sys.modules[module_name]
+        for key, value in create().items(): setattr(module, key, value)
+        return getattr(module, name)
+    return __getattr__
+
+# The country codes are only loaded when first needed #
+__getattr__ = lazy_attributes(__name__, ('country_codes',),
+                              lambda: {'country_codes': extra_data.country_codes})
+
+###############################################################################
+def write_atomically(path, dump):
+    """
+    Write a file such that readers never see a partially written file, even
+    when several processes write to the same cache. The `dump` function is
+    called with the path of a temporary file in the same directory, which is
+    then renamed to the final path.
+    """
+    # Make sure the directory exists #
+    directory = os.path.dirname(str(path))
+    os.makedirs(directory, exist_ok=True)
+    # Write to a temporary file #
+    handle, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    os.close(handle)
+    try:
+        dump(temp_path)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, str(path))
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    # Return #
+    return path
+
+def write_pickle_atomically(obj, path):
+    """Pickle an object to the given path with `write_atomically`."""
+    def dump(temp_path):
+        with open(temp_path, 'wb') as handle: pickle.dump(obj, handle)
+    return write_atomically(path, dump)
 
 ###############################################################################
 def convert_row_names(df, row_name_map, col_name_map, data_source_name):
@@ -65,4 +180,169 @@ def convert_units(df, col_name_map):
         except ValueError:
             df[col_name] = numpy.NaN
     # Return #
-    return df
\ No newline at end of file
+    return df
+
+###############################################################################
+class Partition:
+    """
+    Splits a data frame containing all countries into one data frame per
+    country. Instead of filtering the full data frame once for every
+    country, the rows are grouped together in a single pass and each
+    country receives a slice of the grouped rows, without copying them:
+
+        >>> from forest_puller.hpffre.zip_file import zip_file
+        >>> print(zip_file.by_country['AT'])
+
+    The partition column is removed from the slices. A value that is
+    not present gives an empty data frame with the same columns.
+    """
+
+    def __init__(self, df, column='country'):
+        # The column we split on #
+        self.column = column
+        # Group identical values together, keeping the original row order #
+        codes, uniques = pandas.factorize(df[column])
+        order = numpy.argsort(codes, kind='stable')
+        self.df = df.drop(columns=[column]).take(order).reset_index(drop=True)
+        # The start and end row of each value #
+        codes  = codes[order]
+        values = numpy.arange(len(uniques))
+        starts = numpy.searchsorted(codes, values, side='left')
+        ends   = numpy.searchsorted(codes, values, side='right')
+        self.bounds = dict(zip(uniques, zip(starts.tolist(), ends.tolist())))
+
+    def __repr__(self):
+        return '%s object with %i parts' % (self.__class__, len(self.bounds))
+
+    def __contains__(self, key): return key in self.bounds
+    def __iter__(self):          return iter(self.bounds)
+    def __len__(self):           return len(self.bounds)
+
+    def __getitem__(self, key):
+        """The rows of one value, with a fresh index."""
+        start, end = self.bounds.get(key, (0, 0))
+        return self.df.iloc[start:end].reset_index(drop=True)
+
+###############################################################################
+class Concat(ABC):
+    """
+    Concatenates the data frames of every country of a given data source.
+    Nothing is loaded at creation time. Instead, a caller can select only
+    the countries, years and columns it is interested in:
+
+        >>> from forest_puller.ipcc.concat import concat
+        >>> print(concat.select(countries=['AT', 'BE'], years=[1990]))
+
+    Every selection is memoized. The data frame with all countries and all
+    years is only built when the `df` attribute is accessed. The labels and
+    years of every selection use the compact types of `forest_puller.schema`.
+    A selection that matches nothing is an empty data frame.
+
+    Subclasses must define `countries` and can override `frames`.
+    """
+
+    def __init__(self):
+        # Every selection we have built so far #
+        self.memo = {}
+
+    def __repr__(self):
+        return '%s object with %i selections' % (self.__class__, len(self.memo))
+
+    def __call__(self, *args, **kwargs): return self.select(*args, **kwargs)
+
+    #----------------------------- Subclassable ------------------------------#
+    @property
+    @abstractmethod
+    def countries(self):
+        """
+        A dictionary of country objects indexed by ISO2 code, in the order
+        of the rows of the result. By default, every country object must
+        have a `country_cols` attribute, see `frames`.
+        """
+
+    def frames(self, countries, years, columns):
+        """
+        Return one data frame per country. Subclasses that are able to skip
+        the years not requested should do so and set `filters_years`.
+        Subclasses that are able to load only the columns requested should
+        do so and set `projects_columns`.
+        """
+        return (c.country_cols for c in countries)
+
+    # Can the `frames` method select years by itself? #
+    filters_years = False
+
+    # Can the `frames` method select columns by itself? #
+    projects_columns = False
+
+    #------------------------------- Methods ---------------------------------#
+    @staticmethod
+    def normalize(values):
+        """Turn a single value or an iterable into a sorted tuple."""
+        if values is None: return None
+        if isinstance(values, (str, int)): values = [values]
+        return tuple(sorted(set(values)))
+
+    def select(self, countries=None, years=None, columns=None):
+        """
+        Return the rows concerning only the given `countries` (ISO2 codes)
+        and `years`, keeping only the given `columns` in that order.
+        Passing `None` means all of them.
+        """
+        # The key in the memo #
+        if columns is not None: columns = tuple(columns)
+        key = (self.normalize(countries), self.normalize(years), columns)
+        # Is the answer already memoized? #
+        if key in self.memo: return self.memo[key]
+        # If the full data frame exists we can just filter it #
+        if (None, None, None) in self.memo:
+            df = self.subset(self.memo[(None, None, None)], *key[:2])
+            if columns is not None: df = df[list(columns)]
+        else: df = self.build(*key)
+        # Store the result for later #
+        self.memo[key] = df
+        # Return #
+        return df
+
+    def build(self, countries, years, columns):
+        """Load and concatenate only the data frames requested."""
+        # Pick the country objects keeping their original order #
+        if countries is None: chosen = list(self.countries.values())
+        else: chosen = [c for k, c in self.countries.items() if k in countries]
+        # Load #
+        frames = list(self.frames(chosen, years, columns))
+        # Concatenate, or keep only the columns asked for if nothing matches #
+        if not frames: df = self.empty(columns)
+        else: df = pandas.concat(frames, ignore_index=True)
+        # Filter the years if it was not done already #
+        if frames and years is not None and not self.filters_years:
+            df = self.subset(df, None, years)
+        # Keep only some columns if it was not done already #
+        if frames and columns is not None and not self.projects_columns:
+            df = df[list(columns)]
+        # Use categoricals and compact years #
+        from forest_puller.schema import schema
+        df = schema.apply(df)
+        # Return #
+        return df
+
+    @staticmethod
+    def empty(columns):
+        """A data frame without rows, with the `columns` requested."""
+        if columns is None: columns = ['country', 'year']
+        df = pandas.DataFrame(columns=list(columns))
+        if 'year' in df.columns: df['year'] = df['year'].astype('int64')
+        return df
+
+    @staticmethod
+    def subset(df, countries, years):
+        """Filter an existing data frame on the country and year columns."""
+        if countries is not None: df = df[df['country'].isin(countries)]
+        if years     is not None: df = df[df['year'].isin(years)]
+        return df.reset_index(drop=True)
+
+    #------------------------------ Properties -------------------------------#
+    @property
+    def df(self):
+        """The data frame with all countries and all years."""
+        return self.select()
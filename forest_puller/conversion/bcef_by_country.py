@@ -14,10 +14,10 @@ Typically you can use this submodule like this:
 """
 
 # Built-in modules #
-import itertools
 
 # Internal modules #
-from forest_puller.conversion.load_expansion_factor import bcef_coefs
+from forest_puller.interpolation                    import interpolator
+from forest_puller.conversion.load_expansion_factor import bcef_lookup
 from forest_puller.common                           import country_codes
 from forest_puller                                  import cache_dir
 
@@ -25,7 +25,7 @@ from forest_puller                                  import cache_dir
 from plumbing.cache import property_cached, property_pickled_at
 
 # Third party modules #
-import numpy, pandas
+import numpy
 
 ###############################################################################
 class CountryBCEF:
@@ -153,25 +153,6 @@ class CountryBCEF:
         # Return #
         return df
 
-    def get_one_bcef(self, row, kind):
-        """Function to be applied to each row of the previous dataframe."""
-        # If we get a NaN we return a NaN #
-        if row['stock_per_ha'] != row['stock_per_ha']: return numpy.nan
-        # Load #
-        df = bcef_coefs
-        # Select corresponding climatic zone #
-        df = df.query(f"climatic_zone == '{row['climatic_zone']}'")
-        # Select corresponding fores type#
-        df = df.query(f"forest_type == '{row['forest_type']}'")
-        # Select corresponding bounds on stock per hectare #
-        df = df.query(f"lower < {row['stock_per_ha']} <= upper")
-        # Make sure we have note more than one line #
-        assert len(df) <= 1
-        # Extract single float #
-        result = df['bcef' + kind].iloc[0]
-        # Return #
-        return result
-
     @property
     def with_bcef_coefs(self):
         """
@@ -183,10 +164,9 @@ class CountryBCEF:
         """
         # Load #
         df = self.all_stock_merch_by_climate.copy()
-        # Add three columns #
-        df['bcefi'] = df.apply(lambda row: self.get_one_bcef(row, 'i'), axis=1)
-        df['bcefr'] = df.apply(lambda row: self.get_one_bcef(row, 'r'), axis=1)
-        df['bcefs'] = df.apply(lambda row: self.get_one_bcef(row, 's'), axis=1)
+        # Add three columns, chosen by climatic zone, forest type and stock #
+        coefs = bcef_lookup.resolve(df, 'stock_per_ha', ['bcefi', 'bcefr', 'bcefs'])
+        df[coefs.columns] = coefs
         # Now we don't need the stock_per_ha column anymore #
         df = df.drop(columns=['stock_per_ha'])
         # Return #
@@ -216,13 +196,13 @@ class CountryBCEF:
         # Now we don't need that column anymore #
         df = df.drop(columns=['climatic_coef'])
         # Group and sum each BCEF while keeping area #
-        groups = df.groupby(['country', 'year', 'forest_type'])
+        groups = df.groupby(['country', 'year', 'forest_type'], observed=True)
         df     = groups.agg({'bcefi': 'sum',
                              'bcefr': 'sum',
                              'bcefs': 'sum',
                              'area':  'first'})
         # Get the ratio of conifers against broadleaved #
-        groups           = df.groupby(['country', 'year'])
+        groups           = df.groupby(['country', 'year'], observed=True)
         df['area_total'] = groups['area'].transform('sum')
         df['tree_coef']  = df['area'] / df['area_total']
         # Multiply by the ratio of the given leaf type #
@@ -230,7 +210,7 @@ class CountryBCEF:
         df['bcefr'] *= df['tree_coef']
         df['bcefs'] *= df['tree_coef']
         # Group and sum each BCEF #
-        groups = df.groupby(['country', 'year'])
+        groups = df.groupby(['country', 'year'], observed=True)
         df     = groups.agg({'bcefi': 'sum',
                              'bcefr': 'sum',
                              'bcefs': 'sum'})
@@ -243,22 +223,13 @@ class CountryBCEF:
     def by_country_year_intrpld(self):
         """
         Same as above but interpolate the coefficients to get more years.
+        The edges are held constant.
         """
-        # Create a small data frame with all country and years #
-        countries   = self.by_country_year['country'].drop_duplicates()
-        years       = range(self.min_year, self.max_year)
-        expand_grid = list(itertools.product(countries, years))
-        df          = pandas.DataFrame(expand_grid, columns=('country', 'year'))
-        # Join the BCEF data #
-        df = df.left_join(self.by_country_year, on=['country','year'])
-        # Interpolate #
-        country_groups = df.groupby('country')
-        df['bcefi'] = country_groups['bcefi'].transform(pandas.DataFrame.interpolate,
-                                                        limit_direction='both')
-        df['bcefr'] = country_groups['bcefr'].transform(pandas.DataFrame.interpolate,
-                                                        limit_direction='both')
-        df['bcefs'] = country_groups['bcefs'].transform(pandas.DataFrame.interpolate,
-                                                        limit_direction='both')
+        # Every year of the range #
+        years = range(self.min_year, self.max_year)
+        # Interpolate all coefficients of all countries #
+        df = interpolator(self.by_country_year, years, policy='linear',
+                          columns=['bcefi', 'bcefr', 'bcefs'])
         # Return #
         return df
 
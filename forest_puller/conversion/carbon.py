@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+Typically you can use this submodule like this:
+
+    >>> from forest_puller.conversion.carbon import carbon_converter
+    >>> print(carbon_converter.convert(df))
+
+Where `df` is a long format data frame with the columns:
+
+    ['source', 'country', 'year', 'variable', 'value', 'unit']
+"""
+
+# Built-in modules #
+
+# Internal modules #
+
+# First party modules #
+from plumbing.cache import property_cached
+
+# Third party modules #
+import numpy, pandas
+
+###############################################################################
+class CarbonConverter:
+    """
+    Converts volumes of wood per hectare into tons of carbon per hectare,
+    for any number of sources, countries, years and variables at once.
+
+    The conversion chain of each row is chosen by its unit and variable:
+
+    * Volumes under bark are first brought over bark with the bark
+      correction factor.
+    * The merchantable volume is then expanded to above ground biomass with
+      the BCEF of the variable (increment, removals or stock).
+    * The below ground biomass is added with the root to shoot ratio.
+    * The biomass is finally converted to carbon with the carbon fraction.
+
+    The coefficients of every country and year are joined once, through an
+    index on country and year. Rows whose unit is not a known volume unit
+    are returned unchanged, as are their units. Rows with a volume unit but
+    no matching BCEF (e.g. a net change) get NaN values.
+    """
+
+    # This value comes from:
+    # https://www.unece.org/fileadmin/DAM/timber/publications/DP-49.pdf
+    bark_correction_factor = 0.88
+
+    # This value comes from:
+    # https://www.ipcc-nggip.iges.or.jp/public/2006gl/pdf/4_Volume4/V4_04_Ch4_Forest_Land.pdf
+    carbon_fraction = 0.47
+
+    # The volume units we know and if they are measured over bark #
+    volume_units = {'m3 ob per ha': True,
+                    'm3 ub per ha': False}
+
+    # The unit of the converted values #
+    carbon_unit = 'tons per ha'
+
+    # The BCEF that applies to each variable #
+    bcef_of_variable = {'gain_per_ha':  'bcefi',
+                        'loss_per_ha':  'bcefr',
+                        'stock_per_ha': 'bcefs'}
+
+    # The names of the BCEF columns #
+    bcef_columns = ['bcefi', 'bcefr', 'bcefs']
+
+    def __repr__(self):
+        return '%s object' % self.__class__
+
+    #----------------------------- Data sources ------------------------------#
+    @property_cached
+    def coefs(self):
+        """
+        The BCEFs and the root to shoot ratio of every country and year,
+        indexed by country and year.
+        """
+        # Import #
+        from forest_puller.conversion.bcef_by_country       import country_bcef
+        from forest_puller.conversion.root_ratio_by_country import country_root_ratio
+        # Load #
+        bcef = country_bcef.by_country_year_intrpld
+        root = country_root_ratio.by_country_year_intrpld
+        # Combine #
+        df = bcef.merge(root, on=['country', 'year'], how='outer')
+        df['country'] = df['country'].astype(str)
+        # Index #
+        df = df.set_index(['country', 'year']).sort_index()
+        # Return #
+        return df
+
+    #------------------------------- Methods ---------------------------------#
+    def lookup(self, df):
+        """The coefficients of every row of `df`, in the same order."""
+        keys = pandas.MultiIndex.from_arrays([df['country'].astype(str).to_numpy(),
+                                              df['year'].to_numpy()])
+        return self.coefs.reindex(keys)
+
+    def is_volume(self, df):
+        """A boolean array, true for the rows of `df` that are volumes."""
+        return df['unit'].isin(list(self.volume_units)).to_numpy()
+
+    def chain(self, volume):
+        """
+        The coefficients of the conversion chain of every row of `volume`,
+        a long format data frame containing only volumes. Returns a
+        dictionary of arrays:
+
+        * `over`: True if the volume is measured over bark.
+        * `kind`: The position of the BCEF in `bcef_columns`, -1 if none.
+        * `bcef`: The BCEF value, NaN if none.
+        * `root_ratio`: The root to shoot ratio.
+        """
+        # Join the coefficients #
+        coefs = self.lookup(volume)
+        # The BCEF of each row depends on its variable #
+        kind = volume['variable'].map(self.bcef_of_variable)
+        kind = kind.map({c: i for i, c in enumerate(self.bcef_columns)})
+        kind = kind.fillna(-1).to_numpy(dtype=int)
+        rows = numpy.flatnonzero(kind >= 0)
+        bcef = numpy.full(len(volume), numpy.nan)
+        bcef[rows] = coefs[self.bcef_columns].to_numpy()[rows, kind[rows]]
+        # Return #
+        return {'over':       volume['unit'].map(self.volume_units).to_numpy(dtype=bool),
+                'kind':       kind,
+                'bcef':       bcef,
+                'root_ratio': coefs['root_ratio'].to_numpy()}
+
+    def convert(self, df):
+        """
+        Return a copy of the long format data frame `df` where every value
+        in a volume unit is converted to tons of carbon.
+        """
+        # Copy, the units will change #
+        result = df.astype({'unit': object})
+        # Only the volumes are converted #
+        is_volume = self.is_volume(df)
+        volume    = df[is_volume]
+        chain     = self.chain(volume)
+        # Under bark volumes are brought over bark #
+        bark = numpy.where(chain['over'], 1.0, 1.0 / self.bark_correction_factor)
+        # The whole chain #
+        roots  = 1.0 + chain['root_ratio']
+        factor = bark * chain['bcef'] * roots * self.carbon_fraction
+        # Apply #
+        result.loc[is_volume, 'value'] = volume['value'].to_numpy() * factor
+        result.loc[is_volume, 'unit']  = self.carbon_unit
+        # Return #
+        return result
+
+###############################################################################
+# Create a singleton #
+carbon_converter = CarbonConverter()
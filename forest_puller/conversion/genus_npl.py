@@ -12,6 +12,10 @@ Typically you can use this class like this:
     >>> from forest_puller.conversion.genus_npl import genus_parser
     >>> print(genus_parser.known_species)
     >>> genus_parser.test()
+
+To parse many names at once:
+
+    >>> print(genus_parser.parse_many(['Pinus silvestris', 'Fagus sylvatica']))
 """
 
 # Built-in modules #
@@ -22,6 +26,7 @@ Typically you can use this class like this:
 from plumbing.cache import property_cached
 
 # Third party modules #
+import numpy, pandas
 
 ###############################################################################
 class GenusParser:
@@ -33,6 +38,11 @@ class GenusParser:
      "Subtype 5 Carpinus (over bark)"    -->      ('carpinus', 'missing')
 
     Note: non-recognized words are obviously ignored.
+
+    The reference list is indexed once: the set of genera and the set of
+    species of each genus. A name is split into lower case words and the
+    genus is the first word that is a known genus. The species is then the
+    first word that is a known species of that genus.
     """
 
     #----------------------------- Data sources ------------------------------#
@@ -49,6 +59,25 @@ class GenusParser:
         # Return #
         return df
 
+    @property_cached
+    def genera(self):
+        """The set of all known genera. The word 'missing' is not one."""
+        return set(self.known_species['genus']) - {'missing'}
+
+    @property_cached
+    def species_by_genus(self):
+        """A dictionary of genus to the set of its known species."""
+        df = self.known_species
+        return {genus: set(group['species']) - {'missing'}
+                for genus, group in df.groupby('genus')}
+
+    @property_cached
+    def genus_species_pairs(self):
+        """Every known pair of genus and species as an index."""
+        pairs = [(genus, species) for genus, all_species in self.species_by_genus.items()
+                 for species in all_species]
+        return pandas.MultiIndex.from_tuples(pairs, names=['genus', 'species'])
+
     #------------------------------ Processing -------------------------------#
     def latin_to_genus_species(self, latin_name):
         """
@@ -81,33 +110,48 @@ class GenusParser:
         salix      |          |       |       ||
         tilia      |          |       |       ||
         """
-        # Default #
-        genus_name   = 'missing'
-        species_name = 'missing'
-        # Lower case the input #
-        latin_name  = latin_name.lower()
-        # Split into words #
-        words = latin_name.split()
-        # Get all possible genera #
-        genera = self.known_species['genus'].unique().tolist()
-        # Compare against all possible genera, take first match #
-        for word in words:
-            if genus_name != 'missing': break
-            for genus in genera:
-                if genus_name != 'missing': break
-                if word == genus: genus_name = genus
-        # Get all possible species #
-        all_species = self.known_species.query("genus==@genus_name")
-        all_species = all_species['species'].unique().tolist()
-        # Compare against all possible species, take first match #
-        for word in words:
-            if species_name != 'missing': break
-            for species in all_species:
-                if species_name != 'missing': break
-                if word == species: species_name = species
+        # Lower case the input and split into words #
+        words = latin_name.lower().split()
+        # Take the first word that is a genus #
+        genus_name = next((w for w in words if w in self.genera), 'missing')
+        # Take the first word that is a species of that genus #
+        all_species  = self.species_by_genus.get(genus_name, ())
+        species_name = next((w for w in words if w in all_species), 'missing')
         # Return #
         return genus_name, species_name
 
+    def parse_many(self, latin_names):
+        """
+        Same as `latin_to_genus_species` but for a whole series of names at
+        once. Every distinct name is only parsed once and all the words of
+        all the names are matched against the index together.
+        Returns a data frame with the same index as `latin_names` if it is
+        a series, and with the columns:
+
+            ['latin_name', 'genus', 'species']
+        """
+        # Every distinct name, missing names are given the code -1 #
+        names = pandas.Series(latin_names)
+        codes, uniques = pandas.factorize(names)
+        # One row per word, indexed by the number of the name #
+        words = pandas.Series(uniques, dtype=object).str.lower().str.split()
+        words = words.explode().dropna()
+        # The first word of each name that is a genus #
+        genus = words[words.isin(self.genera)].groupby(level=0).first()
+        genus = genus.reindex(range(len(uniques)), fill_value='missing')
+        # The first word of each name that is a species of that genus #
+        pairs   = pandas.MultiIndex.from_arrays([genus[words.index].to_numpy(), words.to_numpy()])
+        species = words[pairs.isin(self.genus_species_pairs)].groupby(level=0).first()
+        species = species.reindex(range(len(uniques)), fill_value='missing')
+        # Back to one row per name, the code -1 picks the 'missing' added last #
+        genus   = numpy.append(genus.to_numpy(dtype=object),   'missing')[codes]
+        species = numpy.append(species.to_numpy(dtype=object), 'missing')[codes]
+        # Return #
+        return pandas.DataFrame({'latin_name': names,
+                                 'genus':      genus,
+                                 'species':    species},
+                                index = names.index)
+
     #------------------------------ Testing ----------------------------------#
     test_cases = [
         'Pinus silvestris',
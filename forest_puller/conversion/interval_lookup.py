@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+Typically you can use this class like this:
+
+    >>> from forest_puller.conversion.load_expansion_factor import bcef_lookup
+    >>> print(bcef_lookup.resolve(df, 'stock_per_ha', ['bcefs']))
+"""
+
+# Built-in modules #
+
+# Internal modules #
+
+# First party modules #
+
+# Third party modules #
+import numpy, pandas
+
+###############################################################################
+class IntervalLookup:
+    """
+    Picks coefficients from a table where each line applies to one stratum
+    (e.g. a climatic zone and a forest type) and to one interval of a
+    continuous variable (e.g. the stock per hectare), such as:
+
+            climatic_zone forest_type  lower  upper  bcefi  bcefr  bcefs
+        0          boreal         con    0.0   20.0  0.550   1.29   1.16
+        1          boreal         con   21.0   50.0  0.470   0.73   0.66
+
+    A line matches a value `x` when `lower < x <= upper`. The table is
+    indexed once: for every stratum, the bounds are kept in sorted arrays,
+    so that the coefficients of a whole column of values are found with a
+    single binary search per stratum instead of one query per row.
+
+    Values that are NaN, that belong to a stratum that is not in the table
+    or that fall in between two intervals get NaN coefficients.
+    """
+
+    def __init__(self, coefs, keys=('climatic_zone', 'forest_type'),
+                 lower='lower', upper='upper'):
+        # The columns that define a stratum #
+        self.keys = list(keys)
+        # The columns that contain coefficients #
+        bounds = [lower, upper]
+        self.columns = [c for c in coefs.columns if c not in self.keys + bounds]
+        # Sort the intervals of every stratum #
+        self.strata = {}
+        for key, group in coefs.groupby(self.keys, sort=False):
+            group = group.sort_values(upper)
+            self.strata[key] = (group[lower].to_numpy(float),
+                                group[upper].to_numpy(float),
+                                group[self.columns].to_numpy(float))
+
+    def __repr__(self):
+        return '%s object with %i strata' % (self.__class__, len(self.strata))
+
+    def resolve(self, df, x, columns=None):
+        """
+        For every row of `df`, find the coefficients in `columns` (by default
+        all of them) that match the stratum of the row and the value of its
+        column `x`. Returns a data frame with the same index as `df`.
+        """
+        # Which coefficients #
+        if columns is None: columns = self.columns
+        picked = [self.columns.index(c) for c in columns]
+        # Start with missing values #
+        result = numpy.full((len(df), len(columns)), numpy.nan)
+        values = df[x].to_numpy(float)
+        # One binary search per stratum #
+        groups = df.groupby(self.keys, sort=False, observed=True).indices
+        for key, rows in groups.items():
+            if key not in self.strata: continue
+            lower, upper, coefs = self.strata[key]
+            # The first interval whose upper bound is not below the value #
+            found = numpy.searchsorted(upper, values[rows], side='left')
+            index = numpy.minimum(found, len(upper) - 1)
+            # It must also be strictly above the lower bound #
+            match = (found < len(upper)) & (lower[index] < values[rows])
+            result[rows[match]] = coefs[index[match]][:, picked]
+        # Return #
+        return pandas.DataFrame(result, index=df.index, columns=list(columns))
@@ -11,12 +11,18 @@ Load this data as such:
 
     from forest_puller.conversion.load_expansion_factor import bcef_coefs
     from forest_puller.conversion.load_expansion_factor import root_coefs
+
+Or, to pick the coefficients matching many stock values at once:
+
+    from forest_puller.conversion.load_expansion_factor import bcef_lookup
+    from forest_puller.conversion.load_expansion_factor import root_lookup
 """
 
 # Built-in modules #
 
 # Internal modules #
 from forest_puller import module_dir
+from forest_puller.conversion.interval_lookup import IntervalLookup
 
 # First party modules #
 
@@ -116,3 +122,7 @@ def load_root_to_shoot_ratio():
 bcef_coefs = load_bcef()
 root_coefs = load_root_to_shoot_ratio()
 
+# Index them for lookups #
+bcef_lookup = IntervalLookup(bcef_coefs)
+root_lookup = IntervalLookup(root_coefs)
+
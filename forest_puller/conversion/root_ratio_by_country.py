@@ -15,17 +15,16 @@ Typically you can use this submodule like this:
 """
 
 # Built-in modules #
-import itertools
 
 # Internal modules #
-from forest_puller.conversion.load_expansion_factor import root_coefs
+from forest_puller.interpolation                    import interpolator
+from forest_puller.conversion.load_expansion_factor import root_lookup
 from forest_puller.conversion.bcef_by_country       import country_bcef
 
 # First party modules #
 from plumbing.cache import property_cached
 
 # Third party modules #
-import numpy, pandas
 
 ###############################################################################
 class CountryRootRatio:
@@ -46,28 +45,6 @@ class CountryRootRatio:
     min_year = 1990
     max_year = 2020
 
-    def get_one_root_coef(self, row):
-        """
-        Function to be applied to each row of the all_stock_abg_biomass
-        data frame.
-        """
-        # If we get a NaN we return a NaN #
-        if row['stock_per_ha'] != row['stock_per_ha']: return numpy.nan
-        # Load #
-        df = root_coefs
-        # Select corresponding climatic zone #
-        df = df.query(f"climatic_zone == '{row['climatic_zone']}'")
-        # Select corresponding fores type#
-        df = df.query(f"forest_type == '{row['forest_type']}'")
-        # Select corresponding bounds on stock per hectare #
-        df = df.query(f"lower < {row['stock_per_ha']} <= upper")
-        # Make sure we have note more than one line #
-        assert len(df) <= 1
-        # Extract single float #
-        result = df['ratio'].iloc[0]
-        # Return #
-        return result
-
     @property_cached
     def by_country_year(self):
         """
@@ -90,24 +67,24 @@ class CountryRootRatio:
         df = df.query("forest_type != 'mixed'")
         # Add country information #
         df = df.left_join(country_bcef.country_climates, on=['country'])
-        # Add the root to shoot ratio #
-        df['root_ratio'] = df.apply(self.get_one_root_coef, axis=1)
+        # Add the root to shoot ratio, chosen by climatic zone, forest type and stock #
+        df['root_ratio'] = root_lookup.resolve(df, 'stock_per_ha', ['ratio'])['ratio']
         # Multiply by the climatic coef #
         df['root_ratio'] *= df['climatic_coef']
         # Group and sum over the climatic zones #
         df = (df
-              .groupby(['country', 'year', 'forest_type'])
+              .groupby(['country', 'year', 'forest_type'], observed=True)
               .agg({'root_ratio': 'sum',
                     'area':       'first'}))
         # Get the ratio of conifers against broadleaved #
-        groups               = df.groupby(['country', 'year'])
+        groups               = df.groupby(['country', 'year'], observed=True)
         df['area_total']     = groups['area'].transform('sum')
         df['leaf_type_prop'] = df['area'] / df['area_total']
         # Multiply by the ratio of the given leaf type #
         df['root_ratio'] *= df['leaf_type_prop']
         # Group and sum the root ratio #
         df = (df
-              .groupby(['country', 'year'])
+              .groupby(['country', 'year'], observed=True)
               .agg({'root_ratio': 'sum'}))
         # Reset index #
         df = df.reset_index()
@@ -116,18 +93,15 @@ class CountryRootRatio:
 
     @property_cached
     def by_country_year_intrpld(self):
-        """Same as above but interpolate the ratio to get more years."""
-        # Create a small data frame with all country and years
-        countries = self.by_country_year['country'].drop_duplicates()
-        years       = range(self.min_year, self.max_year)
-        expand_grid = list(itertools.product(countries, years))
-        df          = pandas.DataFrame(expand_grid, columns=('country', 'year'))
-        # Join root ratio data #
-        df = df.left_join(self.by_country_year, on=['country', 'year'])
-        # Interpolate #
-        country_groups = df.groupby('country')
-        df['root_ratio'] = country_groups['root_ratio'].transform(pandas.DataFrame.interpolate,
-                                                                  limit_direction='both')
+        """
+        Same as above but interpolate the ratio to get more years.
+        The edges are held constant.
+        """
+        # Every year of the range #
+        years = range(self.min_year, self.max_year)
+        # Interpolate the ratio of all countries #
+        df = interpolator(self.by_country_year, years, policy='linear',
+                          columns=['root_ratio'])
         # Return #
         return df
 
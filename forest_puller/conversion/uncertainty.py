@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+Typically you can use this submodule like this:
+
+    >>> from forest_puller.viz.converted_to_tons import converted_tons_data
+    >>> print(converted_tons_data.uncertainty(n_draws=10000, bcef_spread=0.3,
+    ...                                       root_spread=0.3, bark_spread=0.05))
+
+Or, on any long format data frame accepted by `forest_puller.conversion.carbon`:
+
+    >>> from forest_puller.conversion.uncertainty import monte_carlo
+    >>> print(monte_carlo.quantiles(df, n_draws=10000, quantiles=(0.05, 0.5, 0.95),
+    ...                             bcef_spread=0.3, root_spread=0.3, bark_spread=0.05))
+"""
+
+# Built-in modules #
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Internal modules #
+from forest_puller.conversion.carbon import carbon_converter
+
+# First party modules #
+
+# Third party modules #
+import numpy, pandas
+
+###############################################################################
+class MonteCarlo:
+    """
+    Propagates the uncertainty of the conversion coefficients to the tons of
+    carbon computed by a `CarbonConverter`. Instead of the point estimates,
+    every coefficient is drawn `n_draws` times and the whole conversion
+    chain is evaluated on a matrix with one line per draw and one column
+    per row of the input. The result is a set of quantiles for every row.
+
+    The coefficients are drawn from triangular distributions whose mode is
+    the point estimate used by the converter:
+
+    * The carbon fraction ranges from 0.44 to 0.49 (IPCC 2006, table 4.3).
+    * The BCEFs and root to shoot ratios only have point values in our
+      mapping CSVs, the ranges of the IPCC tables 4.4 and 4.5 are not
+      transcribed. The caller must hence choose by how much they vary with
+      `bcef_spread` and `root_spread`, as a fraction of their value.
+    * The bark correction factor has no range either, it varies by
+      `bark_spread`, also chosen by the caller.
+
+    The factors that come from the IPCC tables are drawn once per draw and
+    per country (and per kind of BCEF), so that all years of a country
+    share the same error. The carbon fraction and bark correction factor
+    are drawn once per draw.
+
+    The columns of the matrix are processed by blocks. When the matrix is
+    large, the blocks are spread on a pool of processes.
+    """
+
+    # The carbon fraction as (lowest, mode, highest) #
+    carbon_fraction_range = (0.44, 0.47, 0.49)
+
+    # Variables that are sums of others and must be summed draw by draw #
+    sums = {'net_per_ha': ('gain_per_ha', 'loss_per_ha')}
+
+    # How many rows are processed together #
+    block_size = 512
+
+    # Above this number of matrix cells, we use several processes #
+    parallel_threshold = 2 * 10**7
+
+    def __init__(self, converter=carbon_converter):
+        # The point estimates come from this object #
+        self.converter = converter
+
+    def __repr__(self):
+        return '%s object' % self.__class__
+
+    #------------------------------- Drawing ---------------------------------#
+    def draw(self, n_draws, n_countries, bcef_spread, root_spread, bark_spread, seed=None):
+        """
+        Draw every coefficient. The spreads are the relative half widths of
+        the distributions, e.g. 0.3 for plus or minus 30%. Returns a
+        dictionary of multipliers and values as arrays with one line per draw.
+        """
+        # Check #
+        spreads = {'bcef_spread': bcef_spread, 'root_spread': root_spread, 'bark_spread': bark_spread}
+        for name, width in spreads.items():
+            if 0 < width < 1: continue
+            raise ValueError("The %s must be between 0 and 1, not %r." % (name, width))
+        # Generator #
+        rng = numpy.random.default_rng(seed)
+        # Multiplicative error centered on one #
+        def spread(width, size): return rng.triangular(1 - width, 1.0, 1 + width, size)
+        # Draw #
+        n_kinds = len(self.converter.bcef_columns)
+        bark    = self.converter.bark_correction_factor
+        return {'bcef':   spread(bcef_spread, (n_draws, n_countries, n_kinds)),
+                'root':   spread(root_spread, (n_draws, n_countries)),
+                'bark':   bark * spread(bark_spread, n_draws),
+                'carbon': rng.triangular(*self.carbon_fraction_range, n_draws)}
+
+    #------------------------------- Running ---------------------------------#
+    def quantiles(self, df, n_draws=10000, quantiles=(0.05, 0.5, 0.95),
+                  seed=None, processes=None, *, bcef_spread, root_spread, bark_spread):
+        """
+        Take a long format data frame `df` as accepted by
+        `CarbonConverter.convert` and return the same rows without the
+        `value` column but with one column per quantile, named for instance
+        `q0.05`. The three spreads have no default, see `draw`. The values that are not volumes are already in tons and
+        are repeated in every quantile column. The volumes get the unit
+        of the converter.
+
+        The variables listed in `sums` are computed draw by draw from the
+        rows that have the same value in all the other columns.
+        """
+        # Prepare the result #
+        names  = ['q%g' % q for q in quantiles]
+        result = df.drop(columns=['value']).astype({'unit': object})
+        for name in names: result[name] = df['value'].to_numpy(float)
+        # Only the volumes are converted #
+        is_volume = self.converter.is_volume(df)
+        volume    = df[is_volume].reset_index(drop=True)
+        if len(volume) == 0: return result
+        # Put the rows that must be summed together next to each other #
+        group_cols = [c for c in df.columns if c not in ('variable', 'value', 'unit')]
+        groups     = volume.groupby(group_cols, sort=False, observed=True, dropna=False).ngroup()
+        order      = numpy.argsort(groups.to_numpy(), kind='stable')
+        volume     = volume.iloc[order].reset_index(drop=True)
+        groups     = groups.to_numpy()[order]
+        # The coefficients of every row #
+        chain = self.converter.chain(volume)
+        codes, uniques = pandas.factorize(volume['country'].astype(str))
+        # Draw #
+        draws = self.draw(n_draws, len(uniques), bcef_spread, root_spread, bark_spread, seed)
+        # The position of the rows to sum #
+        summed = self.summed_rows(volume, groups)
+        # Cut the columns in blocks that don't split groups #
+        cuts   = numpy.arange(self.block_size, len(volume), self.block_size)
+        cuts   = numpy.unique(numpy.searchsorted(groups, groups[cuts], side='left'))
+        bounds = list(zip(numpy.concatenate(([0], cuts)), numpy.concatenate((cuts, [len(volume)]))))
+        # The tasks #
+        tasks = [{'value':      volume['value'].to_numpy(float)[a:b],
+                  'over':       chain['over'][a:b],
+                  'kind':       chain['kind'][a:b],
+                  'bcef':       chain['bcef'][a:b],
+                  'root_ratio': chain['root_ratio'][a:b],
+                  'country':    codes[a:b],
+                  'summed':     [(i - a, j - a, k - a) for i, j, k in summed if a <= i < b],
+                  'quantiles':  quantiles}
+                 for a, b in bounds]
+        # Default number of processes #
+        if processes is None:
+            large     = n_draws * len(volume) > self.parallel_threshold
+            processes = os.cpu_count() if large else 1
+        # Run #
+        if processes == 1:
+            blocks = [propagate(task, draws) for task in tasks]
+        else:
+            with ProcessPoolExecutor(processes, initializer=set_draws, initargs=(draws,)) as pool:
+                blocks = list(pool.map(propagate, tasks))
+        # Put the quantiles back in the original order #
+        values = numpy.concatenate(blocks, axis=1)
+        target = numpy.flatnonzero(is_volume)[order]
+        for name, line in zip(names, values): result.loc[result.index[target], name] = line
+        result.loc[is_volume, 'unit'] = self.converter.carbon_unit
+        # Return #
+        return result
+
+    def summed_rows(self, volume, groups):
+        """
+        A list of (sum, first, second) row positions, one for every row
+        of `volume` that is the sum of two other rows of the same group.
+        A missing term is given the position -1.
+        """
+        # Position of each variable in each group #
+        positions = pandas.DataFrame({'group':    groups,
+                                      'variable': volume['variable'].astype(str).to_numpy(),
+                                      'position': numpy.arange(len(volume))})
+        positions = positions.drop_duplicates(['group', 'variable'])
+        positions = positions.set_index(['group', 'variable'])['position']
+        # Look up the terms #
+        result = []
+        for total, (first, second) in self.sums.items():
+            rows = numpy.flatnonzero(volume['variable'].astype(str).to_numpy() == total)
+            for row in rows:
+                group = groups[row]
+                result.append((row,
+                               positions.get((group, first),  -1),
+                               positions.get((group, second), -1)))
+        # Return #
+        return result
+
+###############################################################################
+# The draws shared by the worker processes #
+shared_draws = None
+
+def set_draws(draws):
+    """Called once in every worker process."""
+    global shared_draws
+    shared_draws = draws
+
+def propagate(task, draws=None):
+    """
+    Evaluate the conversion chain for every draw and every row of one
+    block and return the quantiles as an array of shape (quantiles, rows).
+    """
+    # The draws are either given or shared #
+    if draws is None: draws = shared_draws
+    # The multipliers of each row #
+    kind   = numpy.maximum(task['kind'], 0)
+    bcef   = task['bcef']       * draws['bcef'][:, task['country'], kind]
+    root   = task['root_ratio'] * draws['root'][:, task['country']]
+    # Under bark volumes are brought over bark #
+    bark   = numpy.where(task['over'], 1.0, 1.0 / draws['bark'][:, None])
+    # The whole chain, one line per draw #
+    carbon = draws['carbon'][:, None]
+    tons   = task['value'] * bark * bcef * (1.0 + root) * carbon
+    # Sums are computed draw by draw #
+    for total, first, second in task['summed']:
+        if first < 0 or second < 0: tons[:, total] = numpy.nan
+        else: tons[:, total] = tons[:, first] + tons[:, second]
+    # Return #
+    return numpy.quantile(tons, task['quantiles'], axis=0)
+
+###############################################################################
+# Create a singleton #
+monte_carlo = MonteCarlo()
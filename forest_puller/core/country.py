@@ -16,7 +16,6 @@ Unit D1 Bioeconomy.
 from plumbing.cache import property_cached
 
 # Third party modules #
-import pandas
 
 ###############################################################################
 class Country:
@@ -58,23 +57,24 @@ class Country:
         from forest_puller.hpffre.country import countries
         return countries[self.iso2_code]
 
+    @property
+    def harmonized(self):
+        """Every variable of every source for this country, in long format."""
+        from forest_puller.harmonized import harmonized
+        return harmonized.select(country=self.iso2_code)
+
     #-------------------------------- Other ----------------------------------#
     @property_cached
     def min_year_area(self):
-        """This method is not finished."""
+        """
+        The first year for which any source reports the forest area of this
+        country. Returns `None` if no source does.
+        """
+        # Import #
+        from forest_puller.harmonized import harmonized
         # Load #
-        ipcc    = self.ipcc.copy()
-        soef    = self.soef.copy()
-        faostat = self.faostat.land.copy()
-        hpffre  = self.hpffre.copy()
-        # Add source #
-        ipcc.insert(0,    'source', 'ipcc')
-        soef.insert(0,    'source', 'soef')
-        faostat.insert(0, 'source', 'faostat')
-        hpffre.insert(0,  'source', 'hpffre')
-        # Combine #
-        df = pandas.concat((ipcc, soef, faostat, hpffre), ignore_index=True)
-        # Minimum #
-        start_year = min(df['year'])
+        df = harmonized.select(variable='forest_area', country=self.iso2_code)
+        # Empty #
+        if len(df) == 0: return None
         # Return #
-        return start_year
\ No newline at end of file
+        return int(df['year'].min())
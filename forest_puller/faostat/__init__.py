@@ -9,12 +9,93 @@ Unit D1 Bioeconomy.
 """
 
 # Built-in modules #
+import zipfile, io
 
 # Third party modules #
-import pandas
+import numpy, pandas
 
 # Internal modules #
-from forest_puller.common import country_codes
+from forest_puller.common import extra_data
+
+###############################################################################
+# The types of the columns found in the normalized bulk CSV files #
+csv_dtypes = {'Area Code':    'int32',
+              'Area':         'category',
+              'Item Code':    'int32',
+              'Item':         'category',
+              'Element Code': 'int32',
+              'Element':      'category',
+              'Year Code':    'int32',
+              'Year':         'int64',
+              'Unit':         'category',
+              'Value':        'float64',
+              'Flag':         'category'}
+
+# How many rows of the CSV are parsed at a time #
+chunk_size = 100000
+
+def read_faostat_csv(zip_path, csv_name, encoding,
+                     countries = None,
+                     items     = None,
+                     elements  = None):
+    """
+    Load the rows of a bulk CSV file inside a FAOSTAT zip archive that
+    concern the `countries` given by their long names (by default all the
+    countries in `country_codes.csv`) and optionally only some `items`
+    and `elements`.
+
+    Instead of loading the whole global table into memory, the file is
+    parsed chunk by chunk and every chunk is filtered immediately. Hence,
+    the memory used only depends on the size of the filtered result.
+    The text columns stay categorical, with the categories of all chunks.
+    """
+    # Default countries #
+    if countries is None: countries = extra_data.country_codes['country']
+    # The predicates on each column #
+    predicates = {'Area': countries, 'Item': items, 'Element': elements}
+    predicates = {k: set(v) for k, v in predicates.items() if v is not None}
+    # Load the archive #
+    zip_archive = zipfile.ZipFile(str(zip_path))
+    # Parse the CSV #
+    chunks = []
+    with zip_archive.open(csv_name) as csv_handle:
+        text_mode = io.TextIOWrapper(csv_handle, encoding=encoding)
+        reader    = pandas.read_csv(text_mode, dtype=csv_dtypes, chunksize=chunk_size)
+        for chunk in reader:
+            # Filter the rows #
+            for column, values in predicates.items():
+                chunk = chunk[chunk[column].isin(values)]
+            # Forget the categories of the rows filtered out #
+            for column in chunk.select_dtypes('category').columns:
+                chunk[column] = chunk[column].cat.remove_unused_categories()
+            chunks.append(chunk)
+    # The categories of each chunk are different, use their union #
+    for column in chunks[0].select_dtypes('category').columns:
+        union = set().union(*(chunk[column].cat.categories for chunk in chunks))
+        dtype = pandas.CategoricalDtype(sorted(union))
+        for chunk in chunks: chunk[column] = chunk[column].astype(dtype)
+    # Combine #
+    df = pandas.concat(chunks, ignore_index=True)
+    # Return #
+    return df
+
+def rename_labels(values, mapping):
+    """
+    Rename some labels of a categorical series using the `mapping`
+    dictionary, several labels can be given the same new name. Only the
+    categories are renamed, hence the result stays categorical.
+    """
+    # The new name of every category #
+    names      = pandas.Index([mapping.get(c, c) for c in values.cat.categories])
+    categories = names.unique()
+    # Point the rows to the new categories, missing values stay missing #
+    lookup = categories.get_indexer(names)
+    codes  = values.cat.codes.to_numpy()
+    codes  = numpy.where(codes < 0, -1, lookup[codes])
+    # Return #
+    return pandas.Series(pandas.Categorical.from_codes(codes, categories),
+                         index = values.index,
+                         name  = values.name)
 
 ###############################################################################
 def fix_faostat_tables(df):
@@ -36,15 +117,17 @@ def fix_faostat_tables(df):
                          'Year':         'year',
                          'Value':        'value',
                          'Flag':         'flag'})
+    # Load #
+    country_codes = extra_data.country_codes
     # Remove countries we are not interested in #
     selector = df['country'].isin(country_codes['country'])
     df       = df[selector]
     # Use country short codes instead of long names #
     name_to_iso_code = dict(zip(country_codes['country'], country_codes['iso2_code']))
-    df['country'] = df['country'].replace(name_to_iso_code)
+    df['country'] = rename_labels(df['country'], name_to_iso_code)
     # We will multiply the USD value by 1000 and drop the 1000 from "unit" #
     selector = df['unit'] == '1000 US$'
-    df.loc[selector, 'unit']   = 'usd'
     df.loc[selector, 'value'] *= 1000
+    df['unit'] = rename_labels(df['unit'], {'1000 US$': 'usd'})
     # Return #
     return df
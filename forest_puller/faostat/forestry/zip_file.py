@@ -24,19 +24,17 @@ To see the large data frame you can do:
 """
 
 # Built-in modules #
-import zipfile, io
 
 # Internal modules #
-from forest_puller import cache_dir
-from forest_puller.faostat import fix_faostat_tables
-from forest_puller.common import country_codes
+import forest_puller
+from forest_puller.faostat import fix_faostat_tables, read_faostat_csv, rename_labels
+from forest_puller.common import lazy_attributes, Partition
 
 # First party modules #
 from plumbing.cache import property_cached
 from plumbing.scraping import download_from_url
 
 # Third party modules #
-import pandas
 
 ###############################################################################
 class ZipFile:
@@ -80,17 +78,20 @@ class ZipFile:
                           uncompress = False)
 
     # ---------------------------- Properties --------------------------------#
+    @property
+    def items(self):
+        """We only need the products that the country objects use."""
+        from forest_puller.faostat.forestry.country import Country
+        return Country.products
+
     @property_cached
     def raw_csv(self):
-        """Loads the big CSV that's inside the ZIP into memory."""
-        # Load the archive #
-        zip_archive = zipfile.ZipFile(self.zip_path)
-        # Load the CSV #
-        with zip_archive.open(self.csv_name) as csv_handle:
-            text_mode = io.TextIOWrapper(csv_handle, encoding=self.encoding)
-            df = pandas.read_csv(text_mode)
-        # Return #
-        return df
+        """
+        Loads the rows of the big CSV that's inside the ZIP and that concern
+        our countries and items into memory.
+        """
+        return read_faostat_csv(self.zip_path, self.csv_name, self.encoding,
+                                items = self.items)
 
     @property_cached
     def df(self):
@@ -99,11 +100,20 @@ class ZipFile:
         df = fix_faostat_tables(self.raw_csv)
         # Fix the units (dollars) #
         selector = df['unit']     == '1000 US$'
-        df.loc[selector, 'unit']   = 'usd'
         df.loc[selector, 'value'] *= 1000
+        df['unit'] = rename_labels(df['unit'], {'1000 US$': 'usd'})
         # Return #
         return df
 
+    @property_cached
+    def by_country(self):
+        """The rows of `self.df` split by country in a single pass."""
+        return Partition(self.df)
+
 ###############################################################################
-# Create a singleton #
-zip_file = ZipFile(cache_dir + 'faostat/zips/')
\ No newline at end of file
+def create_singleton():
+    """Create the singleton."""
+    return {'zip_file': ZipFile(forest_puller.cache_dir + 'faostat/zips/')}
+
+# It is only created when first accessed #
+__getattr__ = lazy_attributes(__name__, ('zip_file',), create_singleton)
\ No newline at end of file
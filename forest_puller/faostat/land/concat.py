@@ -6,18 +6,40 @@ Written by Lucas Sinclair and Paul Rougieux.
 
 JRC Biomass Project.
 Unit D1 Bioeconomy.
+
+Typically you can use this submodule like this:
+
+    >>> import forest_puller.faostat.land.concat
+    >>> print(forest_puller.faostat.land.concat.df)
+
+Or, to load only some countries and some years:
+
+    >>> from forest_puller.faostat.land.concat import concat
+    >>> print(concat.select(countries=['AT', 'BE'], years=range(1990, 2000)))
 """
 
 # Built-in modules #
 
 # Internal modules #
-from forest_puller.faostat.land.country import all_countries
+from forest_puller.common import Concat
 
 # First party modules #
 
 # Third party modules #
-import pandas
 
-##############################################################################
-every_country = (c.country_cols for c in all_countries)
-df = pandas.concat(every_country, ignore_index=True)
+###############################################################################
+class LandConcat(Concat):
+
+    @property
+    def countries(self):
+        from forest_puller.faostat.land.country import countries
+        return countries
+
+###############################################################################
+# Create a singleton #
+concat = LandConcat()
+
+def __getattr__(name):
+    """The full data frame is only built when first accessed."""
+    if name == 'df': return concat.df
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
@@ -24,19 +24,17 @@ To see the large data frame you can do:
 """
 
 # Built-in modules #
-import zipfile, io
 
 # Internal modules #
-from forest_puller import cache_dir
-from forest_puller.faostat import fix_faostat_tables
-from forest_puller.common import country_codes
+import forest_puller
+from forest_puller.faostat import fix_faostat_tables, read_faostat_csv, rename_labels
+from forest_puller.common import lazy_attributes, Partition
 
 # First party modules #
 from plumbing.cache import property_cached
 from plumbing.scraping import download_from_url
 
 # Third party modules #
-import pandas
 
 ###############################################################################
 class ZipFile:
@@ -60,6 +58,9 @@ class ZipFile:
     encoding = "ISO-8859-1"
     title    = "Forest Land"
 
+    # We need every item of the file #
+    items = None
+
     def __init__(self, zip_cache_dir):
         # Record where the cache will be located on disk #
         self.cache_dir = zip_cache_dir
@@ -82,15 +83,12 @@ class ZipFile:
     # ---------------------------- Properties --------------------------------#
     @property_cached
     def raw_csv(self):
-        """Loads the big CSV that's inside the ZIP into memory."""
-        # Load the archive #
-        zip_archive = zipfile.ZipFile(self.zip_path)
-        # Load the CSV #
-        with zip_archive.open(self.csv_name) as csv_handle:
-            text_mode = io.TextIOWrapper(csv_handle, encoding=self.encoding)
-            df = pandas.read_csv(text_mode)
-        # Return #
-        return df
+        """
+        Loads the rows of the big CSV that's inside the ZIP and that concern
+        our countries and items into memory.
+        """
+        return read_faostat_csv(self.zip_path, self.csv_name, self.encoding,
+                                items = self.items)
 
     @property_cached
     def df(self):
@@ -99,15 +97,24 @@ class ZipFile:
         df = fix_faostat_tables(self.raw_csv)
         # Fix the units (hectares) #
         selector = df['unit']     == '1000 ha'
-        df.loc[selector, 'unit']   = 'hectares'
         df.loc[selector, 'value'] *= 1000
         # Fix the units (gigagrams) #
         selector = df['unit']     == 'gigagrams'
-        df.loc[selector, 'unit']   = 'kg'
         df.loc[selector, 'value'] *= 1000000
+        # Rename the units #
+        df['unit'] = rename_labels(df['unit'], {'1000 ha': 'hectares', 'gigagrams': 'kg'})
         # Return #
         return df
 
+    @property_cached
+    def by_country(self):
+        """The rows of `self.df` split by country in a single pass."""
+        return Partition(self.df)
+
 ###############################################################################
-# Create a singleton #
-zip_file = ZipFile(cache_dir + 'faostat/zips/')
\ No newline at end of file
+def create_singleton():
+    """Create the singleton."""
+    return {'zip_file': ZipFile(forest_puller.cache_dir + 'faostat/zips/')}
+
+# It is only created when first accessed #
+__getattr__ = lazy_attributes(__name__, ('zip_file',), create_singleton)
\ No newline at end of file
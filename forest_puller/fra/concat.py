@@ -11,15 +11,20 @@ Typically you can use this submodule like this:
 
     >>> import forest_puller.fra.concat
     >>> print(forest_puller.fra.concat.df)
+
+Or, to load only some countries and some years:
+
+    >>> from forest_puller.fra.concat import concat
+    >>> print(concat.select(countries=['AT', 'BE'], years=range(1990, 2000)))
 """
 
 # Built-in modules #
 
 # Internal modules #
-from forest_puller.fra.country import all_countries
-from forest_puller.fra import csv_file
+from forest_puller.common import Concat, Partition
 
 # First party modules #
+from plumbing.cache import property_cached
 
 # Third party modules #
 import pandas
@@ -35,10 +40,33 @@ datasets = [
 ]
 
 ##############################################################################
-all_raw = [getattr(csv_file, s).df for s in datasets]
-all_raw = pandas.concat(all_raw)
-all_raw = all_raw.reset_index(drop=True)
+class FRAConcat(Concat):
 
-##############################################################################
-every_country = (c.country_cols for c in all_countries)
-df = pandas.concat(every_country, ignore_index=True)
+    @property
+    def countries(self):
+        from forest_puller.fra.country import countries
+        return countries
+
+    @property_cached
+    def all_raw(self):
+        """Concatenate every FRA dataset containing all countries."""
+        from forest_puller.fra import csv_file
+        all_raw = [getattr(csv_file, s).df for s in datasets]
+        all_raw = pandas.concat(all_raw)
+        all_raw = all_raw.reset_index(drop=True)
+        return all_raw
+
+    @property_cached
+    def by_country(self):
+        """The rows of `self.all_raw` split by country in a single pass."""
+        return Partition(self.all_raw)
+
+###############################################################################
+# Create a singleton #
+concat = FRAConcat()
+
+def __getattr__(name):
+    """The large data frames are only built when first accessed."""
+    if name == 'all_raw': return concat.all_raw
+    if name == 'df':      return concat.df
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
@@ -16,11 +16,11 @@ Typically you can use this class like this:
 # Built-in modules #
 
 # Internal modules #
-from forest_puller        import cache_dir
-from forest_puller.common import country_codes
+import forest_puller
+from forest_puller.common import extra_data, lazy_attributes
+from forest_puller.store import property_stored_at
 
 # First party modules #
-from plumbing.cache import property_pickled_at
 
 # Third party modules #
 
@@ -35,18 +35,13 @@ class Country:
     def __repr__(self):
         return '%s object code "%s"' % (self.__class__, self.iso2_code)
 
-    @property_pickled_at('df_cache_path')
+    @property_stored_at('df_cache_path', inputs='df_inputs', version=1)
     def df(self):
         """Return rows that concern this country in all datasets."""
         # Load #
-        from forest_puller.fra.concat import all_raw
+        from forest_puller.fra.concat import concat
         # Select rows for country #
-        selector = all_raw['country'] == self.iso2_code
-        df       = all_raw[selector]
-        # We don't need the country column anymore #
-        df = df.drop(columns=['country'])
-        # We don't need the old index anymore #
-        df = df.reset_index(drop=True)
+        df = concat.by_country[self.iso2_code]
         # Return #
         return df
 
@@ -61,10 +56,18 @@ class Country:
         return df
 
     #--------------------------------- Cache ---------------------------------#
+    @property
+    def df_inputs(self):
+        """The files that `self.df` is computed from."""
+        from forest_puller.fra import csv_file
+        from forest_puller.fra.concat import datasets
+        return [getattr(csv_file, s).csv_path for s in datasets] + \
+               [extra_data.path('country_codes')]
+
     @property
     def df_cache_path(self):
         """Specify where on the file system we will pickle the df property."""
-        return cache_dir + 'fra/df/' + self.iso2_code + '.pickle'
+        return forest_puller.cache_dir + 'fra/df/' + self.iso2_code + '.pickle'
 
     #----------------------------- Common years ------------------------------#
     @property
@@ -84,6 +87,11 @@ class Country:
         return years
 
 ###############################################################################
-# Create every country object #
-all_countries = [Country(iso2) for iso2 in country_codes['iso2_code']]
-countries     = {c.iso2_code: c for c in all_countries}
+def create_countries():
+    """Create every country object."""
+    all_countries = [Country(iso2) for iso2 in extra_data.country_codes['iso2_code']]
+    countries     = {c.iso2_code: c for c in all_countries}
+    return {'all_countries': all_countries, 'countries': countries}
+
+# They are only created when first accessed #
+__getattr__ = lazy_attributes(__name__, ('all_countries', 'countries'), create_countries)
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+Every data source comes with its own layout: IPCC has one column per
+variable, SOEF has one table per topic, FAOSTAT and FRA have one row per item
+and element. This module puts the variables we compare between sources in a
+single long format data frame with the columns:
+
+    ['source', 'country', 'year', 'variable', 'unit', 'value']
+
+Typically you can use this submodule like this:
+
+    >>> from forest_puller.harmonized import harmonized
+    >>> print(harmonized.select(variable='forest_area', country='AT'))
+
+Or, for several values at once:
+
+    >>> print(harmonized.select(variable='forest_area', source=['ipcc', 'soef']))
+
+The variables available are:
+
+* `forest_area` in hectares, from all five sources.
+* `gain_per_ha`, `loss_per_ha` and `net_per_ha` from all sources but FRA,
+  as computed by `forest_puller.viz.increments_df`, in the unit of the source.
+"""
+
+# Built-in modules #
+
+# Internal modules #
+
+# First party modules #
+from plumbing.cache import property_cached
+
+# Third party modules #
+import pandas
+
+###############################################################################
+class HarmonizedStore:
+    """
+    The data frame is built once, sorted on `order` and indexed on the same
+    columns. A selection on the first columns of `order` is therefore a
+    contiguous slice found by binary search, and a selection on the other
+    columns only searches inside that slice.
+    """
+
+    # The columns that identify a value #
+    key = ['source', 'country', 'year', 'variable', 'unit']
+
+    # The order of the rows, most selective first #
+    order = ['variable', 'country', 'source', 'year', 'unit']
+
+    # The sources included #
+    sources = ['ipcc', 'soef', 'faostat', 'fra', 'hpffre']
+
+    # The units of the FAOSTAT areas we accept, the zip file already
+    # converts '1000 ha' to 'hectares' #
+    area_ratios = {'hectares': 1.0, 'ha': 1.0}
+
+    # The variables of the increments data frame #
+    increment_variables = ['gain_per_ha', 'loss_per_ha', 'net_per_ha']
+
+    def __repr__(self):
+        return '%s object' % self.__class__
+
+    #----------------------------- Data sources ------------------------------#
+    @staticmethod
+    def forest_area(df, source, column='area'):
+        """Format a data frame of areas in hectares."""
+        return pandas.DataFrame({'source':   source,
+                                 'country':  df['country'].astype(str).to_numpy(),
+                                 'year':     df['year'].to_numpy(),
+                                 'variable': 'forest_area',
+                                 'unit':     'ha',
+                                 'value':    df[column].to_numpy(float)})
+
+    @property_cached
+    def ipcc(self):
+        # Import #
+        from forest_puller.ipcc.concat import concat
+        # Load #
+        df = concat.select(columns=['country', 'year', 'land_use', 'area'])
+        # Filter #
+        df = df[df['land_use'] == 'total_forest']
+        # Return #
+        return self.forest_area(df, 'ipcc')
+
+    @property_cached
+    def soef(self):
+        # Import #
+        import forest_puller.soef.concat
+        # Load #
+        df = forest_puller.soef.concat.tables['forest_area']
+        # Filter #
+        df = df[df['category'] == 'forest']
+        # Return #
+        return self.forest_area(df, 'soef')
+
+    @property_cached
+    def faostat(self):
+        # Import #
+        import forest_puller.faostat.land.concat
+        # Load #
+        df = forest_puller.faostat.land.concat.df
+        # Filter #
+        df = df[(df['element'] == 'Area') & (df['item'] == 'Forest land') & (df['flag'] == 'A')]
+        # Return #
+        return self.faostat_area(df)
+
+    def faostat_area(self, df):
+        """
+        Format the forest area rows of the FAOSTAT land data frame. An
+        unknown unit raises an error instead of losing the rows.
+        """
+        # Check the units #
+        units   = df['unit'].astype(str)
+        unknown = sorted(set(units) - set(self.area_ratios))
+        if unknown: raise ValueError("Unknown FAOSTAT area units %s." % unknown)
+        # Convert to hectares #
+        ratio = units.map(self.area_ratios).to_numpy(float)
+        df    = df.assign(area = df['value'].to_numpy(float) * ratio)
+        # Return #
+        return self.forest_area(df, 'faostat')
+
+    @property_cached
+    def fra(self):
+        # Import #
+        import forest_puller.fra.concat
+        # Load #
+        df = forest_puller.fra.concat.df
+        # Filter #
+        df = df[df['category'] == 'Forest']
+        # Return #
+        return self.forest_area(df, 'fra', 'value')
+
+    @property_cached
+    def hpffre(self):
+        # Import #
+        import forest_puller.hpffre.concat
+        # Load #
+        df = forest_puller.hpffre.concat.df
+        # Filter for only the first scenario #
+        df = df[df['scenario'] == 1]
+        # Sum all the different categories #
+        df = df.groupby(['country', 'year'], observed=True)['area'].sum().reset_index()
+        # Return #
+        return self.forest_area(df, 'hpffre')
+
+    @property_cached
+    def increments(self):
+        """The gains, losses and net per hectare of every source."""
+        # Import #
+        from forest_puller.viz.increments_df import increments_data
+        # Unpivot #
+        df = increments_data.df.melt(id_vars    = ['source', 'unit', 'country', 'year'],
+                                     value_vars = self.increment_variables,
+                                     var_name   = 'variable',
+                                     value_name = 'value')
+        # Same source names as the areas #
+        df['source'] = df['source'].astype(str).replace({'fao': 'faostat'})
+        # Return #
+        return df
+
+    #------------------------------- Combine ---------------------------------#
+    @property_cached
+    def df(self):
+        """
+        Every source in long format, sorted and indexed on `order`.
+        Rows without a value are dropped.
+        """
+        # Import #
+        from forest_puller.schema import schema
+        # Combine #
+        frames = [getattr(self, source) for source in self.sources] + [self.increments]
+        frames = [frame[self.key + ['value']].astype({'country': object,
+                                                       'unit':    object})
+                  for frame in frames]
+        df = pandas.concat(frames, ignore_index=True)
+        df = df.dropna(subset=['value'])
+        df['value'] = df['value'].astype(float)
+        # Use categoricals and compact years #
+        df = schema.apply(df)
+        # Sort and index #
+        df = df.sort_values(self.order, kind='stable')
+        df = df.set_index(self.order)
+        # Return #
+        return df
+
+    #------------------------------- Methods ---------------------------------#
+    def select(self, **criteria):
+        """
+        Return the rows matching every one of the `criteria`, given as
+        column names with one value or a list of values, e.g.
+        `select(variable='forest_area', country=['AT', 'BE'])`.
+        """
+        # Check #
+        unknown = set(criteria) - set(self.key)
+        if unknown: raise ValueError("Unknown columns %s, choose among %s." % (sorted(unknown), self.key))
+        # One entry per level of the index #
+        index = self.df.index
+        keys  = []
+        for level, column in enumerate(self.order):
+            values = criteria.get(column)
+            if values is None: keys.append(slice(None)); continue
+            if isinstance(values, (str, int)): values = [values]
+            # Values that are not in the index match nothing #
+            values = [v for v in values if v in index.levels[level]]
+            if not values: return self.empty
+            keys.append(values)
+        # Binary search, no match at all raises an error #
+        try: rows = index.get_locs(keys)
+        except KeyError: return self.empty
+        # Return #
+        return self.df.iloc[rows].reset_index()[self.key + ['value']]
+
+    @property
+    def empty(self):
+        """A selection that matches nothing."""
+        return self.df.iloc[:0].reset_index()[self.key + ['value']]
+
+###############################################################################
+# Create a singleton #
+harmonized = HarmonizedStore()
@@ -16,20 +16,14 @@ Typically you can use this class like this:
 # Built-in modules #
 
 # Internal modules #
-from forest_puller import cache_dir, module_dir
-from forest_puller.hpffre.zip_file import zip_file
+import forest_puller
 from forest_puller.common import convert_units
-from forest_puller.common import country_codes
+from forest_puller.common import extra_data, lazy_attributes
+from forest_puller.store import property_stored_at
 
 # First party modules #
-from plumbing.cache import property_pickled_at
 
 # Third party modules #
-import pandas
-
-# Load column name mapping to short names #
-col_name_map = module_dir + 'extra_data/hpffre_columns.csv'
-col_name_map = pandas.read_csv(str(col_name_map))
 
 ###############################################################################
 class Country:
@@ -51,20 +45,15 @@ class Country:
     def __repr__(self):
         return '%s object code "%s"' % (self.__class__, self.iso2_code)
 
-    @property_pickled_at('df_cache_path')
+    @property_stored_at('df_cache_path', inputs='df_inputs', version=1)
     def df(self):
         """Return rows that concern this country."""
-        # Load #
-        df = zip_file.df
+        # Import #
+        from forest_puller.hpffre.zip_file import zip_file
         # Select rows for country #
-        selector = df['country'] == self.iso2_code
-        df       = df[selector]
-        # We don't need the country column anymore #
-        df = df.drop(columns=['country'])
-        # We don't need the old index anymore #
-        df = df.reset_index(drop=True)
+        df = zip_file.by_country[self.iso2_code]
         # Convert the units using col_name_map #
-        df = convert_units(df, col_name_map)
+        df = convert_units(df, extra_data.hpffre_columns)
         # Return #
         return df
 
@@ -79,14 +68,33 @@ class Country:
         return df
 
     #--------------------------------- Cache ---------------------------------#
+    @property
+    def df_inputs(self):
+        """The files that `self.df` is computed from."""
+        from forest_puller.hpffre.zip_file import zip_file
+        return [zip_file.zip_path,
+                extra_data.path('hpffre_columns'),
+                extra_data.path('country_codes')]
+
     @property
     def df_cache_path(self):
         """Specify where on the file system we will pickle the df property."""
-        return cache_dir + 'hpffre/df/' + self.iso2_code + '.pickle'
+        return forest_puller.cache_dir + 'hpffre/df/' + self.iso2_code + '.pickle'
 
 ###############################################################################
-# Create every country object #
-missing       = ['BG', 'LU', 'HR', 'GR', 'PL', 'NL']
-all_codes     = [iso2 for iso2 in country_codes['iso2_code'] if iso2 not in missing]
-all_countries = [Country(iso2) for iso2 in all_codes]
-countries     = {c.iso2_code: c for c in all_countries}
+# These countries are not present in the dataset #
+missing = ['BG', 'LU', 'HR', 'GR', 'PL', 'NL']
+
+def create_countries():
+    """Create every country object."""
+    all_codes     = [iso2 for iso2 in extra_data.country_codes['iso2_code']
+                     if iso2 not in missing]
+    all_countries = [Country(iso2) for iso2 in all_codes]
+    countries     = {c.iso2_code: c for c in all_countries}
+    return {'all_codes':     all_codes,
+            'all_countries': all_countries,
+            'countries':     countries}
+
+# They are only created when first accessed #
+__getattr__ = lazy_attributes(__name__, ('all_codes', 'all_countries', 'countries'),
+                              create_countries)
@@ -27,8 +27,8 @@ To see the large data frame you can do:
 import zipfile, io
 
 # Internal modules #
-from forest_puller import cache_dir
-from forest_puller.common import country_codes
+import forest_puller
+from forest_puller.common import extra_data, lazy_attributes, Partition
 
 # First party modules #
 from plumbing.cache import property_cached
@@ -99,11 +99,21 @@ class ZipFile:
         df['country'] = df['country'].replace({'Czech': 'Czechia'})
         df['country'] = df['country'].replace({'UK':    'United Kingdom'})
         # Use country short codes instead of long names #
+        country_codes    = extra_data.country_codes
         name_to_iso_code = dict(zip(country_codes['country'], country_codes['iso2_code']))
         df['country'] = df['country'].replace(name_to_iso_code)
         # Return #
         return df
 
+    @property_cached
+    def by_country(self):
+        """The rows of `self.df` split by country in a single pass."""
+        return Partition(self.df)
+
 ###############################################################################
-# Create a singleton #
-zip_file = ZipFile(cache_dir + 'hpffre/zip/')
\ No newline at end of file
+def create_singleton():
+    """Create the singleton."""
+    return {'zip_file': ZipFile(forest_puller.cache_dir + 'hpffre/zip/')}
+
+# It is only created when first accessed #
+__getattr__ = lazy_attributes(__name__, ('zip_file',), create_singleton)
\ No newline at end of file
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+Many of our data sets only have values for a few years, e.g. 1990, 2000,
+2005 and 2010 for the SOEF. This module fills in every year of a target range,
+for every country at once:
+
+    >>> from forest_puller.interpolation import interpolator
+    >>> from forest_puller.conversion.bcef_by_country import country_bcef
+    >>> df = country_bcef.by_country_year
+    >>> print(interpolator(df, range(1990, 2020), policy='linear'))
+
+The input is a sparse data frame with one row per country and year, any
+number of value columns, and no duplicated country and year. The output has
+one row per country and per year of the target range. The possible policies
+are:
+
+* `linear`: Linear interpolation between known years. Before the first
+  known year and after the last, the edge values are held constant.
+* `nearest`: Every year takes the value of the closest known year.
+* `extrapolate`: Linear interpolation between known years, and linear
+  extrapolation from the two first and the two last known years.
+
+Missing values (NaN) don't count as known values, this is decided
+separately for every value column.
+"""
+
+# Built-in modules #
+import hashlib
+
+# Internal modules #
+
+# First party modules #
+
+# Third party modules #
+import numpy, pandas
+
+###############################################################################
+class Interpolator:
+    """
+    Instead of grouping by country and interpolating each country and each
+    column one after the other, the years of all countries are laid out on a
+    single axis, each country being shifted far away from the others. A
+    single sorted array then holds the known points of all countries and
+    every year of the target range is resolved in the same vectorized pass.
+
+    The results are memoized, keyed on the contents of the input data frame
+    and on the arguments, so asking twice for the same interpolation
+    returns the same data frame. It should not be modified in place.
+    """
+
+    policies = ('linear', 'nearest', 'extrapolate')
+
+    def __init__(self):
+        # Every interpolation we have computed so far #
+        self.memo = {}
+
+    def __repr__(self):
+        return '%s object with %i results' % (self.__class__, len(self.memo))
+
+    def __call__(self, df, years, policy='linear', key='country', columns=None):
+        """
+        Interpolate the `columns` of `df` (by default all the columns
+        except `key` and 'year') on every year in `years` for every
+        value of `key` found in `df`.
+        """
+        # Check #
+        if policy not in self.policies:
+            raise ValueError("Unknown policy '%s', choose one of %s." % (policy, self.policies))
+        # Default columns #
+        if columns is None: columns = [c for c in df.columns if c not in (key, 'year')]
+        columns = list(columns)
+        years   = numpy.asarray(list(years), dtype=float)
+        # Memoize #
+        contents = pandas.util.hash_pandas_object(df[[key, 'year'] + columns], index=False)
+        contents = hashlib.sha1(contents.to_numpy().tobytes()).hexdigest()
+        memo_key = (contents, tuple(years), policy, key, tuple(columns))
+        if memo_key not in self.memo:
+            self.memo[memo_key] = self.compute(df, years, policy, key, columns)
+        return self.memo[memo_key]
+
+    def compute(self, df, years, policy, key, columns):
+        """Build the full data frame of interpolated values."""
+        # Number the countries in their order of appearance #
+        codes, uniques = pandas.factorize(df[key])
+        # Place every country on its own stretch of a single axis #
+        known  = df['year'].to_numpy(float)
+        lowest = min(known.min(), years.min()) if len(known) else years.min()
+        span   = 2 * (max(known.max(), years.max()) - lowest + 1) if len(known) else 1
+        x      = codes * span + (known - lowest)
+        # The target points #
+        grid_codes = numpy.repeat(numpy.arange(len(uniques)), len(years))
+        grid_years = numpy.tile(years, len(uniques))
+        t          = grid_codes * span + (grid_years - lowest)
+        # Start the result #
+        result = pandas.DataFrame({key:    uniques.take(grid_codes),
+                                   'year': grid_years.astype(int)})
+        # Every column has its own known points #
+        for column in columns:
+            values = df[column].to_numpy(float)
+            valid  = ~numpy.isnan(values) & (codes >= 0)
+            result[column] = self.resolve(x[valid], codes[valid], values[valid],
+                                          t, grid_codes, policy)
+        # Return #
+        return result
+
+    @staticmethod
+    def resolve(x, codes, values, t, t_codes, policy):
+        """Interpolate the known points (`x`, `values`) at the targets `t`."""
+        # Sort the known points #
+        order  = numpy.argsort(x, kind='stable')
+        x      = x[order]
+        codes  = codes[order]
+        values = values[order]
+        # The first and last known point of the country of each target #
+        first = numpy.searchsorted(codes, t_codes, side='left')
+        last  = numpy.searchsorted(codes, t_codes, side='right') - 1
+        has   = last >= first
+        first = numpy.where(has, first, 0)
+        last  = numpy.where(has, last,  0)
+        # No known points at all #
+        result = numpy.full(len(t), numpy.nan)
+        if len(x) == 0: return result
+        # Between the first and last known points #
+        if policy == 'nearest':
+            above  = numpy.clip(numpy.searchsorted(x, t, side='left'), first, last)
+            below  = numpy.clip(above - 1, first, last)
+            closer = numpy.abs(t - x[below]) <= numpy.abs(x[above] - t)
+            inside = numpy.where(closer, values[below], values[above])
+        else:
+            inside = numpy.interp(t, x, values)
+        result = numpy.where(has, inside, numpy.nan)
+        # Before the first and after the last known points #
+        before = has & (t < x[first])
+        after  = has & (t > x[last])
+        if policy == 'extrapolate':
+            second = numpy.minimum(first + 1, last)
+            penult = numpy.maximum(last - 1, first)
+            slope_first = slope(x, values, first, second)
+            slope_last  = slope(x, values, penult, last)
+            result[before] = (values[first] + (t - x[first]) * slope_first)[before]
+            result[after]  = (values[last]  + (t - x[last])  * slope_last)[after]
+        else:
+            result[before] = values[first][before]
+            result[after]  = values[last][after]
+        # Return #
+        return result
+
+###############################################################################
+def slope(x, values, start, end):
+    """The slope between two points, zero when they are the same point."""
+    run = x[end] - x[start]
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        return numpy.where(run == 0, 0.0, (values[end] - values[start]) / run)
+
+###############################################################################
+# Create a singleton #
+interpolator = Interpolator()
@@ -74,15 +74,12 @@ class AggIPCC:
         Doing a `df.groupby(['year']).sum(skipna=False)` will ignore the kwargs.
         """
         # Import #
-        from forest_puller.ipcc.concat import df as concat_df
-        # Load #
-        df = concat_df.copy()
+        from forest_puller.ipcc.concat import concat
+        # Load only the columns we need #
+        columns = ['country', 'year', 'land_use', 'area']
+        df = concat.select(years=self.common_years, columns=columns).copy()
         # Take only the simple category #
         df = df.query("land_use == 'total_forest'")
-        # Filter #
-        df = df.query("year in @self.common_years")
-        # Aggregate all numeric columns, drop non-numeric #
-        df = df.drop(columns=['country', 'subdivision', 'land_use'])
         # Keep only two columns #
         df = df[['year', 'area']]
         # Check there are no NaNs #
@@ -11,18 +11,53 @@ Typically you can use this submodule like this:
 
     >>> import forest_puller.ipcc.concat
     >>> print(forest_puller.ipcc.concat.df)
+
+Or, to load only some countries and some years:
+
+    >>> from forest_puller.ipcc.concat import concat
+    >>> print(concat.select(countries=['AT', 'BE'], years=range(1990, 2000)))
+
+Or, to load only some columns (which, with a columnar store, avoids reading
+the other columns from disk, see `forest_puller.store`):
+
+    >>> print(concat.select(columns=['country', 'year', 'land_use', 'area']))
 """
 
 # Built-in modules #
 
 # Internal modules #
-from forest_puller.ipcc.country import all_countries
+from forest_puller.common import Concat
 
 # First party modules #
 
 # Third party modules #
-import pandas
 
-##############################################################################
-every_year = (y.year_country_cols for c in all_countries for y in c)
-df = pandas.concat(every_year, ignore_index=True)
+###############################################################################
+class IPCCConcat(Concat):
+    """
+    Only the excel files of the years requested are parsed
+    and only the columns requested are loaded.
+    """
+
+    filters_years    = True
+    projects_columns = True
+
+    @property
+    def countries(self):
+        from forest_puller.ipcc.country import countries
+        return countries
+
+    def frames(self, countries, years, columns):
+        for c in countries:
+            for y in c:
+                if years is not None and y.year not in years: continue
+                yield y.select_cols(columns)
+
+###############################################################################
+# Create a singleton #
+concat = IPCCConcat()
+
+def __getattr__(name):
+    """The full data frame is only built when first accessed."""
+    if name == 'df': return concat.df
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
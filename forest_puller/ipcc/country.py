@@ -11,16 +11,22 @@ Typically you can use this class like this:
 
     >>> from forest_puller.ipcc.country import all_countries
     >>> for country in tqdm(all_countries): country.uncompress()
+
+If the environment variable `FOREST_PULLER_IPCC_ZIP` is set, the excel files
+are instead read directly from within the zip files, in which case
+uncompressing is not needed:
+
+    $ export FOREST_PULLER_IPCC_ZIP=1
 """
 
 # Built-in modules #
-import re
+import os, re
 
 # Internal modules #
+import forest_puller
 from forest_puller.ipcc.year import Year
-from forest_puller.ipcc.zip_files import all_zip_files
-from forest_puller import cache_dir
-from forest_puller.common import country_codes
+from forest_puller.ipcc.zip_member import ZipMember
+from forest_puller.common import extra_data, lazy_attributes
 
 # First party modules #
 from plumbing.cache import property_cached
@@ -56,8 +62,6 @@ class Country:
         self.iso2_code = iso2_code
         # Record where the cache will be located on disk #
         self.cache_dir = xls_cache_dir
-        # Main directory #
-        self.zip_dir = all_zip_files.cache_dir + self.iso2_code + '/'
 
     def __repr__(self):
         return '%s object code "%s"' % (self.__class__, self.iso2_code)
@@ -71,11 +75,27 @@ class Country:
     @property_cached
     def iso3_code(self):
         """Get the ISO3 code for this country."""
+        # Load #
+        country_codes = extra_data.country_codes
         # Find the right row #
         row = country_codes.loc[country_codes['iso2_code'] == self.iso2_code].iloc[0]
         # Get the ISO3 #
         return row['iso3_code']
 
+    @property
+    def read_zip(self):
+        """
+        Should we skip the `xls` directory and read from the zip files.
+        The environment variable is checked every time, not only at import.
+        """
+        return os.environ.get("FOREST_PULLER_IPCC_ZIP", '') not in ('', '0')
+
+    @property_cached
+    def zip_dir(self):
+        """The directory containing the zip files for this country."""
+        from forest_puller.ipcc.zip_files import all_zip_files
+        return all_zip_files.cache_dir + self.iso2_code + '/'
+
     @property_cached
     def zip_files(self):
         """Return a list of all zip files present for this country."""
@@ -109,6 +129,8 @@ class Country:
     @property_cached
     def all_xls_files(self):
         """For each country we have N excel files, one for each year."""
+        # We can list the contents of the zip without uncompressing #
+        if self.read_zip: return ZipMember.all_in(self.zip_file)
         # If the xls_dir is empty, we need to reconstruct from cache #
         if self.cache_dir.empty:
             return [self.xls_dir + f.strip('\n') for f in self.cached_xls_list]
@@ -155,7 +177,7 @@ class Country:
     @property
     def cached_xls_list(self):
         """The location where we will save the list of excel files paths."""
-        return cache_dir + 'ipcc/countries/' + self.iso2_code + '.txt'
+        return forest_puller.cache_dir + 'ipcc/countries/' + self.iso2_code + '.txt'
 
     def write_xls_list(self):
         """
@@ -170,7 +192,12 @@ class Country:
         return self.cached_xls_list
 
 ###############################################################################
-# Create every country object #
-cache_path    = cache_dir + 'ipcc/xls/'
-all_countries = [Country(iso2, cache_path) for iso2 in country_codes['iso2_code']]
-countries     = {c.iso2_code: c for c in all_countries}
+def create_countries():
+    """Create every country object."""
+    cache_path    = forest_puller.cache_dir + 'ipcc/xls/'
+    all_countries = [Country(iso2, cache_path) for iso2 in extra_data.country_codes['iso2_code']]
+    countries     = {c.iso2_code: c for c in all_countries}
+    return {'all_countries': all_countries, 'countries': countries}
+
+# They are only created when first accessed #
+__getattr__ = lazy_attributes(__name__, ('all_countries', 'countries'), create_countries)
@@ -9,24 +9,38 @@ Unit D1 Bioeconomy.
 """
 
 # Built-in modules #
+import hashlib
 
 # Internal modules #
-from forest_puller import module_dir
+from forest_puller.common import extra_data
 
 # First party modules #
 from plumbing.cache import property_cached
 
 # Third party modules #
-import pandas
 
-# Load IPCC column name mapping to short names #
-col_name_map = module_dir + 'extra_data/ipcc_columns.csv'
-col_name_map = pandas.read_csv(str(col_name_map))
+###############################################################################
+# Every distinct header layout already parsed, indexed by fingerprint #
+layouts = {}
+
+def names_fingerprint(names):
+    """A hash of a list of column names that depends on their order."""
+    return hashlib.sha1('\n'.join(map(str, names)).encode()).hexdigest()
 
 ###############################################################################
 class Headers:
     """
     Represents a specific list of column names for a given excel file.
+
+    The layout of the header is the same across all years of a submission
+    and across nearly all countries. Hence the result of the parsing is
+    stored in the `layouts` dictionary, keyed by a fingerprint of the
+    column names in their order, and only computed once per distinct layout.
+
+    Every layout that was examined has its fingerprint listed in
+    `ipcc_layouts.csv`. A layout not found there raises an exception, even
+    if all its column names can be mapped, since the columns could have
+    moved. Once examined, add it with `scripts/ipcc/register_layouts.py`.
     """
 
     def __init__(self, year):
@@ -46,6 +60,37 @@ class Headers:
     end   = 9
 
     @property_cached
+    def raw(self):
+        """The cells of the excel sheet that make up the header."""
+        return self.year.raw_table_4a.iloc[self.begin:self.end]
+
+    @property_cached
+    def names(self):
+        """The long name of every column, as written in the excel sheet."""
+        # Fill values, all NaNs become what is north of them #
+        df = self.raw.ffill()
+        # Remove the index #
+        df = df.reset_index(drop=True)
+        # Take the fourth row (i.e. row no. 8 in excel GUI) #
+        df = df.iloc[3]
+        # Remove the name of the headers (was 3 because of the original parsing) #
+        df.name = None
+        # Remove all newlines #
+        df = df.replace('\n', ' ', regex=True)
+        # Return #
+        return df
+
+    @property_cached
+    def fingerprint(self):
+        """A hash of the column names in their order, identical for identical layouts."""
+        return names_fingerprint(self.names)
+
+    @property
+    def known(self):
+        """The fingerprints of every layout that was examined."""
+        return set(extra_data.ipcc_layouts['fingerprint'])
+
+    @property
     def df(self):
         """
         Typically the result is something like:
@@ -60,25 +105,36 @@ class Headers:
             6               losses_ratio
             [...]
         """
-        # Raw header #
-        df = self.year.raw_table_4a.iloc[self.begin:self.end]
-        # Fill values, all NaNs become what is north of them #
-        df = df.fillna(method='ffill')
-        # Remove the index #
-        df = df.reset_index(drop=True)
-        # Take the fourth row (i.e. row no. 8 in excel GUI) #
-        df = df.iloc[3]
-        # Remove the name of the headers (was 3 because of the original parsing) #
-        df.name = None
-        # Remove all newlines #
-        df = df.replace('\n', ' ', regex=True)
+        # Only accept the layouts that were examined #
+        if self.fingerprint not in self.known:
+            msg = "Unknown header layout '%s' found in %s. Examine it and add it to '%s'."
+            raise Exception(msg % (self.fingerprint, self.year, extra_data.path('ipcc_layouts')))
+        # Parse only the layouts never seen before #
+        if self.fingerprint not in layouts:
+            layouts[self.fingerprint] = self.parse()
+        # Return a copy so that the cached layout is never modified #
+        return layouts[self.fingerprint].copy()
+
+    def parse(self):
+        """
+        Derive the column names from the raw header cells. If some of
+        these names are not found in `ipcc_columns.csv` we raise an exception
+        since the layout is new and must be examined.
+        """
+        # Start from the long names #
+        df = self.names.copy()
         # Add '_per_area' to the columns that are already divided
         # so we can distinguish them from the columns with carbon
         df.iloc[5:12] = df.iloc[5:12] + '_per_area'
         # Convert to short headers using col_name_map
+        col_name_map = extra_data.ipcc_columns
         before = list(col_name_map['ipcc'])
         after  = list(col_name_map['forest_puller'])
         df     = df.replace(before, after)
+        # Check that every column was mapped #
+        unknown = [name for name in df if name not in after]
+        if unknown:
+            msg = "New header layout '%s' found in %s. Unmapped columns: %s"
+            raise Exception(msg % (self.fingerprint, self.year, unknown))
         # Return #
         return df
-
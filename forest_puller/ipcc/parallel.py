@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+Typically you can use this submodule like this:
+
+    >>> from forest_puller.ipcc.parallel import build_all
+    >>> build_all(processes=8, rerun=True)
+"""
+
+# Built-in modules #
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Internal modules #
+
+# First party modules #
+
+# Third party modules #
+from tqdm import tqdm
+
+###############################################################################
+def parse_one(iso2_code, rerun=False):
+    """
+    Parse and store every year of a single country. This is the function
+    that runs inside each worker process, so the excel files are hashed
+    there to check if the stored data frames are up to date.
+    Returns the (country, year) pairs that were parsed.
+    """
+    # Import #
+    from forest_puller.ipcc.country import countries
+    # Find the country object #
+    country = countries[iso2_code]
+    # Compute and store, such that no one sees a half written file #
+    parsed = []
+    for year in country:
+        prop = type(year).df
+        if not rerun and prop.is_fresh(year): continue
+        prop.compute(year)
+        parsed.append((iso2_code, year.year))
+    # Return #
+    return parsed
+
+###############################################################################
+def build_all(countries=None, processes=None, rerun=False):
+    """
+    Parse every year of every country (or only of the `countries` given as
+    ISO2 codes) on a pool of `processes` workers, with one task per country.
+    By default the pool has one worker per CPU, with a single one everything
+    runs in the current process. Years that already have a stored data frame
+    computed from the same inputs are skipped unless `rerun` is true.
+    Returns the list of (country, year) pairs parsed.
+    """
+    # Import #
+    from forest_puller.ipcc.country import all_countries
+    # Pick countries #
+    chosen = [c for c in all_countries if countries is None or c.iso2_code in countries]
+    if not chosen: return []
+    # Default number of processes #
+    if processes is None: processes = os.cpu_count()
+    # Run #
+    done = []
+    if processes == 1:
+        for c in tqdm(chosen, desc='IPCC countries'): done += parse_one(c.iso2_code, rerun)
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            futures  = [pool.submit(parse_one, c.iso2_code, rerun) for c in chosen]
+            progress = tqdm(as_completed(futures), total=len(futures), desc='IPCC countries')
+            for future in progress: done += future.result()
+    # The objects of this process might have an outdated value in memory #
+    for c in chosen:
+        for y in c: y.__dict__.get('__cache__', {}).pop('df', None)
+    # Return #
+    return sorted(done)
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+Typically you can use this class like this:
+
+    >>> from forest_puller.ipcc.sheet_reader import SheetReader
+    >>> reader = SheetReader('AUT_2019_1990_10042019_205508.xlsx', 'Table4.A')
+    >>> print(reader.df())
+"""
+
+# Built-in modules #
+import re, zipfile, posixpath
+
+# Internal modules #
+
+# First party modules #
+
+# Third party modules #
+import numpy
+from lxml import etree
+from pandas.io.parsers import TextParser
+
+###############################################################################
+class SheetReader:
+    """
+    Reads a single worksheet out of an xlsx file without touching the other
+    sheets of the workbook.
+
+    An xlsx file is a zip archive. We first look up the name of the sheet in
+    `xl/workbook.xml`, then find the XML file containing that sheet through
+    the workbook relationships in `xl/_rels/workbook.xml.rels`. Finally, that
+    XML file alone is parsed row by row, together with the shared strings.
+
+    The cells are converted exactly like `pandas.read_excel` does with the
+    `openpyxl` engine, and the resulting rows are handed to the same parser
+    that pandas uses. Hence the output is identical to:
+
+        pandas.read_excel(xlsx_file, sheet_name=sheet_name, header=None)
+
+    With one exception: numbers formatted as dates are not converted to
+    datetime objects since we don't read the styles of the workbook.
+    """
+
+    # The relationship type of the main workbook part #
+    office_doc = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument'
+
+    # The namespace of the relationship ids #
+    rel_ns = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+
+    def __init__(self, xlsx_file, sheet_name):
+        # The file to read from, or a file-like object #
+        self.xlsx_file = xlsx_file
+        # The name of the sheet as displayed in the excel GUI #
+        self.sheet_name = sheet_name
+
+    def __repr__(self):
+        return '%s of "%s" in "%s"' % (self.__class__, self.sheet_name, self.xlsx_file)
+
+    #------------------------------- Location --------------------------------#
+    def workbook_path(self, archive):
+        """Find the path of the workbook part inside the archive."""
+        # Parse the package relationships #
+        tree = etree.fromstring(archive.read('_rels/.rels'))
+        # Find the main document #
+        for rel in tree.iterfind('{*}Relationship'):
+            if rel.get('Type') == self.office_doc:
+                return rel.get('Target').lstrip('/')
+        # Default location #
+        return 'xl/workbook.xml'
+
+    def sheet_path(self, archive):
+        """Find the path of the XML file containing our sheet."""
+        # The workbook itself #
+        workbook = self.workbook_path(archive)
+        # Find the relationship id of our sheet #
+        tree = etree.fromstring(archive.read(workbook))
+        r_ids = [s.get('{%s}id' % self.rel_ns) for s in tree.iterfind('{*}sheets/{*}sheet')
+                 if s.get('name') == self.sheet_name]
+        if not r_ids:
+            raise ValueError("Worksheet named '%s' not found in '%s'."
+                             % (self.sheet_name, self.xlsx_file))
+        # Parse the workbook relationships #
+        directory, name = posixpath.split(workbook)
+        rels_path = posixpath.join(directory, '_rels', name + '.rels')
+        tree = etree.fromstring(archive.read(rels_path))
+        # Find the target #
+        for rel in tree.iterfind('{*}Relationship'):
+            if rel.get('Id') != r_ids[0]: continue
+            target = rel.get('Target')
+            if target.startswith('/'): return target.lstrip('/')
+            return posixpath.normpath(posixpath.join(directory, target))
+        raise ValueError("Relationship '%s' not found in '%s'." % (r_ids[0], rels_path))
+
+    def strings_path(self, archive):
+        """Find the path of the shared strings, if there are any."""
+        names = set(archive.namelist())
+        for path in ('xl/sharedStrings.xml', 'xl/SharedStrings.xml'):
+            if path in names: return path
+        return None
+
+    #------------------------------- Parsing ---------------------------------#
+    @staticmethod
+    def string_content(element):
+        """
+        Return the text of a shared or inline string, concatenating
+        rich text runs and ignoring phonetic annotations.
+        """
+        snippets = [t.text or '' for t in element.iterfind('{*}t')]
+        snippets += [t.text or '' for t in element.iterfind('{*}r/{*}t')]
+        return ''.join(snippets)
+
+    def shared_strings(self, archive):
+        """Read all shared strings into a list."""
+        # Some files have none #
+        path = self.strings_path(archive)
+        if path is None: return []
+        # Stream parse #
+        strings = []
+        with archive.open(path) as handle:
+            for _, si in etree.iterparse(handle, tag='{*}si'):
+                text = self.string_content(si)
+                strings.append(text.replace('x005F_', ''))
+                si.clear()
+        # Return #
+        return strings
+
+    @staticmethod
+    def column_index(reference):
+        """Convert a cell reference like 'AB12' to a one-based column number."""
+        index = 0
+        for char in re.match('[A-Z]+', reference.upper()).group():
+            index = index * 26 + ord(char) - 64
+        return index
+
+    @staticmethod
+    def cast_number(text):
+        """Same as `openpyxl` followed by `pandas` for numeric cells."""
+        if '.' in text or 'E' in text or 'e' in text: value = float(text)
+        else: value = int(text)
+        if int(value) == value: return int(value)
+        return float(value)
+
+    def convert_cell(self, cell, strings):
+        """Return the python value of a single <c> element."""
+        # The cell type #
+        kind = cell.get('t', 'n')
+        # Inline strings don't have a value element #
+        if kind == 'inlineStr':
+            child = cell.find('{*}is')
+            return "" if child is None else self.string_content(child)
+        # Empty cells #
+        text = cell.findtext('{*}v') or None
+        if text is None: return ""
+        # Cast according to type #
+        if kind == 'n':   return self.cast_number(text)
+        if kind == 's':   return strings[int(text)]
+        if kind == 'b':   return bool(int(text))
+        if kind == 'e':   return numpy.nan
+        return text
+
+    def rows(self, archive, strings):
+        """
+        Stream parse the sheet and yield every row as a list of values,
+        including empty rows.
+        """
+        # Count rows ourselves to fill the gaps #
+        current = 0
+        # Iterate #
+        with archive.open(self.sheet_path(archive)) as handle:
+            for _, row in etree.iterparse(handle, tag='{*}row'):
+                # The row number #
+                number = int(float(row.get('r', current + 1)))
+                # Rows can't go backwards #
+                if number <= current:
+                    row.clear()
+                    continue
+                # Missing rows are empty #
+                for _ in range(current + 1, number): yield []
+                current = number
+                # Place every cell in its column #
+                values = []
+                for cell in row.iterfind('{*}c'):
+                    ref = cell.get('r')
+                    col = self.column_index(ref) if ref else len(values) + 1
+                    values += [""] * (col - 1 - len(values))
+                    values.append(self.convert_cell(cell, strings))
+                # Free memory of the elements already processed #
+                row.clear()
+                while row.getprevious() is not None: del row.getparent()[0]
+                # Return #
+                yield values
+
+    def raw_data(self):
+        """
+        The list of rows as `pandas.read_excel` would prepare them:
+        trailing empty cells and rows are removed and all rows are
+        padded to the same width.
+        """
+        # Open the archive once #
+        with zipfile.ZipFile(self.xlsx_file) as archive:
+            strings = self.shared_strings(archive)
+            data    = []
+            last    = -1
+            for i, values in enumerate(self.rows(archive, strings)):
+                while values and values[-1] == "": values.pop()
+                if values: last = i
+                data.append(values)
+        # Trim trailing empty rows #
+        data = data[:last + 1]
+        # Extend rows to max width #
+        if data:
+            width = max(len(values) for values in data)
+            data  = [values + [""] * (width - len(values)) for values in data]
+        # Return #
+        return data
+
+    def df(self, **kwargs):
+        """
+        Return a data frame just like `pandas.read_excel` would with
+        `header=None`. Extra keyword arguments such as `na_values` are passed
+        on to the text parser.
+        """
+        parser = TextParser(self.raw_data(),
+                            header            = None,
+                            skip_blank_lines  = False,
+                            **kwargs)
+        return parser.read()
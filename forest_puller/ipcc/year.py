@@ -12,30 +12,27 @@ Unit D1 Bioeconomy.
 import re
 
 # Internal modules #
+import forest_puller
 from forest_puller.ipcc.headers import Headers
-from forest_puller import cache_dir, module_dir
+from forest_puller.ipcc.sheet_reader import SheetReader
+from forest_puller.ipcc.zip_member import ZipMember
+from forest_puller.common import extra_data
+from forest_puller.store import property_stored_at
 
 # First party modules #
-from plumbing.cache import property_cached, property_pickled_at
+from plumbing.cache import property_cached
 
 # Third party modules #
 import pandas, numpy
 
-# Load IPCC row and column names mapping to short names #
-col_name_map = module_dir + 'extra_data/ipcc_columns.csv'
-col_name_map = pandas.read_csv(str(col_name_map))
-
-# Load row name mapping to short names #
-row_name_map = module_dir + 'extra_data/ipcc_rows.csv'
-row_name_map = pandas.read_csv(str(row_name_map))
-
 ##############################################################################
 class Year:
     """
     Represents a specific year from a specific country's dataset and gives
     access to all the data of that year.
 
-        The final file structure will look like this:
+        The final file structure will look like this (with the default
+        pickle store, see `forest_puller.store`):
 
         /puller_cache/ipcc/df/AT:
             1990.pickle
@@ -75,17 +72,39 @@ class Year:
         'NE,NA,NO', 'NO,IE,NA', 'NO,NE,NA', 'NE,NO,IE'
     ]
 
+    @property
+    def workbook(self):
+        """
+        The path to the excel file, or a file-like object with its contents
+        if it was never extracted from the zip archive.
+        """
+        if isinstance(self.xls_file, ZipMember): return self.xls_file.open()
+        return str(self.xls_file)
+
     @property_cached
     def raw_table_4a(self):
-        """Table4.A as is without any modifications."""
+        """
+        Table4.A as is without any modifications.
+        Only the XML of that sheet is parsed, the rest of the workbook
+        is never decompressed (see `SheetReader`).
+        """
         # Load table #
-        df = pandas.read_excel(str(self.xls_file),
-                               sheet_name = 'Table4.A',
-                               header     = None,
-                               na_values  = self.na_values)
+        reader = SheetReader(self.workbook, 'Table4.A')
+        df     = reader.df(na_values=self.na_values)
         # Return #
         return df
 
+    @property
+    def raw_table_4a_pandas(self):
+        """
+        Same as `raw_table_4a` but with `pandas.read_excel` which will
+        load the whole workbook. Kept for comparison purposes.
+        """
+        return pandas.read_excel(self.workbook,
+                                 sheet_name = 'Table4.A',
+                                 header     = None,
+                                 na_values  = self.na_values)
+
     @property_cached
     def headers(self):
         """Parse the column names of the excel sheet."""
@@ -94,45 +113,57 @@ class Year:
     @property_cached
     def last_row(self):
         """Look for the position of the first row that contains a period as only
-        content."""
-        i = 0
-        for i, row in self.raw_table_4a.iterrows():
-            if i < 10: continue
-            if row.iloc[0] == '.': break
-        return i
-
-    @property_pickled_at('df_cache_path')
+        content. The ten first rows are never considered."""
+        # The first column #
+        first = self.raw_table_4a.iloc[:, 0]
+        # Positions of all the terminators, sorted #
+        found = numpy.flatnonzero((first == '.').to_numpy())
+        # Skip the ones located in the ten first rows #
+        found = found[found.searchsorted(10):]
+        # If there is none we take the last row #
+        if len(found) == 0: return max(len(first) - 1, 0)
+        # Return #
+        return int(found[0])
+
+    @property_stored_at('df_cache_path', inputs='df_inputs', version=1)
     def df(self):
         """Extract targeted information from 'Table4.A' into a pandas data frame."""
         # Take all lines after the header but before the last row #
-        df = self.raw_table_4a.iloc[9:self.last_row]
+        df = self.raw_table_4a.iloc[9:self.last_row].copy()
+        # Without the header the value columns are numbers #
+        df = df.infer_objects()
         # Rename columns index #
         df.columns = self.headers.df
-        # Go through `land_use` and `subcategory` removing the repetitions #
-        for i,row in df.iterrows():
-            cat, subcat = row['land_use'], row['subdivision']
-            if subcat is numpy.NaN: current_cat     = cat
-            elif subcat != cat:     raise Exception("Cat. and subcat. should never differ.")
-            else:                   row['land_use'] = current_cat
-        # Convert to short titles using row_name_map #
-        before = list(row_name_map['ipcc'])
-        after  = list(row_name_map['forest_puller'])
-        df     = df.replace(before, after)
+        # Rows with a subdivision must repeat its name as category #
+        cat, subcat = df['land_use'], df['subdivision']
+        is_sub = subcat.notna()
+        if (cat[is_sub] != subcat[is_sub]).any():
+            raise Exception("Cat. and subcat. should never differ.")
+        # Convert to short titles using `ipcc_rows` #
+        row_names = extra_data.ipcc_row_names
+        df['land_use']    = df['land_use'].replace(row_names)
+        df['subdivision'] = df['subdivision'].replace(row_names)
         # Convert units (such that we never have kilo hectares, only hectares etc.) #
-        for i, row in col_name_map.iterrows():
-            col_name, ratio = row['forest_puller'], row['unit_convert_ratio']
-            if numpy.isnan(ratio): continue
-            if df[col_name].dtype != 'float64': raise Exception("Non-float in the df.")
-            df[col_name] = df[col_name] * ratio
+        ratios = extra_data.ipcc_unit_ratios
+        values = df[ratios.index]
+        if (values.dtypes != 'float64').any(): raise Exception("Non-float in the df.")
+        df[ratios.index] = values * ratios
         # Reset the index #
         df = df.reset_index(drop=True)
         # Return #
         return df
 
+    @property
+    def df_inputs(self):
+        """The files that `self.df` is computed from."""
+        return [self.xls_file,
+                extra_data.path('ipcc_rows'),
+                extra_data.path('ipcc_columns')]
+
     @property_cached
     def df_cache_path(self):
         """Specify where on the file system we will pickle the df property."""
-        path  = cache_dir + 'ipcc/df/' + self.country.iso2_code + '/'
+        path  = forest_puller.cache_dir + 'ipcc/df/' + self.country.iso2_code + '/'
         path += str(self.year) + '.pickle'
         return path
 
@@ -157,11 +188,23 @@ class Year:
         Same as `self.df` but we add a column with the current year (e.g. 1990)
         and a column with the current country (e.g. 'AT').
         """
+        return self.select_cols()
+
+    def select_cols(self, columns=None):
+        """
+        Same as `self.year_country_cols` but keeping only the given `columns`
+        in that order. Only those columns are loaded from the store.
+        """
         # Load #
-        df = self.df.copy()
+        if columns is None: df = self.df.copy()
+        else:
+            stored = [col for col in columns if col not in ('country', 'year')]
+            df = Year.df.load(self, stored).copy()
         # Add columns #
         df.insert(0, 'year',    self.year)
         df.insert(0, 'country', self.country.iso2_code)
+        # Reorder #
+        if columns is not None: df = df[list(columns)]
         # Return #
         return df
 
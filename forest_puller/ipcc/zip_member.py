@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+Typically you can use this class like this:
+
+    >>> from forest_puller.ipcc.zip_member import ZipMember
+    >>> members = ZipMember.all_in('aut-2019-crf-15apr19.zip')
+    >>> print(members[0].name)
+"""
+
+# Built-in modules #
+import io, zipfile, posixpath
+
+# Internal modules #
+
+# First party modules #
+
+# Third party modules #
+
+###############################################################################
+class ZipMember:
+    """
+    Points to an excel file that is still inside a CRF zip archive. It
+    replaces the path of an uncompressed file, so it has a `name` attribute
+    just like an `autopaths` file path. The bytes are only decompressed in
+    memory when the file is opened.
+    """
+
+    @classmethod
+    def all_in(cls, zip_path, extension='.xlsx'):
+        """
+        Enumerate the excel files found in the central directory of
+        the archive, without decompressing anything.
+        """
+        with zipfile.ZipFile(str(zip_path)) as archive:
+            names = [info.filename for info in archive.infolist()
+                     if not info.is_dir() and info.filename.endswith(extension)]
+        return [cls(zip_path, name) for name in sorted(names)]
+
+    def __init__(self, zip_path, member):
+        # The archive on disk #
+        self.zip_path = zip_path
+        # The path of the file inside the archive #
+        self.member   = member
+
+    def __repr__(self):
+        return '%s object "%s" in "%s"' % (self.__class__, self.member, self.zip_path)
+
+    def __str__(self): return str(self.zip_path) + '/' + self.member
+
+    @property
+    def name(self):
+        """The file name without any directory, e.g. 'AUT_2019_1990_1004.xlsx'."""
+        return posixpath.basename(self.member)
+
+    def digest(self):
+        """
+        Identify the contents of the member with the checksum and size
+        recorded in the central directory, without decompressing it.
+        """
+        with zipfile.ZipFile(str(self.zip_path)) as archive:
+            info = archive.getinfo(self.member)
+        return '%08x-%i' % (info.CRC, info.file_size)
+
+    def open(self):
+        """Decompress the member and return a seekable file-like object."""
+        with zipfile.ZipFile(str(self.zip_path)) as archive:
+            return io.BytesIO(archive.read(self.member))
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+The data frames that concatenate every country of a data source repeat the
+same few labels (country codes, land use names, FAOSTAT items, ...) on
+millions of rows. Before being handed out, they pass through this schema
+which stores these label columns as pandas categoricals and the years as
+small integers:
+
+    >>> from forest_puller.ipcc.concat import concat
+    >>> print(concat.df.dtypes)
+
+Where the possible labels are known in advance, e.g. the ISO2 codes listed in
+`country_codes.csv` or the row names listed in `ipcc_rows.csv`, the categories
+are exactly that fixed set, whatever the data contains. Frames coming from
+different sources hence always share the same categories and can be joined or
+concatenated without falling back to strings. A label that is not in the
+fixed set raises an exception instead of being silently turned into NaN.
+The other label columns, e.g. the FAOSTAT items, have no fixed set and use
+the labels found. The categories are always in alphabetical order, so that
+sorting or grouping on a label column gives the same row order as with
+plain strings.
+"""
+
+# Built-in modules #
+
+# Internal modules #
+from forest_puller.common import extra_data
+
+# First party modules #
+from plumbing.cache import property_cached
+
+# Third party modules #
+import numpy, pandas
+
+###############################################################################
+class Schema:
+    """Converts the label and year columns of a data frame to compact types."""
+
+    # The columns that contain labels #
+    label_columns = ['country', 'source', 'land_use', 'subdivision',
+                     'item', 'element', 'unit', 'flag', 'category']
+
+    # The columns that contain years #
+    year_columns = ['year']
+
+    # The type used for years #
+    year_dtype = 'int16'
+
+    # The names of the sources in the combined data frames #
+    sources = ['ipcc', 'soef', 'fao', 'faostat', 'hpffre', 'fra']
+
+    def __repr__(self):
+        return '%s object' % self.__class__
+
+    @property_cached
+    def fixed_categories(self):
+        """The categories that are known in advance, by column name."""
+        def unique(values): return list(pandas.unique(values.dropna()))
+        return {'country':  unique(extra_data.country_codes['iso2_code']),
+                'land_use': unique(extra_data.ipcc_rows['forest_puller']),
+                'source':   self.sources}
+
+    def categories(self, column, values):
+        """
+        The categories to use for a given column containing `values`,
+        sorted the same way strings are. For a column with fixed categories
+        these are only the fixed ones and any other value is an error.
+        Otherwise they are the values found.
+        """
+        found = set(pandas.unique(values.dropna()))
+        if column not in self.fixed_categories: return sorted(found, key=str)
+        fixed   = self.fixed_categories[column]
+        unknown = found - set(fixed)
+        if unknown:
+            msg = "The column '%s' contains values that are not known in advance: %s."
+            raise ValueError(msg % (column, sorted(unknown, key=str)))
+        return sorted(fixed, key=str)
+
+    def label_dtype(self, column, values):
+        """The categorical type to use for one label column."""
+        return pandas.CategoricalDtype(self.categories(column, values))
+
+    def compact_years(self, values):
+        """
+        Years are stored on two bytes when they are whole numbers without
+        missing values. Otherwise, e.g. for years in the middle of two
+        others, they are left untouched.
+        """
+        if not pandas.api.types.is_integer_dtype(values): return values
+        info = numpy.iinfo(self.year_dtype)
+        if len(values) and (values.min() < info.min or values.max() > info.max): return values
+        return values.astype(self.year_dtype)
+
+    def apply(self, df):
+        """Return a new data frame with compact types. The input is unchanged."""
+        # Pick the types #
+        types = {}
+        for column in df.columns:
+            values = df[column]
+            if column in self.label_columns:
+                if isinstance(values.dtype, pandas.CategoricalDtype): values = values.astype(object)
+                if not pandas.api.types.is_numeric_dtype(values):
+                    types[column] = self.label_dtype(column, values)
+            if column in self.year_columns:
+                compact = self.compact_years(values)
+                if compact is not values: types[column] = compact.dtype
+        # Convert #
+        if not types: return df
+        return df.astype(types)
+
+###############################################################################
+# Create a singleton #
+schema = Schema()
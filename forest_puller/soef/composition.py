@@ -55,13 +55,7 @@ class CompositionData:
         all_latin_names = pandas.Series(self.stock_comp['latin_name'].unique())
         # Mapping table #
         from forest_puller.conversion.genus_npl import genus_parser
-        result = all_latin_names.map(genus_parser)
-        # Unzip #
-        genus, species = list(zip(*result))
-        # Make data frame #
-        result = pandas.DataFrame({'latin_name': all_latin_names,
-                                   'genus':      genus,
-                                   'species':    species})
+        result = genus_parser.parse_many(all_latin_names)
         # Return #
         return result
 
@@ -83,47 +77,78 @@ class CompositionData:
         # Return #
         return result
 
-    def collapse(self, subdf):
+    #------------------------------ Group sums -------------------------------#
+    @property_cached
+    def group_sums(self):
         """
-        Function used to compute each extra row (used below).
-        Takes a dataframe and returns a dataframe.
+        All the sums needed to collapse, average and check the composition,
+        computed in a single grouped pass over `stock_density`. There is one
+        row per country and year with the columns:
+
+        * `unassigned`: The stock of the species that have no density,
+          except for the total.
+        * `assigned`: The stock of the species that have a density.
+        * `n_assigned`: The number of species that have a density.
+        * `weighted`: The sum of stock multiplied by density.
+        * `composition`: The stock of all rows except the total.
+        * `total`: The total stock reported in the table.
         """
-        # Reset the index #
-        subdf = subdf.reset_index(drop=True)
-        # Parse the country and year #
-        country = subdf.loc[0, 'country']
-        year    = subdf.loc[0, 'year']
-        # Select all unassigned except total #
-        selector    = (subdf['density'] != subdf['density']) & \
-                      (subdf['rank']    != 'total')
-        # Save the unassigned elsewhere #
-        unassigned  = subdf[selector].copy()
-        # Drop the unassigned in the main dataframe #
-        subdf       = subdf[~selector].copy()
-        # Sum the unassigned #
-        unass_stock = unassigned['growing_stock'].sum()
-        # Add a 'remaining' row with the unassigned stock #
-        row = pandas.Series({'country':      country,
-                             'year':         year,
-                             'rank':         'remaining',
-                             'latin_name':   'remaining',
-                             'species':      'missing',
-                             'genus':        'missing',
-                             'growing_stock': unass_stock,
-                             'density':       numpy.NaN})
-        # Can only append a Series if ignore_index=True #
-        subdf = subdf.append(row, ignore_index=True)
+        # Load #
+        df    = self.stock_density
+        stock = df['growing_stock']
+        # Masks #
+        is_total    = df['rank'] == 'total'
+        has_density = df['density'].notna()
+        # The quantities to sum #
+        parts = pandas.DataFrame({'country':     df['country'],
+                                  'year':        df['year'],
+                                  'unassigned':  stock.where(~has_density & ~is_total, 0.0),
+                                  'assigned':    stock.where(has_density, 0.0),
+                                  'n_assigned':  has_density.astype(int),
+                                  'weighted':    (stock * df['density']).where(has_density, 0.0),
+                                  'composition': stock.where(~is_total, 0.0),
+                                  'total':       stock.where(is_total)})
+        # Reduce every group at once #
+        groups = parts.groupby(['country', 'year'], observed=True)
+        result = groups.agg({'unassigned':  'sum',
+                             'assigned':    'sum',
+                             'n_assigned':  'sum',
+                             'weighted':    'sum',
+                             'composition': 'sum',
+                             'total':       'first'})
         # Return #
-        return subdf
+        return result.reset_index()
 
+    #------------------------------ Collapse ---------------------------------#
     @property_cached
     def stock_collapsed(self):
-        """Collapse the unmatched into remaining."""
-        # Group #
-        groups = self.stock_density.groupby(['country', 'year'])
-        # Apply #
-        result = groups.apply(self.collapse)
-        # Drop index #
+        """
+        Collapse the unmatched into remaining. In every country and year, the
+        species that have no density (except the total) are removed and
+        replaced by a single 'remaining' row holding the sum of their stock.
+        """
+        # Load #
+        df = self.stock_density.dropna(subset=['country', 'year'])
+        # Keep the assigned ones and the total #
+        selector = df['density'].isna() & (df['rank'] != 'total')
+        kept     = df[~selector]
+        # One 'remaining' row per country and year #
+        sums      = self.group_sums
+        remaining = pandas.DataFrame({'country':       sums['country'],
+                                      'year':          sums['year'],
+                                      'rank':          'remaining',
+                                      'genus':         'missing',
+                                      'species':       'missing',
+                                      'latin_name':    'remaining',
+                                      'growing_stock': sums['unassigned'],
+                                      'density':       numpy.nan})
+        # Each remaining row goes last in its group #
+        kept      = kept.assign(position=numpy.arange(len(kept)))
+        remaining = remaining.assign(position=len(kept))
+        result    = pandas.concat([kept, remaining], ignore_index=True)
+        result    = result.sort_values(['country', 'year', 'position'], kind='stable')
+        # Drop the ordering column and the index #
+        result = result.drop(columns=['position'])
         result = result.reset_index(drop=True)
         # Return #
         return result
@@ -131,103 +156,40 @@ class CompositionData:
     def sanity_check(self):
         """
         Recompute the total from the composition and see if
-        it matches with the original total.
+        it matches with the original total. Prints and returns the
+        countries and years that don't match.
         """
-        # Totals by country and year -- from their calculation #
-        theirs = self.stock_collapsed.query('rank=="total"')
-        theirs = theirs[['country', 'year', 'rank', 'growing_stock']]
-        theirs = theirs.reset_index(drop=True)
-        # Totals by country and year -- from our calculation #
-        groups = self.stock_collapsed.groupby(['country', 'year'])
-        # Dataframe to dataframe function #
-        def sanity_check_total(subdf):
-            # Reset the index #
-            subdf = subdf.reset_index(drop=True)
-            # Parse the country and year #
-            country = subdf.loc[0, 'country']
-            year    = subdf.loc[0, 'year']
-            # Select all except total #
-            selector  = (subdf['rank']    != 'total')
-            # Save the unassigned elsewhere #
-            all_stock = subdf[selector].copy()
-            # Sum the unassigned #
-            total     = all_stock['growing_stock'].sum()
-            # Add a 'remaining' row with the unassigned stock #
-            return pandas.Series({'country':      country,
-                                  'year':         year,
-                                  'rank':         'total',
-                                  'growing_stock': total})
-        # Apply #
-        ours = groups.apply(sanity_check_total)
-        # Drop index #
-        ours = ours.reset_index(drop=True)
-        # Compare #
-        their_years = theirs[['country', 'year']]
-        our_years   = ours[['country',   'year']]
-        their_years = set(map(tuple, their_years.values.tolist()))
-        our_years   = set(map(tuple, our_years.values.tolist()))
-        print(their_years ^ our_years)
-        # Check #
-        their_rows = theirs.iterrows()
-        our_rows   = ours.iterrows()
-        # Loop #
-        for x, y in zip(their_rows, our_rows):
-            i = x[0]
-            j = y[0]
-            row_theirs = x[1]
-            row_ours   = y[1]
-            assert row_ours['country'] == row_theirs['country']
-            assert row_ours['year']    == row_theirs['year']
-            country     = row_ours['country']
-            year        = row_ours['year']
-            our_stock   = row_ours['growing_stock']
-            their_stock = row_theirs['growing_stock']
-            #if our_stock == 0.0: continue
-            if not numpy.allclose(our_stock, their_stock, rtol=0.01):
-                print(country, year)
-                print(our_stock, their_stock)
-
-    def compute_avg_density(self, subdf):
-        """
-        Function used to compute each row (used below).
-        Takes a dataframe and returns a row.
-        """
-        # Reset the index #
-        subdf = subdf.reset_index(drop=True)
-        # Parse the country and year #
-        country = subdf.loc[0, 'country']
-        year    = subdf.loc[0, 'year']
-        # Parse the remaining and total #
-        remaining = subdf.query("rank=='remaining'")['growing_stock'].iloc[0]
-        total     = subdf.query("rank=='total'")['growing_stock'].iloc[0]
-        # Discard those with no remaining #
-        if remaining == 0.0: return None
-        # Select all assigned #
-        selector     = (subdf['density'] == subdf['density'])
-        all_assigned = subdf[selector].copy()
-        # Discard those with no assigned #
-        if len(all_assigned) == 0: return None
-        # Average with weights #
-        weights     = all_assigned["growing_stock"]
-        avg_density = numpy.average(all_assigned["density"], weights=weights)
-        # Fraction #
-        total_assigned = all_assigned['growing_stock'].sum()
-        frac_missing   = 1.0 - (total_assigned / total)
-        # Add a 'remaining' row with the unassigned stock #
-        row = pandas.Series({'country':      country,
-                             'year':         year,
-                             'avg_density':  avg_density,
-                             'frac_missing': frac_missing})
+        # Load #
+        sums = self.group_sums
+        # Years that only have a total, or only a composition #
+        has_total = sums['total'].notna()
+        print(sums.loc[~has_total, ['country', 'year']])
+        # Compare the totals #
+        sums     = sums[has_total]
+        selector = ~numpy.isclose(sums['composition'], sums['total'], rtol=0.01)
+        result   = sums.loc[selector, ['country', 'year', 'composition', 'total']]
+        print(result)
         # Return #
-        return row
+        return result
 
+    #------------------------------ Densities --------------------------------#
     @property_cached
     def avg_densities(self):
-        """Add the average density and fraction missing columns."""
-        # Groups #
-        groups = self.stock_collapsed.groupby(['country', 'year'])
-        # Apply #
-        result = groups.apply(self.compute_avg_density)
+        """
+        Add the average density and fraction missing columns. The density is
+        averaged over the species that have one, weighted by their stock.
+        Countries and years without any remaining stock, or without any
+        species that has a density, are left out.
+        """
+        # Load #
+        sums = self.group_sums
+        # Discard those with no remaining or no assigned #
+        sums = sums[(sums['unassigned'] != 0.0) & (sums['n_assigned'] > 0)]
+        # Compute #
+        result = pandas.DataFrame({'country':      sums['country'],
+                                   'year':         sums['year'],
+                                   'avg_density':  sums['weighted'] / sums['assigned'],
+                                   'frac_missing': 1.0 - sums['assigned'] / sums['total']})
         # Drop NaN #
         result = result.dropna()
         # Drop index #
@@ -236,34 +198,6 @@ class CompositionData:
         return result
 
     #----------------------------- Interpolation -----------------------------#
-    def resample_year(self, subdf, lower=None, upper=None):
-        """Resample a sub-dataframe on the year column."""
-        # Computer lower bound #
-        if lower is None: lower = int(subdf['year'].min())
-        # Compute upper bound #
-        if upper is None: upper = int(subdf['year'].max())
-        # Add rows with NaNs #
-        indexed = subdf.set_index(['year'])
-        reindex = indexed.reindex(range(lower, upper + 1))
-        ixreset = reindex.reset_index()
-        # Return #
-        return ixreset
-
-    def interpolate_density(self, subdf):
-        """Interpolate the values of a sub-dataframe on the density column."""
-        # Process #
-        subdf['avg_density'] = subdf['avg_density'].interpolate(method='linear')
-        # Return #
-        return subdf
-
-    def pad_density(self, subdf):
-        """Pad the values of a sub-dataframe on the density column."""
-        # Process #
-        subdf['avg_density'] = subdf['avg_density'].fillna(method='ffill')
-        subdf['avg_density'] = subdf['avg_density'].fillna(method='bfill')
-        # Return #
-        return subdf
-
     @property_pickled
     def avg_dnsty_intrpld(self):
         """
@@ -271,7 +205,7 @@ class CompositionData:
         by interpolation strategy.
 
         Years available are:   1990, 2000, 2005, 2010.
-        We will extend to the: 1980 - 2020 range.
+        We will extend to the: 1980 - 2021 range.
 
         Years that are found within the known interval, will be interpolated
         with the linear method.
@@ -279,27 +213,19 @@ class CompositionData:
         The edges, or years that are outside the interval for which we have
         data will be interpolated using the pad method (i.e. edges will be
         assumed constant).
+
+        The fraction missing is only given for the years available.
         """
+        # Import #
+        from forest_puller.interpolation import interpolator
         # Load #
-        result = self.avg_densities
-        # Apply first resample #
-        groups = result.groupby(['country'])
-        result = groups.apply(self.resample_year)
-        result = result.drop(columns=['country'])
-        result = result.reset_index()
-        result = result.drop(columns=['level_1'])
-        # Apply first interpolation #
-        groups = result.groupby(['country'])
-        result = groups.apply(self.interpolate_density)
-        # Apply second resample #
-        groups = result.groupby(['country'])
-        result = groups.apply(self.resample_year, lower=1980, upper=2021)
-        result = result.drop(columns=['country'])
-        result = result.reset_index()
-        result = result.drop(columns=['level_1'])
-        # Apply second interpolation #
-        groups = result.groupby(['country'])
-        result = groups.apply(self.pad_density)
+        known = self.avg_densities
+        # Interpolate the density for all countries #
+        result = interpolator(known, range(1980, 2022), policy='linear',
+                              columns=['avg_density'])
+        # Add the fraction missing of the years available #
+        result = result.left_join(known[['country', 'year', 'frac_missing']],
+                                  on=['country', 'year'])
         # Return #
         return result
 
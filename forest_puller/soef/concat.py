@@ -6,23 +6,71 @@ Written by Lucas Sinclair and Paul Rougieux.
 
 JRC Biomass Project.
 Unit D1 Bioeconomy.
+
+Typically you can use this submodule like this:
+
+    >>> from forest_puller.soef.concat import tables
+    >>> print(tables['forest_area'])
+
+Or, to load only some countries and some years of one table:
+
+    >>> from forest_puller.soef.concat import concats
+    >>> print(concats['fellings'].select(countries=['AT', 'BE'], years=2010))
 """
 
 # Built-in modules #
+from collections.abc import Mapping
 
 # Internal modules #
-from forest_puller.soef.country import all_countries
+from forest_puller.common import Concat
+from forest_puller.soef.specs import registry
 
 # First party modules #
 
 # Third party modules #
-import pandas
 
 ##############################################################################
-table_names = ["forest_area", "age_dist", "fellings", "stock", "stock_comp",
-               'area_by_type', 'stock_by_type']
-tables      = {}
+# Every table declared in `forest_puller.soef.specs` #
+table_names = list(registry)
+
+##############################################################################
+class SOEFConcat(Concat):
+    """Concatenates one specific table of every country."""
+
+    def __init__(self, table_name):
+        # Super #
+        super().__init__()
+        # The attribute of the `Country` objects that returns the table #
+        self.table_name = table_name
+
+    def __repr__(self):
+        return '%s object of table "%s"' % (self.__class__, self.table_name)
+
+    @property
+    def countries(self):
+        from forest_puller.soef.country import countries
+        return countries
+
+    def frames(self, countries, years, columns):
+        return (c.table(self.table_name).country_cols for c in countries)
+
+##############################################################################
+class Tables(Mapping):
+    """
+    Behaves like a dictionary where every table name is associated with the
+    data frame containing all countries. These data frames are only built
+    when first accessed.
+    """
+
+    def __init__(self, concats): self.concats = concats
+
+    def __getitem__(self, key): return self.concats[key].df
+
+    def __iter__(self): return iter(self.concats)
+
+    def __len__(self):  return len(self.concats)
 
-for table_name in table_names:
-    every_country = (getattr(c, table_name).country_cols for c in all_countries)
-    tables[table_name] = pandas.concat(every_country, ignore_index=True)
+###############################################################################
+# Create the singletons #
+concats = {table_name: SOEFConcat(table_name) for table_name in table_names}
+tables  = Tables(concats)
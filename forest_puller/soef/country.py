@@ -16,11 +16,10 @@ Typically you can use this class like this:
 # Built-in modules #
 
 # Internal modules #
-from forest_puller import cache_dir
-from forest_puller.soef.area_by_forest_type import AreaByType
-from forest_puller.soef.table_parser        import ForestArea, AgeDist, Fellings
-from forest_puller.soef.growing_stock       import Stock, GrowingStockComp, StockByType
-from forest_puller.common                   import country_codes
+import forest_puller
+from forest_puller.soef.specs    import registry
+from forest_puller.soef.workbook import Workbook
+from forest_puller.common        import extra_data, lazy_attributes
 
 # First party modules #
 from plumbing.cache import property_cached
@@ -47,30 +46,38 @@ class Country:
     def tables(self):
         return [self.forest_area, self.age_dist, self.fellings]
 
-    #------------------------------ Tables -----------------------------------#
-    @property_cached
-    def forest_area(self):   return ForestArea(self)
-
-    @property_cached
-    def area_by_type(self):  return AreaByType(self)
-
-    @property_cached
-    def age_dist(self):      return AgeDist(self)
-
-    @property_cached
-    def fellings(self):      return Fellings(self)
-
     @property_cached
-    def stock(self):         return Stock(self)
-
-    @property_cached
-    def stock_by_type(self): return StockByType(self)
+    def workbook(self):
+        """The excel file, opened only once for all tables."""
+        return Workbook(self.xls_file)
 
+    #------------------------------ Tables -----------------------------------#
     @property_cached
-    def stock_comp(self):    return GrowingStockComp(self)
+    def parsers(self):
+        """Every table parser created so far, indexed by short name."""
+        return {}
+
+    def table(self, short_name):
+        """
+        Return the object that parses one of the tables declared in
+        `forest_puller.soef.specs`, e.g. 'forest_area'.
+        """
+        if short_name not in self.parsers:
+            self.parsers[short_name] = registry[short_name].compile(self)
+        return self.parsers[short_name]
+
+    def __getattr__(self, name):
+        """Every registered table is also available as an attribute."""
+        if name in registry: return self.table(name)
+        raise AttributeError("%r object has no attribute %r" % (self.__class__.__name__, name))
 
 ###############################################################################
-# Create every country object #
-cache_path    = cache_dir + 'soef/xls/'
-all_countries = [Country(iso2, cache_path) for iso2 in country_codes['iso2_code']]
-countries     = {c.iso2_code: c for c in all_countries}
\ No newline at end of file
+def create_countries():
+    """Create every country object."""
+    cache_path    = forest_puller.cache_dir + 'soef/xls/'
+    all_countries = [Country(iso2, cache_path) for iso2 in extra_data.country_codes['iso2_code']]
+    countries     = {c.iso2_code: c for c in all_countries}
+    return {'all_countries': all_countries, 'countries': countries}
+
+# They are only created when first accessed #
+__getattr__ = lazy_attributes(__name__, ('all_countries', 'countries'), create_countries)
\ No newline at end of file
@@ -18,100 +18,20 @@ Typically you can use this class like this:
 # Built-in modules #
 
 # Internal modules #
-from forest_puller.soef.table_parser import TableParser
+from forest_puller.soef.table_parser import SpecTable
+from forest_puller.store import property_stored_at
 
 # First party modules #
-from plumbing.cache import property_cached, property_pickled_at
 
 # Third party modules #
 import pandas
 
 ###############################################################################
-class Stock(TableParser):
-
-    sheet_name    = "1.2"
-    title         = "Table 1.2a: Growing stock"
-    short_name    = "stock"
-    header_len    = 4
-    fixed_end_col = 5
-
-###############################################################################
-class StockByType(TableParser):
-
-    sheet_name    = "1.2"
-    title         = "Table 1.2b: Growing stock by forest type"
-    short_name    = "stock_by_type"
-    header_len    = 3
-    fixed_end_col = 5
-
-    @property_cached
-    def end_row(self):
-        return self.start_row + 6
-
-    @property_cached
-    def header(self):
-        """Return the years as integers."""
-        # Load only the first few rows #
-        df = self.cropped_sheet.iloc[0:self.header_len]
-        # Last row is always just NaNs #
-        df = df[1:-1].copy()
-        # Sometimes we get years in the columns #
-        df = df.apply(pandas.to_numeric, errors='ignore', downcast='integer')
-        # Make as list #
-        df = list(df.iloc[0])
-        # Dropped category #
-        df[0] = 'category'
-        # Return #
-        return df
-
-    @property_pickled_at('df_cache_path')
-    def df(self):
-        """
-        Special parsing, as the years are columns here.
-        """
-        # Load but skip the header #
-        df = self.cropped_sheet.iloc[self.header_len:].copy()
-        # Reset index #
-        df = df.reset_index(drop=True)
-        # Add columns #
-        df.columns = self.header
-        # Melt #
-        df = df.melt(id_vars    = ['category'],
-                     var_name   = 'year',
-                     value_name = 'stock')
-        # Make the year numeric #
-        df['year'] = df['year'].astype('int')
-        # Make the stock a float #
-        df['stock'] = df['stock'].astype('float')
-        # Make the stock in cubic meters #
-        df['stock'] = df['stock'] * 1e6
-        # Rename the rows #
-        replacements = (('Predominantly coniferous forest',   'con'),
-                        ('Predominantly broadleaved forest',  'broad'),
-                        ('Mixed forest',                      'mixed'))
-        # Rename all items (see docstring) #
-        for orig, dest in replacements:
-            df['category'] = df['category'].replace(to_replace = orig,
-                                                    value      = dest)
-        # Return #
-        return df
-
-###############################################################################
-class GrowingStockComp(TableParser):
-
-    sheet_name    = "1.2"
-    title         = "Table 1.2c: Growing stock composition"
-    short_name    = "stock_comp"
-    header_len    = 2
-    fixed_end_col = 7
-    start_offset  = 1
-
-    @property_cached
-    def end_row(self):
-        for i, row in self.full_sheet.iterrows():
-            if i <= self.start_row + 3:         continue
-            if row.iloc[0].startswith("Note:"): return i
-        self.raise_exception("Could not find the end row of the table.")
+class GrowingStockComp(SpecTable):
+    """
+    The table itself is declared in `forest_puller.soef.specs` but the
+    parsing is special.
+    """
 
     @property
     def stock_comp(self):
@@ -142,13 +62,13 @@ class GrowingStockComp(TableParser):
         # Remove empty values #
         df = df.query("growing_stock==growing_stock").copy()
         # Sanitize names #
-        df.iloc[:, 0:2] = df.iloc[:, 0:2].applymap(self.sanitize)
+        df.iloc[:, 0:2] = df.iloc[:, 0:2].map(self.sanitize)
         # Sanitize the rank column #
         df['rank'] = df['rank'].apply(self.sanitize_rank)
         # Return #
         return df
 
-    @property_pickled_at('df_cache_path')
+    @property_stored_at('df_cache_path', inputs='df_inputs', version=3)
     def df(self):
         """
         Return the stock_composition as is, unless we are Germany.
@@ -200,4 +120,14 @@ class GrowingStockComp(TableParser):
     @property
     def indexed(self):
         """Same as `self.df` but with an index on the first columns."""
-        return self.df.set_index(['rank', 'year'])
\ No newline at end of file
+        return self.df.set_index(['rank', 'year'])
+###############################################################################
+def __getattr__(name):
+    """
+    The old parsers of this module are now declared in `specs`, which
+    itself imports this module, so they are only looked up when needed.
+    """
+    if name in ('Stock', 'StockByType'):
+        from forest_puller.soef import specs
+        return getattr(specs, name)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
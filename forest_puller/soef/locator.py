@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+Typically you can use this class like this:
+
+    >>> from forest_puller.soef.country import countries
+    >>> locator = countries['AT'].workbook.locator('1.1')
+    >>> print(locator.find_title("Table 1.1a: Extent of forest and other wooded land"))
+"""
+
+# Built-in modules #
+
+# Internal modules #
+
+# First party modules #
+from plumbing.cache import property_cached
+
+# Third party modules #
+import numpy
+
+###############################################################################
+class SheetLocator:
+    """
+    Finds the boundaries of the tables embedded in an excel sheet. Instead of
+    looping over rows, every search is a boolean mask over the whole sheet,
+    computed once and shared by all tables of that sheet.
+
+    A cell counts as empty if it is NaN or if it contains -999, which is the
+    fill value the row by row searches used to compare with.
+    """
+
+    def __init__(self, sheet):
+        # The full sheet as a data frame #
+        self.sheet = sheet
+
+    def __repr__(self):
+        return '%s object of shape %s' % (self.__class__, self.sheet.shape)
+
+    #------------------------------- Masks -----------------------------------#
+    @property_cached
+    def empty_cells(self):
+        """A two dimensional boolean array, true for every empty cell."""
+        return (self.sheet.isna() | (self.sheet == -999)).to_numpy()
+
+    @property_cached
+    def empty_rows(self):
+        """True for every row that is completely empty."""
+        return self.empty_cells.all(axis=1)
+
+    @property_cached
+    def first_column(self):
+        """The first column of the sheet."""
+        return self.sheet.iloc[:, 0]
+
+    #------------------------------ Searches ---------------------------------#
+    @staticmethod
+    def first(mask, after=0):
+        """The first position where `mask` is true, starting at `after`."""
+        found = numpy.flatnonzero(mask[after:])
+        if len(found) == 0: return None
+        return int(found[0]) + after
+
+    def find_title(self, title):
+        """The first row whose first cell is exactly `title`."""
+        return self.first((self.first_column == title).to_numpy())
+
+    def first_empty_row(self, after):
+        """The first completely empty row starting at `after`."""
+        return self.first(self.empty_rows, after)
+
+    def first_empty_col(self, start_row, end_row):
+        """
+        The first column that is completely empty between `start_row` and
+        `end_row`. If there is none, returns the number of columns.
+        """
+        mask  = self.empty_cells[start_row:end_row].all(axis=0)
+        found = self.first(mask)
+        return mask.shape[0] if found is None else found
+
+    def first_prefix_row(self, prefix, after):
+        """The first row starting at `after` whose first cell starts with `prefix`."""
+        mask = self.first_column.astype(str).str.startswith(prefix).to_numpy()
+        return self.first(mask, after)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+Typically you can use this submodule like this:
+
+    >>> from forest_puller.soef.parallel import build_all
+    >>> tables = build_all(processes=8)
+    >>> print(tables['forest_area'])
+"""
+
+# Built-in modules #
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Internal modules #
+from forest_puller.soef.concat import table_names
+from forest_puller.soef.specs import plans
+
+# First party modules #
+
+# Third party modules #
+from tqdm import tqdm
+
+###############################################################################
+def parse_one(iso2_code, rerun=False):
+    """
+    Parse and store every table of a single country, opening its excel
+    file only once. This is the function that runs inside each worker
+    process. Returns the names of the tables that were parsed.
+    """
+    # Import #
+    from forest_puller.soef.country import countries
+    # Find the country object #
+    country = countries[iso2_code]
+    # Every table shares the same workbook, go sheet by sheet #
+    parsed = []
+    for specs in plans.values():
+        for spec in specs:
+            table = country.table(spec.short_name)
+            prop  = type(table).df
+            if not rerun and prop.is_fresh(table): continue
+            prop.compute(table)
+            parsed.append(spec.short_name)
+    # Free memory #
+    country.workbook.release()
+    # Return #
+    return iso2_code, parsed
+
+###############################################################################
+def build_all(countries=None, processes=None, rerun=False):
+    """
+    Parse every table of every country (or only of the `countries` given as
+    ISO2 codes) on a pool of `processes` workers, with one task per country.
+    By default the pool has one worker per CPU. Tables that are already
+    stored and up to date are skipped unless `rerun` is true.
+
+    Once all tables are stored, each table is concatenated for all countries
+    and the result is returned as a dictionary of data frames.
+    """
+    # Import #
+    from forest_puller.soef.country import all_countries
+    from forest_puller.soef.concat import concats
+    # Pick countries #
+    chosen = [c for c in all_countries if countries is None or c.iso2_code in countries]
+    if not chosen: return {}
+    # Default number of processes #
+    if processes is None: processes = os.cpu_count()
+    # Run #
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        futures  = [pool.submit(parse_one, c.iso2_code, rerun) for c in chosen]
+        progress = tqdm(as_completed(futures), total=len(futures), desc='SOEF countries')
+        for future in progress: future.result()
+    # The objects of this process might have an outdated value in memory #
+    for c in chosen:
+        for table_name in table_names:
+            c.table(table_name).__dict__.get('__cache__', {}).pop('df', None)
+    # Concatenate each table once #
+    codes = [c.iso2_code for c in chosen]
+    if countries is None: codes = None
+    for concat in concats.values(): concat.memo.clear()
+    return {name: concats[name].select(countries=codes) for name in table_names}
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+Every table we extract from the SOEF excel files is declared here. To pull
+a new table, simply register a new specification, for instance:
+
+    register(TableSpec('carbon_stock',
+                       sheet_name = "1.4a",
+                       title      = "Table 1.4a: Carbon stock",
+                       header_len = 3))
+
+It then becomes available as an attribute of every `Country` object and
+is included in `forest_puller.soef.concat`:
+
+    >>> from forest_puller.soef.country import countries
+    >>> print(countries['AT'].carbon_stock.df)
+
+The tables are also grouped by sheet in `plans`, which is the order that
+`forest_puller.soef.parallel` parses them in, so each sheet is only decoded
+and searched once per country.
+"""
+
+# Built-in modules #
+from collections import OrderedDict
+
+# Internal modules #
+from forest_puller.soef.table_parser  import SpecTable
+from forest_puller.soef.growing_stock import GrowingStockComp
+
+# First party modules #
+
+# Third party modules #
+
+###############################################################################
+class TableSpec:
+    """
+    Declares where a table is located in a sheet and how to parse it.
+
+    * `sheet_name`: The name of the excel sheet containing the table.
+    * `title`: The exact text of the cell just above the table.
+    * `header_len`: The number of rows that make up the header.
+    * `fixed_end_col`: The column at which the table ends, if known.
+    * `fixed_end_row`: The row at which the table ends, if known.
+    * `n_rows`: Else, the number of rows after the title, if known.
+    * `end_prefix`: Else, the text that the row below the table starts with.
+      If none of these three are given, the table ends at the first empty row.
+    * `start_offset`: A number of rows to skip after the title.
+    * `header_fix`: A dictionary of column positions to column names
+      used to standardize names that differ between countries.
+    * `melt`: If the years are columns, the name of the value column once the
+      table is reshaped to have one row per category and year.
+    * `factor`: For melted tables, a factor to convert the units.
+    * `renames`: For melted tables, a dictionary to rename categories.
+    * `parser`: The class that parses the table, for special cases.
+    """
+
+    def __init__(self, short_name, sheet_name, title, header_len,
+                 fixed_end_col = None,
+                 fixed_end_row = None,
+                 n_rows        = None,
+                 end_prefix    = None,
+                 start_offset  = None,
+                 header_fix    = None,
+                 melt          = None,
+                 factor        = None,
+                 renames       = None,
+                 parser        = SpecTable):
+        # Location #
+        self.short_name    = short_name
+        self.sheet_name    = sheet_name
+        self.title         = title
+        self.header_len    = header_len
+        self.fixed_end_col = fixed_end_col
+        self.fixed_end_row = fixed_end_row
+        self.n_rows        = n_rows
+        self.end_prefix    = end_prefix
+        self.start_offset  = start_offset
+        # Formatting #
+        self.header_fix    = header_fix or {}
+        self.melt          = melt
+        self.factor        = factor
+        self.renames       = renames or {}
+        # Parsing #
+        self.parser        = parser
+
+    def __repr__(self):
+        return '%s "%s" of sheet "%s"' % (self.__class__, self.short_name, self.sheet_name)
+
+    def compile(self, country):
+        """Create the object that extracts this table for a given country."""
+        return self.parser(country, self)
+
+###############################################################################
+# Every table by short name, in order of registration #
+registry = OrderedDict()
+
+# Every table grouped by the sheet they are found in #
+plans = OrderedDict()
+
+def register(spec):
+    """Add a table to the registry and to the plan of its sheet."""
+    if spec.short_name in registry:
+        raise ValueError("The table '%s' is already registered." % spec.short_name)
+    registry[spec.short_name] = spec
+    plans.setdefault(spec.sheet_name, []).append(spec)
+    return spec
+
+###############################################################################
+# The names of the forest types in the tables by type #
+forest_types = {'Predominantly coniferous forest':  'con',
+                'Predominantly broadleaved forest': 'broad',
+                'Mixed forest':                     'mixed'}
+
+#-----------------------------------------------------------------------------#
+register(TableSpec('forest_area',
+                   sheet_name    = "1.1",
+                   title         = "Table 1.1a: Forest area",
+                   header_len    = 2,
+                   fixed_end_col = 3))
+
+register(TableSpec('age_dist',
+                   sheet_name    = "1.3a",
+                   title         = "Table 1.3a1: Age class distribution (area of even-aged stands)",
+                   header_len    = 3,
+                   fixed_end_col = 7,
+                   fixed_end_row = 30,
+                   header_fix    = {2: "Total area (1000 ha)"}))
+
+register(TableSpec('fellings',
+                   sheet_name    = "3.1",
+                   title         = "Table 3.1: Increment and fellings",
+                   header_len    = 4,
+                   fixed_end_col = 7,
+                   fixed_end_row = 15))
+
+register(TableSpec('stock',
+                   sheet_name    = "1.2",
+                   title         = "Table 1.2a: Growing stock",
+                   header_len    = 4,
+                   fixed_end_col = 5))
+
+register(TableSpec('stock_comp',
+                   sheet_name    = "1.2",
+                   title         = "Table 1.2c: Growing stock composition",
+                   header_len    = 2,
+                   fixed_end_col = 7,
+                   start_offset  = 1,
+                   end_prefix    = "Note:",
+                   parser        = GrowingStockComp))
+
+register(TableSpec('area_by_type',
+                   sheet_name    = "1.1",
+                   title         = "Table 1.1b: Forest area by forest types",
+                   header_len    = 3,
+                   fixed_end_col = 5,
+                   n_rows        = 6,
+                   melt          = 'area',
+                   factor        = 1000,
+                   renames       = forest_types))
+
+register(TableSpec('stock_by_type',
+                   sheet_name    = "1.2",
+                   title         = "Table 1.2b: Growing stock by forest type",
+                   header_len    = 3,
+                   fixed_end_col = 5,
+                   n_rows        = 6,
+                   melt          = 'stock',
+                   factor        = 1e6,
+                   renames       = forest_types))
+
+###############################################################################
+def legacy_parser(short_name, class_name):
+    """
+    Create a class that is instantiated with only a country, like the
+    parsers that existed before the registry, e.g. `Stock(country)`.
+    The parameters of the table still come from the registry.
+    """
+    spec = registry[short_name]
+    def __init__(self, country): spec.parser.__init__(self, country, spec)
+    attributes = {'__init__':      __init__,
+                  '__module__':    __name__,
+                  'sheet_name':    spec.sheet_name,
+                  'title':         spec.title,
+                  'short_name':    spec.short_name,
+                  'header_len':    spec.header_len,
+                  'fixed_end_col': spec.fixed_end_col,
+                  'fixed_end_row': spec.fixed_end_row,
+                  'start_offset':  spec.start_offset}
+    return type(class_name, (spec.parser,), attributes)
+
+#-----------------------------------------------------------------------------#
+# So that the old imports keep working #
+ForestArea  = legacy_parser('forest_area',   'ForestArea')
+AgeDist     = legacy_parser('age_dist',      'AgeDist')
+Fellings    = legacy_parser('fellings',      'Fellings')
+Stock       = legacy_parser('stock',         'Stock')
+StockByType = legacy_parser('stock_by_type', 'StockByType')
+AreaByType  = legacy_parser('area_by_type',  'AreaByType')
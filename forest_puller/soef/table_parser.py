@@ -9,25 +9,17 @@ Unit D1 Bioeconomy.
 """
 
 # Built-in modules #
-import re
 
 # Internal modules #
-from forest_puller import cache_dir, module_dir
-from forest_puller.common import convert_row_names
+import forest_puller
+from forest_puller.common import convert_row_names, extra_data
+from forest_puller.store import property_stored_at
 
 # First party modules #
-from plumbing.cache import property_cached, property_pickled_at
+from plumbing.cache import property_cached
 
 # Third party modules #
-import pandas, numpy
-
-# Load column name mapping to short names #
-col_name_map = module_dir + 'extra_data/soef_columns.csv'
-col_name_map = pandas.read_csv(str(col_name_map))
-
-# Load row name mapping to short names #
-row_name_map = module_dir + 'extra_data/soef_rows.csv'
-row_name_map = pandas.read_csv(str(row_name_map))
+import numpy, pandas
 
 ###############################################################################
 class TableParser:
@@ -53,13 +45,13 @@ class TableParser:
         self.xls_file  = self.country.xls_file
         self.iso2_code = self.country.iso2_code
 
-    @property_cached
+    @property
     def full_sheet(self):
-        """Return the full sheet containing one or several tables."""
-        return pandas.read_excel(str(self.xls_file),
-                                 sheet_name = self.sheet_name,
-                                 header     = None,
-                                 na_values  = ["n.a.", "n./a.", "n. a. ", "n.a"])
+        """
+        Return the full sheet containing one or several tables.
+        It is shared with the other tables of the same country.
+        """
+        return self.country.workbook.sheet(self.sheet_name)
 
     def raise_exception(self, message):
         """Print a nice message for when we need to raise an exception."""
@@ -70,15 +62,20 @@ class TableParser:
         raise Exception(message)
 
     #------------------------------- Location --------------------------------#
+    @property
+    def locator(self):
+        """Finds tables within the sheet, shared with the other tables."""
+        return self.country.workbook.locator(self.sheet_name)
+
     @property_cached
     def start_row(self):
         """Determine where the table of interest starts within the sheet."""
         # You can manually add an offset to this value in the attributes #
         offset = 0 if self.start_offset is None else self.start_offset
         # Get the first cell that matches the title #
-        for i, row in self.full_sheet.iterrows():
-            if row[0] == self.title: return i+1+offset
-        self.raise_exception("Could not find the start row of the table.")
+        i = self.locator.find_title(self.title)
+        if i is None: self.raise_exception("Could not find the start row of the table.")
+        return i+1+offset
 
     @property_cached
     def end_row(self):
@@ -87,10 +84,9 @@ class TableParser:
         if self.fixed_end_row is not None: return self.fixed_end_row
         # Get the first completely empty row #
         # that is within at least 3 rows after the header #
-        for i, row in self.full_sheet.iterrows():
-            if i <= self.start_row + 3:       continue
-            if all(row.fillna(-999) == -999): return i
-        self.raise_exception("Could not find the end row of the table.")
+        i = self.locator.first_empty_row(after=self.start_row + 4)
+        if i is None: self.raise_exception("Could not find the end row of the table.")
+        return i
 
     @property
     def start_col(self):
@@ -103,11 +99,7 @@ class TableParser:
         # You can manually override this in the attributes #
         if self.fixed_end_col is not None: return self.fixed_end_col
         # Find the first completely empty column #
-        df = self.full_sheet.iloc[self.start_row:self.end_row]
-        for i, name in enumerate(df.columns):
-            column = df[name]
-            if all(column.fillna(-999) == -999): return i
-        return len(df.columns)
+        return self.locator.first_empty_col(self.start_row, self.end_row)
 
     @property_cached
     def cropped_sheet(self):
@@ -126,60 +118,93 @@ class TableParser:
         # Load only the first few rows #
         df = self.cropped_sheet.iloc[0:self.header_len]
         # Last row is always just NaNs #
-        df = df[:-1].copy()
+        df = df[:-1]
         # Fill from left to right (not top to bottom) #
-        df = df.T.fillna(method='ffill').T
+        df = df.ffill(axis=1)
         # Remaining NaNs are uninteresting #
-        df = df.fillna('')
+        df = df.fillna('').astype(str)
         # Concatenate from top to bottom #
-        df = list(' '.join(map(str,row.tolist())) for i, row in df.T.iterrows())
+        names = df.iloc[0].str.cat([df.iloc[i] for i in range(1, len(df))], sep=' ')
         # Remove any new lines #
-        df = [col.replace("\n", " ").strip() for col in df]
+        names = names.str.replace("\n", " ", regex=False).str.strip()
         # Sometimes there is a useless space in '1 000' #
-        df = [re.sub('1 000', '1000', col) for col in df]
+        names = names.str.replace('1 000', '1000', regex=False)
         # Apply custom fixes if one is specified #
-        df = self.header_fix(df)
+        df = self.header_fix(names.tolist())
         # Rename the fields to their short-version #
+        col_name_map = extra_data.soef_columns
         before = list(col_name_map['soef'])
         after  = list(col_name_map['forest_puller'])
         df     = pandas.Series(df).replace(before, after)
         # Sometimes we get years in the columns #
-        df = df.apply(pandas.to_numeric, errors='ignore', downcast='integer')
+        df = self.numbers_to_numeric(df)
         # Return #
         return df
 
+    @staticmethod
+    def numbers_to_numeric(names):
+        """
+        Convert the names that are numbers (e.g. '1990') to numbers and
+        leave all the others unchanged. Integral numbers become integers.
+        Empty names become NaN, as `pandas.to_numeric` parses them so.
+        """
+        # Parse everything that can be parsed #
+        numbers = pandas.to_numeric(names, errors='coerce')
+        found   = numbers.notna() | (names == '')
+        # Replace #
+        names = names.astype(object)
+        names[found] = numbers[found]
+        integral = found & (numbers == numbers.round())
+        names[integral] = [int(n) for n in numbers[integral]]
+        # Return #
+        return names
+
+    @staticmethod
+    def number_groups(vals):
+        """
+        A new group starts as soon as a value repeats within the current
+        group. For every row, we find at once the row where the next group
+        would start if a group started there. Then we only hop from one
+        group start to the next and number the groups with a cumsum.
+        """
+        # The position of the previous row with the same value, or -1 #
+        positions = pandas.Series(numpy.arange(len(vals)))
+        previous  = positions.groupby(vals.to_numpy(), dropna=False, sort=False).shift()
+        previous  = previous.fillna(-1).to_numpy(int)
+        # The first row whose value was already seen at or after each row #
+        repeats   = numpy.flatnonzero(previous >= 0)
+        following = numpy.full(len(vals) + 1, len(vals))
+        numpy.minimum.at(following, previous[repeats], repeats)
+        following = numpy.minimum.accumulate(following[::-1])[::-1]
+        # Mark the rows that start a group #
+        starts = numpy.zeros(len(vals), dtype=bool)
+        start  = 0
+        while start < len(vals): starts[start], start = True, following[start]
+        # Return #
+        return numpy.cumsum(starts) - 1
+
     @property_cached
     def merged_category(self):
-        """Category should be merged with all cells for every group of years."""
+        """
+        Category should be merged with all cells for every group of years.
+        A new group starts as soon as a year repeats, see `number_groups`.
+        """
         # Load but skip the header #
         df = self.cropped_sheet.iloc[self.header_len:].copy()
         # Reset index #
         df = df.reset_index(drop=True)
-        # Initialize #
-        seen  = set()
-        start = 0
-        text  = ""
-        # Loop #
-        for i, row in df.iterrows():
-            # Parse new row #
-            cat = row.iloc[0]
-            val = row.iloc[1]
-            # Have we hit a new category? #
-            if val in seen:
-                df.iloc[start:i, 0] = text
-                seen  = set()
-                start = i+1
-                text  = ""
-            # Accumulate category text #
-            if cat is not numpy.nan: text += str(cat)
-            # Add value to seen #
-            seen.add(val)
-        # Last group #
-        df.iloc[start:, 0] = text
+        # The category and year columns #
+        cats, vals = df.iloc[:, 0], df.iloc[:, 1]
+        # Number each group #
+        groups = self.number_groups(vals)
+        # Concatenate all the category text found within each group #
+        text = cats.fillna('').astype(str).groupby(groups).transform('sum')
+        # Assign #
+        df.iloc[:, 0] = text.astype(object).to_numpy()
         # Return #
         return df
 
-    @property_pickled_at('df_cache_path')
+    @property_stored_at('df_cache_path', inputs='df_inputs', version=3)
     def df(self):
         """Return the table of interest correctly parsed and formatted."""
         # Load #
@@ -187,7 +212,10 @@ class TableParser:
         # Add columns #
         df.columns = self.header
         # Convert to short headers using col_name_map #
-        df = convert_row_names(df, row_name_map, col_name_map, 'soef')
+        df = convert_row_names(df,
+                               extra_data.soef_rows,
+                               extra_data.soef_columns,
+                               'soef')
         # The year column should be cast to integer #
         if 'year' in df.columns: df['year'] = pandas.to_numeric(df['year'])
         # Return #
@@ -209,10 +237,17 @@ class TableParser:
         return df
 
     #--------------------------------- Cache ---------------------------------#
+    @property
+    def df_inputs(self):
+        """The files that `self.df` is computed from."""
+        return [self.xls_file,
+                extra_data.path('soef_rows'),
+                extra_data.path('soef_columns')]
+
     @property
     def df_cache_path(self):
         """Specify where on the file system we will pickle the df property."""
-        path  = cache_dir + 'soef/df/' + self.country.iso2_code + '/'
+        path  = forest_puller.cache_dir + 'soef/df/' + self.country.iso2_code + '/'
         path += self.short_name + '.pickle'
         return path
 
@@ -220,37 +255,108 @@ class TableParser:
     def header_fix(self, df): return df
 
 ###############################################################################
-class ForestArea(TableParser):
+class SpecTable(TableParser):
+    """
+    A table parser whose parameters all come from a `TableSpec` instead of
+    subclass attributes. See `forest_puller.soef.specs` for the list of
+    tables and the meaning of each parameter.
+    """
 
-    sheet_name    = "1.1"
-    title         = "Table 1.1a: Forest area"
-    short_name    = "forest_area"
-    header_len    = 2
-    fixed_end_col = 3
+    def __init__(self, country, spec):
+        # Super #
+        super().__init__(country)
+        # The declaration of this table #
+        self.spec = spec
+        # The usual parameters #
+        self.sheet_name    = spec.sheet_name
+        self.title         = spec.title
+        self.short_name    = spec.short_name
+        self.header_len    = spec.header_len
+        self.fixed_end_col = spec.fixed_end_col
+        self.fixed_end_row = spec.fixed_end_row
+        self.start_offset  = spec.start_offset
+
+    def __repr__(self):
+        return '%s "%s" of %s' % (self.__class__, self.short_name, self.iso2_code)
 
-#-----------------------------------------------------------------------------#
-class AgeDist(TableParser):
+    #------------------------------- Location --------------------------------#
+    @property_cached
+    def end_row(self):
+        """Either a fixed number of rows, a note below, or an empty row."""
+        # A fixed number of rows after the title #
+        if self.spec.n_rows is not None: return self.start_row + self.spec.n_rows
+        # The first row starting with a given text #
+        if self.spec.end_prefix is not None:
+            i = self.locator.first_prefix_row(self.spec.end_prefix,
+                                              after=self.start_row + 4)
+            if i is None: self.raise_exception("Could not find the end row of the table.")
+            return i
+        # Otherwise the default #
+        return TableParser.end_row.func(self)
 
-    sheet_name    = "1.3a"
-    title         = "Table 1.3a1: Age class distribution (area of even-aged stands)"
-    short_name    = "age_dist"
-    header_len    = 3
-    fixed_end_col = 7
-    fixed_end_row = 30
+    #--------------------------------- Main ----------------------------------#
+    @property_cached
+    def header(self):
+        """When the years are columns, return them as integers."""
+        # The default case #
+        if self.spec.melt is None: return TableParser.header.func(self)
+        # Load only the first few rows #
+        df = self.cropped_sheet.iloc[0:self.header_len]
+        # Last row is always just NaNs #
+        df = df[1:-1].copy()
+        # Sometimes we get years in the columns #
+        df = self.numbers_to_numeric(df.iloc[0])
+        # Make as list #
+        df = list(df)
+        # Dropped category #
+        df[0] = 'category'
+        # Return #
+        return df
 
-    def header_fix(self, df):
-        """Fix some inconsistencies that are non-concordant between countries."""
-        # Fix the second element to be standardized #
-        df[2] = "Total area (1000 ha)"
+    @property_stored_at('df_cache_path', inputs='df_inputs', version=3)
+    def df(self):
+        """
+        Return the table of interest correctly parsed and formatted. When the
+        years are columns, the table is melted to have one row per category
+        and per year, the unit factor is applied and categories are renamed.
+        """
+        # The default case #
+        if self.spec.melt is None: return TableParser.df.func(self)
+        # Load but skip the header #
+        df = self.cropped_sheet.iloc[self.header_len:].copy()
+        # Reset index #
+        df = df.reset_index(drop=True)
+        # Add columns #
+        df.columns = self.header
+        # Melt #
+        value = self.spec.melt
+        df = df.melt(id_vars    = ['category'],
+                     var_name   = 'year',
+                     value_name = value)
+        # Make the year numeric #
+        df['year'] = df['year'].astype('int')
+        # Make the value a float #
+        df[value] = df[value].astype('float')
+        # Convert the units #
+        if self.spec.factor is not None: df[value] = df[value] * self.spec.factor
+        # Rename the categories #
+        if self.spec.renames: df['category'] = df['category'].replace(self.spec.renames)
         # Return #
         return df
 
-#-----------------------------------------------------------------------------#
-class Fellings(TableParser):
+    #--------------------------- Helper methods ------------------------------#
+    def header_fix(self, df):
+        """Force some column names that are non-concordant between countries."""
+        for i, name in self.spec.header_fix.items(): df[i] = name
+        return df
 
-    sheet_name    = "3.1"
-    title         = "Table 3.1: Increment and fellings"
-    short_name    = "fellings"
-    header_len    = 4
-    fixed_end_col = 7
-    fixed_end_row = 15
\ No newline at end of file
+###############################################################################
+def __getattr__(name):
+    """
+    The old parsers of this module are now declared in `specs`, which
+    itself imports this module, so they are only looked up when needed.
+    """
+    if name in ('ForestArea', 'AgeDist', 'Fellings'):
+        from forest_puller.soef import specs
+        return getattr(specs, name)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+Typically you can use this class like this:
+
+    >>> from forest_puller.soef.country import countries
+    >>> print(countries['AT'].workbook.sheet('1.1'))
+"""
+
+# Built-in modules #
+from collections import OrderedDict
+
+# Internal modules #
+from forest_puller.soef.locator import SheetLocator
+
+# First party modules #
+
+# Third party modules #
+import pandas
+
+###############################################################################
+# The workbooks that currently hold decoded sheets, least recently used first #
+open_workbooks = OrderedDict()
+
+# How many workbooks can hold decoded sheets at the same time #
+max_open = 4
+
+###############################################################################
+class Workbook:
+    """
+    Represents the excel file of one country. The file is opened only once
+    and every sheet is decoded only once, no matter how many `TableParser`
+    objects read from it. The sheets handed out are shared between all
+    parsers, so they should never be modified in place.
+
+    To keep memory usage bounded when looping over every country, only the
+    `max_open` most recently used workbooks keep their decoded sheets.
+    The others are released and will simply be read again if needed.
+    """
+
+    # Values found in excel cells #
+    na_values = ["n.a.", "n./a.", "n. a. ", "n.a"]
+
+    def __init__(self, xls_file):
+        # The path to the file #
+        self.xls_file = xls_file
+        # The open file, if it is open #
+        self.excel_file = None
+        # Every sheet decoded so far #
+        self.sheets = {}
+        # Every sheet locator created so far #
+        self.locators = {}
+
+    def __repr__(self):
+        return '%s object of "%s" with %i sheets' % (self.__class__, self.xls_file, len(self.sheets))
+
+    def sheet(self, sheet_name):
+        """Return the full contents of one sheet as a data frame."""
+        # Mark this workbook as the most recently used one #
+        self.touch()
+        # Decode the sheet once #
+        if sheet_name not in self.sheets:
+            if self.excel_file is None:
+                self.excel_file = pandas.ExcelFile(str(self.xls_file))
+            self.sheets[sheet_name] = self.excel_file.parse(sheet_name,
+                                                            header    = None,
+                                                            na_values = self.na_values)
+        # Return #
+        return self.sheets[sheet_name]
+
+    def locator(self, sheet_name):
+        """Return the object that finds tables within one sheet."""
+        sheet = self.sheet(sheet_name)
+        if sheet_name not in self.locators:
+            self.locators[sheet_name] = SheetLocator(sheet)
+        return self.locators[sheet_name]
+
+    def touch(self):
+        """Register this workbook and release the least recently used ones."""
+        open_workbooks.pop(id(self), None)
+        open_workbooks[id(self)] = self
+        while len(open_workbooks) > max_open:
+            _, oldest = open_workbooks.popitem(last=False)
+            oldest.release()
+
+    def release(self):
+        """Close the file and forget all decoded sheets."""
+        # Close #
+        if self.excel_file is not None: self.excel_file.close()
+        # Forget #
+        self.excel_file = None
+        self.sheets     = {}
+        self.locators   = {}
+        open_workbooks.pop(id(self), None)
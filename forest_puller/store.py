@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+By default, every data frame parsed from a data source is stored as a pickle
+file in the cache directory. If the environment variable `FOREST_PULLER_STORE`
+is set to `parquet` or `feather`, they are instead stored in a columnar
+format, next to where the pickle would have been:
+
+    /puller_cache/ipcc/df/AT:
+        1990.parquet
+        1991.parquet
+        ...
+
+Since every file holds one partition (e.g. a country and a year for the
+IPCC), a caller can prune partitions by only opening the files it needs, and
+project columns by reading only some of them:
+
+    $ export FOREST_PULLER_STORE=parquet
+    >>> from forest_puller.ipcc.year import Year
+    >>> from forest_puller.ipcc.country import countries
+    >>> year = countries['AT'].years[1990]
+    >>> print(Year.df.load(year, columns=['land_use', 'area']))
+
+The columnar formats require the `pyarrow` package, which can be installed
+with the `columnar` extra, e.g. `pip install forest_puller[columnar]`.
+Selecting them without it raises an error right away.
+
+A stored property can also declare the files it was computed from, as well as
+a version number for the parser. A hash of these inputs is then saved next to
+the data frame (e.g. `1990.pickle.key`) and the data frame is recomputed
+whenever the hash changes, e.g. when a source file is re-downloaded or
+when a mapping CSV is edited:
+
+    @property_stored_at('df_cache_path', inputs='df_inputs', version=2)
+    def df(self): ...
+"""
+
+# Built-in modules #
+import os, pickle, hashlib, importlib
+from abc import ABC, abstractmethod
+
+# Internal modules #
+from forest_puller.common import write_atomically
+
+# First party modules #
+from plumbing.cache import property_pickled
+from autopaths import Path
+
+# Third party modules #
+
+# The environment variable to choose the format #
+backend_var_name = "FOREST_PULLER_STORE"
+
+###############################################################################
+class Backend(ABC):
+    """
+    A way of writing data frames to disk and reading them back, possibly
+    only a subset of the columns. Subclasses implement `dump` and `load`.
+    """
+
+    # The file extension that replaces `.pickle` #
+    extension = None
+
+    # The package needed by this backend, if any #
+    requires = None
+
+    def __repr__(self): return '%s backend' % self.__class__.__name__
+
+    def path(self, pickle_path):
+        """Where the data frame that would be at `pickle_path` is stored."""
+        path = str(pickle_path)
+        if path.endswith('.pickle'): path = path[:-len('.pickle')]
+        return Path(path + self.extension)
+
+    def write(self, df, path):
+        """Write the data frame such that readers never see a partial file."""
+        return write_atomically(path, lambda temp_path: self.dump(df, temp_path))
+
+    def read(self, path, columns=None):
+        """Read the data frame, optionally keeping only some `columns`."""
+        df = self.load(str(path), columns)
+        if columns is not None: df = df[list(columns)]
+        return df
+
+    def check(self):
+        """Raise a clear error if the package this backend needs is missing."""
+        if self.requires is None: return
+        try: importlib.import_module(self.requires)
+        except ImportError:
+            msg = "The %s backend needs the '%s' package, install it with" \
+                  " `pip install forest_puller[columnar]`."
+            raise ImportError(msg % (self.__class__.__name__, self.requires))
+
+    @abstractmethod
+    def dump(self, df, path):
+        """Write the data frame `df` to `path`."""
+
+    @abstractmethod
+    def load(self, path, columns):
+        """Read the data frame at `path`, with only `columns` if possible."""
+
+#-----------------------------------------------------------------------------#
+class PickleBackend(Backend):
+    """The default. Reading always loads every column."""
+
+    extension = '.pickle'
+
+    def dump(self, df, path):
+        with open(path, 'wb') as handle: pickle.dump(df, handle)
+
+    def load(self, path, columns):
+        with open(path, 'rb') as handle: return pickle.load(handle)
+
+#-----------------------------------------------------------------------------#
+class ParquetBackend(Backend):
+    """Columns that are not requested are never decompressed."""
+
+    extension = '.parquet'
+    requires  = 'pyarrow'
+
+    def dump(self, df, path):
+        df.to_parquet(path, engine='pyarrow')
+
+    def load(self, path, columns):
+        import pandas
+        if columns is not None: columns = list(columns)
+        return pandas.read_parquet(path, engine='pyarrow', columns=columns)
+
+#-----------------------------------------------------------------------------#
+class FeatherBackend(Backend):
+    """
+    Faster to read than parquet but larger on disk. The feather format
+    can only store data frames that have a default index.
+    """
+
+    extension = '.feather'
+    requires  = 'pyarrow'
+
+    def dump(self, df, path):
+        df.to_feather(path)
+
+    def load(self, path, columns):
+        import pandas
+        if columns is not None: columns = list(columns)
+        return pandas.read_feather(path, columns=columns)
+
+#-----------------------------------------------------------------------------#
+# All the available backends #
+backends = {'pickle':  PickleBackend(),
+            'parquet': ParquetBackend(),
+            'feather': FeatherBackend()}
+
+def current_backend():
+    """The backend chosen with the environment variable."""
+    name = os.environ.get(backend_var_name, 'pickle')
+    if name not in backends:
+        msg = "The %s variable must be one of %s, not '%s'."
+        raise ValueError(msg % (backend_var_name, list(backends), name))
+    backends[name].check()
+    return backends[name]
+
+###############################################################################
+# The digest of every file hashed so far, with its size and modification time #
+digests = {}
+
+def file_digest(path):
+    """
+    Return a hash of the contents of a file, reusing the previous result if
+    the file has not been modified since. Objects that are not paths
+    can provide their own `digest` method. Returns `None` if the file is
+    missing.
+    """
+    # Objects that know their own digest #
+    if hasattr(path, 'digest'): return path.digest()
+    # Check the file #
+    path = str(path)
+    try: stat = os.stat(path)
+    except FileNotFoundError: return None
+    # Already hashed #
+    key = (path, stat.st_size, stat.st_mtime_ns)
+    if key in digests: return digests[key]
+    # Hash in chunks #
+    sha = hashlib.sha1()
+    with open(path, 'rb') as handle:
+        for chunk in iter(lambda: handle.read(2**20), b''): sha.update(chunk)
+    # Return #
+    digests[key] = sha.hexdigest()
+    return digests[key]
+
+###############################################################################
+class property_stored(property_pickled):
+    """
+    Same thing as `property_pickled_at` from the `plumbing` package, but only
+    for properties that return a data frame. The format on disk is chosen by
+    the current backend. In addition, the `load` method can read only some
+    columns of the stored data frame.
+
+    If `inputs` is given, it is the name of an attribute of the instance
+    returning the paths of all the files the data frame is computed from.
+    The stored data frame is then only used if its inputs and `version`
+    are unchanged. When some inputs are missing, as when only the cache was
+    cloned without the source files, the stored data frame is always used.
+    """
+
+    def __init__(self, func, at=None, inputs=None, version=0):
+        # Super #
+        super().__init__(func, at=at)
+        # Name of the attribute listing input files #
+        self.inputs  = inputs
+        # Increment this when the parsing code changes #
+        self.version = version
+
+    def __get__(self, instance, owner):
+        # If called from a class #
+        if instance is None: return self
+        # Does a cache exist for this instance? #
+        self.check_cache(instance)
+        # Is the answer in the cache? #
+        if self.name in instance.__cache__: return instance.__cache__[self.name]
+        # Is the answer already on the file system? #
+        backend = current_backend()
+        path    = backend.path(self.get_pickle_path(instance))
+        if self.is_fresh(instance): result = backend.read(path)
+        # If not we will compute it and store it #
+        else: result = self.compute(instance)
+        # Let's store the answer for later in the cache #
+        instance.__cache__[self.name] = result
+        # Return #
+        return result
+
+    def __set__(self, instance, value):
+        # Does a cache exist for this instance? #
+        self.check_cache(instance)
+        # Overwrite the value in memory and on disk #
+        instance.__cache__[self.name] = value
+        self.write(instance, value)
+
+    def __delete__(self, instance):
+        # Does a cache exist for this instance? #
+        self.check_cache(instance)
+        # Remove the key #
+        instance.__cache__.pop(self.name, None)
+        # And remove the files on disk #
+        backend = current_backend()
+        path    = backend.path(self.get_pickle_path(instance))
+        path.remove()
+        self.key_path(path).remove()
+
+    #------------------------------ Inputs -----------------------------------#
+    def key_path(self, path):
+        """Where the hash of the inputs is saved."""
+        return Path(str(path) + '.key')
+
+    def input_key(self, instance):
+        """
+        Hash the version number and the contents of every input file together.
+        Returns `None` if there are no inputs or if one of them is missing.
+        """
+        # No inputs specified #
+        if self.inputs is None: return None
+        # Start with the version #
+        sha = hashlib.sha1(('version %s' % self.version).encode())
+        # Add every file #
+        for path in getattr(instance, self.inputs):
+            digest = file_digest(path)
+            if digest is None: return None
+            sha.update(digest.encode())
+        # Return #
+        return sha.hexdigest()
+
+    def is_fresh(self, instance):
+        """
+        Is there a stored data frame that can be used? That is the case if it
+        exists and if it was computed from the same inputs.
+        """
+        # The stored data frame #
+        path = current_backend().path(self.get_pickle_path(instance))
+        if not path.exists: return False
+        # Nothing to compare with #
+        key = self.input_key(instance)
+        if key is None: return True
+        # Compare #
+        key_path = self.key_path(path)
+        if not key_path.exists: return False
+        return key_path.contents == key
+
+    #------------------------------ Methods ----------------------------------#
+    def write(self, instance, value):
+        """Store the data frame together with the hash of its inputs."""
+        backend = current_backend()
+        path    = backend.path(self.get_pickle_path(instance))
+        backend.write(value, path)
+        # Record the inputs #
+        key = self.input_key(instance)
+        if key is None: return
+        write_atomically(self.key_path(path), lambda temp_path: Path(temp_path).write(key))
+
+    def compute(self, instance):
+        """Compute the data frame and store it, ignoring what is on disk."""
+        result = self.func(instance)
+        self.write(instance, result)
+        return result
+
+    def load(self, instance, columns=None):
+        """
+        Return only the given `columns` of the data frame. If it is not
+        computed yet, we compute it and store it first. Otherwise, only those
+        columns are read from disk when the backend is columnar.
+        """
+        # In memory already #
+        cache = instance.__dict__.get('__cache__', {})
+        if self.name in cache:
+            df = cache[self.name]
+            return df if columns is None else df[list(columns)]
+        # On disk already #
+        if self.is_fresh(instance):
+            backend = current_backend()
+            path    = backend.path(self.get_pickle_path(instance))
+            return backend.read(path, columns)
+        # Compute it #
+        df = self.__get__(instance, type(instance))
+        return df if columns is None else df[list(columns)]
+
+###############################################################################
+def property_stored_at(at, inputs=None, version=0):
+    """
+    The name of another property must be given as a string. It will be called
+    on the instance to determine the path at which the pickle file would have
+    been written. The other backends only change its extension. See
+    `property_stored` for the meaning of `inputs` and `version`.
+    """
+    def wrapper(function):
+        return property_stored(function, at=at, inputs=inputs, version=version)
+    return wrapper
+
+###############################################################################
+def store_all(instances, name='df', rerun=False):
+    """
+    Compute and store the stored property called `name` of every instance
+    given, in one sweep, skipping those that are already up to date unless
+    `rerun` is true. The values are not kept in memory. Returns the list
+    of instances that were computed.
+    """
+    computed = []
+    for instance in instances:
+        prop = getattr(type(instance), name)
+        if not rerun and prop.is_fresh(instance): continue
+        prop.compute(instance)
+        instance.__dict__.get('__cache__', {}).pop(prop.name, None)
+        computed.append(instance)
+    return computed
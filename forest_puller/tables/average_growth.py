@@ -52,7 +52,7 @@ class AverageIncsToTons(Table):
         # Select relevant sources #
         df = df[df.source.isin(self.sources)]
         # Group #
-        group = df.groupby(['country', 'source'])
+        group = df.groupby(['country', 'source'], observed=True)
         # Average #
         result = group.aggregate({'gain_per_ha': 'mean',
                                   'loss_per_ha': 'mean'})
@@ -63,7 +63,7 @@ class MaxArea(Table):
         # Put each dataframe in a list #
         dfs = [getattr(area_comp_data, source) for source in self.source_names]
         # Function to group each one by country and do max on area #
-        fn = lambda d: d.groupby('country').aggregate({'area': 'max'})
+        fn = lambda d: d.groupby('country', observed=True).aggregate({'area': 'max'})
         # Apply that function to each source #
         dfs = [fn(df) for df in dfs]
         # Reset index #
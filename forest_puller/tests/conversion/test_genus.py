@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+This test suite can be run with pytest.
+Or you can import it individually:
+
+    >>> from forest_puller.tests.conversion.test_genus import test_parse_many
+    >>> print(test_parse_many())
+"""
+
+# Built-in modules #
+
+# Internal modules #
+from forest_puller.conversion.genus_npl import genus_parser
+
+# First party modules #
+
+# Third party modules #
+import numpy, pandas
+
+###############################################################################
+def test_parse_many():
+    """
+    Test that parsing a whole series of names gives the same result as
+    parsing them one by one, missing names having a 'missing' genus and
+    species.
+    """
+    names = genus_parser.test_cases + ['Pinus silvestris', '', '   ', numpy.nan,
+                                       'missing abies', 'Carpinus pinus', 'PICEA Abies',
+                                       'Larix missing', 'abies picea']
+    # One by one #
+    def parse_one(name):
+        if not isinstance(name, str): return 'missing', 'missing'
+        return genus_parser(name)
+    expected = [parse_one(name) for name in names]
+    # All at once #
+    index  = list(range(100 + len(names), 100, -1))
+    result = genus_parser.parse_many(pandas.Series(names, index=index))
+    assert list(zip(result['genus'], result['species'])) == expected
+    assert result['latin_name'].tolist()[:len(genus_parser.test_cases)] == genus_parser.test_cases
+    assert result.index.tolist() == index
+    # Only missing names, or no names at all #
+    result = genus_parser.parse_many([numpy.nan, None])
+    assert result['genus'].tolist() == result['species'].tolist() == ['missing', 'missing']
+    assert len(genus_parser.parse_many([])) == 0
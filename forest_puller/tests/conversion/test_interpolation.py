@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+This test suite can be run with pytest.
+Or you can import it individually:
+
+    >>> from forest_puller.tests.conversion.test_interpolation import test_interpolation
+    >>> print(test_interpolation())
+"""
+
+# Built-in modules #
+
+# Internal modules #
+from forest_puller.interpolation import Interpolator
+
+# First party modules #
+
+# Third party modules #
+import numpy, pandas, pytest
+
+###############################################################################
+def interpolate_one(known_years, known_values, years, policy):
+    """The same interpolation for a single country and a single column."""
+    valid = ~numpy.isnan(known_values)
+    x, v  = known_years[valid], known_values[valid]
+    if len(x) == 0: return numpy.full(len(years), numpy.nan)
+    result = []
+    for t in years:
+        if policy == 'nearest':
+            result.append(v[numpy.argmin(numpy.abs(x - t))])
+        elif policy == 'extrapolate' and len(x) > 1 and t < x[0]:
+            result.append(v[0] + (t - x[0]) * (v[1] - v[0]) / (x[1] - x[0]))
+        elif policy == 'extrapolate' and len(x) > 1 and t > x[-1]:
+            result.append(v[-1] + (t - x[-1]) * (v[-1] - v[-2]) / (x[-1] - x[-2]))
+        else:
+            result.append(numpy.interp(t, x, v))
+    return numpy.array(result)
+
+###############################################################################
+def test_interpolation():
+    # A few countries with the SOEF years, one of them has a single year #
+    df = pandas.DataFrame({'country': ['AT', 'AT', 'AT', 'BE', 'FR', 'FR', 'FR'],
+                           'year':    [1990, 2000, 2010, 2005, 2000, 1990, 2005],
+                           'density': [1.0,  2.0,  4.0,  7.0,  3.0,  numpy.nan, 5.0],
+                           'ratio':   [0.1,  numpy.nan, 0.3, numpy.nan, 0.2, 0.4, 0.6]})
+    years  = range(1985, 2016)
+    interpolator = Interpolator()
+    # Explicit values at the edges and in between #
+    linear = interpolator(df, years, policy='linear').set_index(['country', 'year'])
+    assert linear.loc[('AT', 1985), 'density'] == 1.0
+    assert linear.loc[('AT', 1995), 'density'] == 1.5
+    assert linear.loc[('AT', 2015), 'density'] == 4.0
+    assert linear.loc[('BE', 1985), 'density'] == 7.0
+    assert numpy.isnan(linear.loc[('BE', 2015), 'ratio'])
+    nearest = interpolator(df, years, policy='nearest').set_index(['country', 'year'])
+    assert nearest.loc[('AT', 1995), 'density'] == 1.0
+    assert nearest.loc[('AT', 1996), 'density'] == 2.0
+    extrapolate = interpolator(df, years, policy='extrapolate').set_index(['country', 'year'])
+    assert extrapolate.loc[('AT', 1985), 'density'] == 0.5
+    assert extrapolate.loc[('AT', 2015), 'density'] == 5.0
+    assert extrapolate.loc[('BE', 2015), 'density'] == 7.0
+    # Every country and column is the same as interpolating it alone #
+    for policy in Interpolator.policies:
+        result = interpolator(df, years, policy=policy)
+        assert len(result) == 3 * len(years)
+        for country, group in df.groupby('country', sort=False):
+            group = group.sort_values('year')
+            rows  = result[result['country'] == country]
+            assert rows['year'].tolist() == list(years)
+            for column in ['density', 'ratio']:
+                expected = interpolate_one(group['year'].to_numpy(float),
+                                           group[column].to_numpy(float),
+                                           numpy.array(years, dtype=float), policy)
+                numpy.testing.assert_allclose(rows[column].to_numpy(), expected)
+    # The same question gives the same answer #
+    assert interpolator(df, years) is interpolator(df, years)
+    # An unknown policy is an error #
+    with pytest.raises(ValueError): interpolator(df, years, policy='cubic')
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+This test suite can be run with pytest.
+Or you can import it individually:
+
+    >>> from forest_puller.tests.conversion.test_interval_lookup import test_interval_lookup
+    >>> print(test_interval_lookup())
+"""
+
+# Built-in modules #
+
+# Internal modules #
+from forest_puller.conversion.load_expansion_factor import root_coefs, root_lookup
+
+# First party modules #
+
+# Third party modules #
+import numpy, pandas
+
+###############################################################################
+def test_interval_lookup():
+    """
+    Test that the coefficients picked for a whole column are the same as
+    when querying the table one row at a time.
+    """
+    # Some stock values, including bounds, NaNs and an unknown forest type #
+    df = pandas.DataFrame({'climatic_zone': ['temperate'] * 5 + ['boreal', 'boreal'],
+                           'forest_type':   ['con', 'con', 'con', 'broad', 'pines', 'broad', 'con'],
+                           'stock_per_ha':  [50.0, 50.5, 300.0, numpy.nan, 10.0, 0.0, 75.0]})
+    # One query per row #
+    def query_one(row):
+        coefs = root_coefs.query("climatic_zone == @row.climatic_zone")
+        coefs = coefs.query("forest_type == @row.forest_type")
+        coefs = coefs.query("lower < @row.stock_per_ha <= upper")
+        return coefs['ratio'].iloc[0] if len(coefs) else numpy.nan
+    expected = df.apply(query_one, axis=1)
+    # All rows at once #
+    provided = root_lookup.resolve(df, 'stock_per_ha', ['ratio'])['ratio']
+    # Compare #
+    assert provided.tolist()[:3] == [0.40, 0.29, 0.20]
+    pandas.testing.assert_series_equal(expected, provided, check_names=False)
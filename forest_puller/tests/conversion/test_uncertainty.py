@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+This test suite can be run with pytest.
+Or you can import it individually:
+
+    >>> from forest_puller.tests.conversion.test_uncertainty import test_uncertainty
+    >>> print(test_uncertainty())
+"""
+
+# Built-in modules #
+
+# Internal modules #
+from forest_puller.conversion.carbon      import CarbonConverter
+from forest_puller.conversion.uncertainty import MonteCarlo
+
+# First party modules #
+
+# Third party modules #
+import numpy, pandas, pytest
+
+###############################################################################
+def test_uncertainty():
+    """
+    Test that, without any spread, every quantile is the point estimate of
+    the converter, and that the net is the sum of the gain and the loss.
+    """
+    # Coefficients of two countries #
+    index     = pandas.MultiIndex.from_product([['AT', 'BE'], [2000, 2001]],
+                                               names=['country', 'year'])
+    converter = CarbonConverter()
+    converter.__cache__ = {'coefs': pandas.DataFrame({'bcefi':      [0.5, 0.6, 0.7, 0.8],
+                                                      'bcefr':      [0.9, 1.0, 1.1, 1.2],
+                                                      'bcefs':      [1.3, 1.4, 1.5, 1.6],
+                                                      'root_ratio': [0.2, 0.3, 0.2, 0.3]},
+                                                     index=index)}
+    # Volumes over and under bark, and values already in tons #
+    df = pandas.DataFrame({'country':  ['AT', 'AT', 'AT', 'BE', 'BE', 'BE', 'BE'],
+                           'year':     [2000, 2000, 2000, 2001, 2001, 2001, 2001],
+                           'variable': ['gain_per_ha', 'net_per_ha', 'loss_per_ha',
+                                        'gain_per_ha', 'loss_per_ha', 'net_per_ha', 'gain_per_ha'],
+                           'value':    [4.0, 1.0, -3.0, 5.0, -2.0, 3.0, 7.0],
+                           'unit':     ['m3 ob per ha'] * 3 + ['m3 ub per ha'] * 3 + ['tons per ha']})
+    df.insert(0, 'source', ['soef'] * 3 + ['fao'] * 3 + ['ipcc'])
+    # Almost no spread, the triangular distribution needs some width #
+    monte_carlo = MonteCarlo(converter)
+    monte_carlo.carbon_fraction_range = (0.47 - 1e-12, 0.47, 0.47 + 1e-12)
+    spreads = dict(bcef_spread=1e-12, root_spread=1e-12, bark_spread=1e-12)
+    result  = monte_carlo.quantiles(df, n_draws=20, seed=1, **spreads)
+    # Expected #
+    expected = converter.convert(df)['value'].to_numpy(copy=True)
+    expected[1] = expected[0] + expected[2]
+    expected[5] = expected[3] + expected[4]
+    # Compare #
+    for name in ['q0.05', 'q0.5', 'q0.95']:
+        assert numpy.allclose(result[name].to_numpy(), expected)
+    assert result['unit'].tolist() == ['tons per ha'] * 7
+    # The spreads have no default and must be sensible #
+    with pytest.raises(TypeError): monte_carlo.quantiles(df, n_draws=20)
+    with pytest.raises(ValueError, match='root_spread'):
+        monte_carlo.quantiles(df, n_draws=20, **dict(spreads, root_spread=1.5))
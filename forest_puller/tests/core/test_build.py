@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+This test suite can be run with pytest.
+Or you can import it individually:
+
+    >>> from forest_puller.tests.core.test_build import test_build
+    >>> print(test_build())
+"""
+
+# Built-in modules #
+import os
+
+# Internal modules #
+from forest_puller.build import Node, DataNode, Group, Scheduler
+
+# First party modules #
+
+# Third party modules #
+
+###############################################################################
+class FileNode(Node):
+    """Writes one file per item in a directory."""
+
+    def __init__(self, name, directory, items=('a', 'b'), deps=()):
+        super().__init__(name, deps)
+        self.directory = directory
+        self.keys      = list(items)
+
+    def items(self):         return self.keys
+    def outputs(self, item): return [os.path.join(self.directory, self.name + '_' + item)]
+    def run(self, item):
+        with open(self.outputs(item)[0], 'w') as handle: handle.write(item)
+
+###############################################################################
+def test_build(tmp_path):
+    # A small graph #
+    directory = str(tmp_path)
+    scheduler = Scheduler([FileNode('data',  directory, items=['x']),
+                           FileNode('fig',   directory, deps=['data']),
+                           FileNode('table', directory, deps=['data']),
+                           Group('report', deps=['fig', 'table'])])
+    # Dependencies come first #
+    order = scheduler.closure(['report'])
+    assert order.index('data') < order.index('fig') < order.index('report')
+    # Everything is built the first time, on two processes #
+    built = scheduler.build(['report'], processes=2, verbose=False)
+    assert sorted(built) == [('data', 'x'), ('fig', 'a'), ('fig', 'b'),
+                             ('table', 'a'), ('table', 'b')]
+    # Nothing the second time #
+    assert scheduler.plan(['report']) == []
+    assert scheduler.build(['report'], processes=1, verbose=False) == []
+    # A single item can be asked for #
+    assert scheduler.build(['fig'], processes=1, only='a', rerun=True, verbose=False) == \
+           [('data', 'x'), ('fig', 'a')]
+    # Changing the data makes what depends on it stale #
+    os.utime(os.path.join(directory, 'data_x'), (2e9, 2e9))
+    assert scheduler.plan(['report']) == [('fig', ['a', 'b']), ('table', ['a', 'b'])]
+
+###############################################################################
+def test_build_function(monkeypatch):
+    # The function of a data node gets the options of the build #
+    import forest_puller.soef.parallel
+    calls = []
+    monkeypatch.setattr(forest_puller.soef.parallel, 'build_all',
+                        lambda **options: calls.append(options))
+    scheduler = Scheduler([DataNode('soef',
+                                    function  = 'forest_puller.soef.parallel:build_all',
+                                    directory = 'soef/df/')])
+    scheduler.build(['soef'], processes=3, rerun=True, verbose=False)
+    scheduler.build(['soef'], processes=1, verbose=False)
+    assert calls == [dict(processes=3, rerun=True), dict(processes=1, rerun=False)]
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+This test suite can be run with pytest.
+Or you can import it individually:
+
+    >>> from forest_puller.tests.core.test_concat import test_concat
+    >>> print(test_concat())
+"""
+
+# Built-in modules #
+from types import SimpleNamespace
+
+# Internal modules #
+from forest_puller.common import Concat
+
+# First party modules #
+
+# Third party modules #
+import pandas, pytest
+
+###############################################################################
+class FakeConcat(Concat):
+    """Two countries with two years each."""
+
+    @property
+    def countries(self):
+        def country(code, value):
+            df = pandas.DataFrame({'country': code, 'year': [1990, 1991], 'value': value})
+            return SimpleNamespace(country_cols=df)
+        return {'AT': country('AT', 1.0), 'BE': country('BE', 2.0)}
+
+###############################################################################
+def test_concat():
+    # The countries must be defined #
+    with pytest.raises(TypeError): Concat()
+    concat = FakeConcat()
+    # A selection #
+    df = concat.select(countries=['BE'], years=[1991], columns=['country', 'value'])
+    assert df['country'].astype(str).tolist() == ['BE']
+    assert df['value'].tolist() == [2.0]
+    # Nothing matches, the columns are kept #
+    for criteria in [dict(countries=['LU']),
+                     dict(countries=['LU'], years=[1990], columns=['value']),
+                     dict(years=[2050], columns=['country', 'year'])]:
+        df = concat.select(**criteria)
+        assert len(df) == 0
+        assert list(df.columns) == list(criteria.get('columns', ['country', 'year']))
+    # Filtering the full data frame gives the same #
+    concat.df
+    assert len(concat.select(countries=['LU'], years=[1990])) == 0
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+This test suite can be run with pytest.
+Or you can import it individually:
+
+    >>> from forest_puller.tests.core.test_harmonized import test_harmonized
+    >>> print(test_harmonized())
+"""
+
+# Built-in modules #
+
+# Internal modules #
+from forest_puller.harmonized import HarmonizedStore
+
+# First party modules #
+
+# Third party modules #
+import pandas, pytest
+
+###############################################################################
+def test_harmonized():
+    # A store with small fake sources #
+    store = HarmonizedStore()
+    areas = pandas.DataFrame({'country': ['BE', 'AT', 'AT', 'BE'],
+                              'year':    [1990, 1991, 1990, 1991],
+                              'area':    [1.0,  2.0,  3.0,  4.0]})
+    cache = {source: store.forest_area(areas, source) for source in store.sources}
+    cache['increments'] = pandas.DataFrame({'source':   ['soef', 'faostat'],
+                                            'unit':     ['m3 ob per ha', 'm3 ub per ha'],
+                                            'country':  ['AT', 'AT'],
+                                            'year':     [1990, 1990],
+                                            'variable': ['gain_per_ha', 'loss_per_ha'],
+                                            'value':    [5.0, -6.0]})
+    store.__cache__ = cache
+    # Every selection is the same as filtering with a mask #
+    full = store.df.reset_index()[store.key + ['value']]
+    for criteria in [dict(variable='forest_area', country='AT'),
+                     dict(country=['AT', 'BE'], year=1991, source='fra'),
+                     dict(variable='loss_per_ha')]:
+        mask = pandas.Series(True, index=full.index)
+        for column, value in criteria.items():
+            mask &= full[column].isin(value if isinstance(value, list) else [value])
+        expected = full[mask].reset_index(drop=True)
+        pandas.testing.assert_frame_equal(store.select(**criteria), expected)
+    # Unknown values give nothing #
+    assert len(store.select(country='LU')) == 0
+    assert store.select(variable='forest_area', country='AT')['year'].min() == 1990
+
+###############################################################################
+def test_harmonized_faostat(monkeypatch):
+    # Rows shaped like the FAOSTAT land data frame, already in hectares #
+    from forest_puller.faostat.land.concat import concat
+    rows = pandas.DataFrame({'country': ['AT', 'AT', 'AT', 'BE'],
+                             'year':    [1990, 1991, 1990, 1990],
+                             'item':    ['Forest land', 'Forest land', 'Cropland', 'Forest land'],
+                             'element': ['Area', 'Area', 'Area', 'Area'],
+                             'flag':    ['A', 'A', 'A', 'F'],
+                             'unit':    ['hectares'] * 4,
+                             'value':   [3.0e6, 3.1e6, 1.0e6, 6.0e5]})
+    monkeypatch.setattr(concat, 'memo', {(None, None, None): rows})
+    # Only the official forest area is kept, the values are unchanged #
+    df = HarmonizedStore().faostat
+    assert df['value'].tolist() == [3.0e6, 3.1e6]
+    assert df['unit'].tolist()  == ['ha', 'ha']
+    # An unknown unit is an error #
+    monkeypatch.setattr(concat, 'memo', {(None, None, None): rows.assign(unit='acres')})
+    with pytest.raises(ValueError): HarmonizedStore().faostat
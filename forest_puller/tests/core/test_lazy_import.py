@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+This test suite can be run with pytest.
+Or you can import it individually:
+
+    >>> from forest_puller.tests.core.test_lazy_import import test_import_budget
+    >>> print(test_import_budget())
+"""
+
+# Built-in modules #
+import os, sys, json, tempfile, subprocess
+
+# Internal modules #
+from forest_puller import repos_dir
+
+# First party modules #
+
+# Third party modules #
+
+# The maximum number of seconds that importing is allowed to take #
+package_budget = 0.25
+sources_budget = 2.0
+
+# The modules that represent each data source #
+source_modules = ['forest_puller.ipcc.country',
+                  'forest_puller.soef.country',
+                  'forest_puller.faostat.forestry.country',
+                  'forest_puller.faostat.land.country',
+                  'forest_puller.hpffre.country',
+                  'forest_puller.fra.country']
+
+# The code that is run in a fresh interpreter #
+benchmark = """
+import sys, time, json
+t0 = time.perf_counter()
+import forest_puller
+t1 = time.perf_counter()
+pandas_loaded = 'pandas' in sys.modules
+for name in %r: __import__(name)
+t2 = time.perf_counter()
+import forest_puller.common
+print(json.dumps({'package':       t1 - t0,
+                  'sources':       t2 - t0,
+                  'pandas_loaded': pandas_loaded,
+                  'csv_loaded':    'country_codes' in vars(forest_puller.common),
+                  'cache_loaded':  'cache_dir' in vars(forest_puller)}))
+""" % source_modules
+
+###############################################################################
+def run_benchmark(cache_dir):
+    """Import the package in a new process and return the measurements."""
+    # Environment #
+    env = dict(os.environ)
+    env['FOREST_PULLER_LAZY']  = '1'
+    env['FOREST_PULLER_CACHE'] = cache_dir
+    env['PYTHONPATH'] = str(repos_dir) + os.pathsep + env.get('PYTHONPATH', '')
+    # Run #
+    output = subprocess.check_output([sys.executable, '-c', benchmark], env=env)
+    # Return #
+    return json.loads(output.decode().strip().split('\n')[-1])
+
+###############################################################################
+def test_import_budget():
+    """
+    Test that, in lazy mode, importing the package and every data source
+    has no side effects and stays within the time budget.
+    """
+    # A cache directory that does not exist yet #
+    cache_dir = os.path.join(tempfile.mkdtemp(), 'cache') + '/'
+    # Run #
+    result = run_benchmark(cache_dir)
+    # Nothing should have been done yet #
+    assert not os.path.exists(cache_dir)
+    assert not result['pandas_loaded']
+    assert not result['csv_loaded']
+    assert not result['cache_loaded']
+    # Check the budget #
+    assert result['package'] < package_budget
+    assert result['sources'] < sources_budget
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+This test suite can be run with pytest.
+Or you can import it individually:
+
+    >>> from forest_puller.tests.core.test_partition import test_partition
+    >>> print(test_partition())
+"""
+
+# Built-in modules #
+
+# Internal modules #
+from forest_puller.common import Partition
+
+# First party modules #
+
+# Third party modules #
+import pandas
+
+###############################################################################
+def test_partition():
+    # A small data frame with interleaved countries #
+    df = pandas.DataFrame({'country': ['AT', 'BE', 'AT', 'FR', 'BE', 'AT'],
+                           'year':    [1990, 1990, 1991, 1990, 1991, 1992],
+                           'value':   [1.0,  2.0,  3.0,  4.0,  5.0,  6.0]})
+    # Split it once #
+    parts = Partition(df)
+    assert sorted(parts) == ['AT', 'BE', 'FR']
+    # Every slice is the same as filtering with a mask #
+    for code in ['AT', 'BE', 'FR', 'LU']:
+        expected = df[df['country'] == code].drop(columns=['country'])
+        expected = expected.reset_index(drop=True)
+        pandas.testing.assert_frame_equal(parts[code], expected)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+This test suite can be run with pytest.
+Or you can import it individually:
+
+    >>> from forest_puller.tests.core.test_schema import test_schema
+    >>> print(test_schema())
+"""
+
+# Built-in modules #
+
+# Internal modules #
+from forest_puller.schema import schema
+
+# First party modules #
+
+# Third party modules #
+import pandas, pytest
+
+###############################################################################
+def test_schema():
+    # Labels that are known in advance and others that are not #
+    df = pandas.DataFrame({'country': ['SE', 'AT', 'LU', 'BE'],
+                           'source':  ['soef', 'ipcc', 'fra', 'ipcc'],
+                           'item':    ['Wood', 'Bark', 'Wood', 'Logs'],
+                           'year':    [1990, 1991, 1992, 1993],
+                           'value':   [1.0, 2.0, 3.0, 4.0]})
+    result = schema.apply(df)
+    # The input is not modified #
+    assert not isinstance(df['country'].dtype, pandas.CategoricalDtype)
+    # The categories are exactly the fixed ones, whatever the data #
+    countries = list(result['country'].cat.categories)
+    assert countries == sorted(schema.fixed_categories['country'])
+    assert countries == list(schema.apply(df[:1])['country'].cat.categories)
+    assert list(result['source'].cat.categories) == sorted(schema.sources)
+    assert result['country'].astype(str).tolist() == ['SE', 'AT', 'LU', 'BE']
+    # Without a fixed set, the labels found are used #
+    assert list(result['item'].cat.categories) == ['Bark', 'Logs', 'Wood']
+    # The categories sort like strings do #
+    sorted_cat = result.sort_values(['country', 'source'])['value'].tolist()
+    sorted_str = df.sort_values(['country', 'source'])['value'].tolist()
+    assert sorted_cat == sorted_str
+    # Whole years are compacted, the values are untouched #
+    assert result['year'].dtype == 'int16'
+    assert result['value'].dtype == 'float64'
+    # Years in the middle of two others are left as they are #
+    middle = schema.apply(df.assign(year=[1990.5, 1991.0, 1992.0, 1993.0]))
+    assert middle['year'].dtype == 'float64'
+    # Groups only contain the labels observed #
+    sums = result.groupby('country', observed=True)['value'].sum()
+    assert len(sums) == 4
+    # Missing labels stay missing #
+    missing = schema.apply(df.assign(source=['soef', None, 'fra', 'ipcc']))
+    assert missing['source'].isna().tolist() == [False, True, False, False]
+
+def test_unknown_labels():
+    df = pandas.DataFrame({'country': ['AT', 'ZZ'], 'source': ['ipcc', 'ipcc']})
+    with pytest.raises(ValueError, match="'country'.*'ZZ'"): schema.apply(df)
+    df = pandas.DataFrame({'country': ['AT', 'BE'], 'source': ['ipcc', 'other']})
+    with pytest.raises(ValueError, match="'source'.*'other'"): schema.apply(df)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+This test suite can be run with pytest.
+Or you can import it individually:
+
+    >>> from forest_puller.tests.core.test_store import test_invalidation
+    >>> print(test_invalidation())
+"""
+
+# Built-in modules #
+import os
+
+# Internal modules #
+from forest_puller.store import property_stored_at, backend_var_name
+from forest_puller.store import backends, current_backend
+
+# First party modules #
+
+# Third party modules #
+import pandas, pytest
+
+###############################################################################
+def make_class(directory, version):
+    """A class with a stored data frame computed from one input file."""
+    class Parsed:
+        calls = 0
+        def __init__(self): self.source = os.path.join(directory, 'source.csv')
+        @property
+        def df_inputs(self): return [self.source]
+        @property
+        def df_cache_path(self): return os.path.join(directory, 'df.pickle')
+        @property_stored_at('df_cache_path', inputs='df_inputs', version=version)
+        def df(self):
+            type(self).calls += 1
+            return pandas.read_csv(self.source)
+    return Parsed
+
+def test_invalidation(tmp_path, monkeypatch):
+    # Use the default backend #
+    monkeypatch.delenv(backend_var_name, raising=False)
+    directory = str(tmp_path)
+    source    = os.path.join(directory, 'source.csv')
+    other     = os.path.join(directory, 'other.csv')
+    with open(source, 'w') as handle: handle.write('a,b\n1,2\n')
+    with open(other,  'w') as handle: handle.write('x\n1\n')
+    # The first access computes and stores the data frame #
+    Parsed = make_class(directory, 1)
+    assert Parsed().df['a'].tolist() == [1]
+    assert Parsed.calls == 1
+    # A new instance reads it from disk #
+    assert Parsed().df['a'].tolist() == [1]
+    assert Parsed.calls == 1
+    # Touching the input or changing another file does not invalidate it #
+    os.utime(source, (1e9, 1e9))
+    with open(other, 'w') as handle: handle.write('x\n2\n')
+    Parsed().df
+    assert Parsed.calls == 1
+    # Changing the contents of the input does #
+    with open(source, 'w') as handle: handle.write('a,b\n3,4\n')
+    assert Parsed().df['a'].tolist() == [3]
+    assert Parsed.calls == 2
+    # And so does changing the version of the parser #
+    Parsed = make_class(directory, 2)
+    Parsed().df
+    assert Parsed.calls == 1
+    Parsed().df
+    assert Parsed.calls == 1
+    # Only some columns can be loaded from disk #
+    assert Parsed.df.load(Parsed(), columns=['b']).columns.tolist() == ['b']
+    assert Parsed.calls == 1
+
+###############################################################################
+def test_backend_selection(monkeypatch):
+    # The default is pickle #
+    monkeypatch.delenv(backend_var_name, raising=False)
+    assert current_backend() is backends['pickle']
+    # An unknown name is an error #
+    monkeypatch.setenv(backend_var_name, 'excel')
+    with pytest.raises(ValueError): current_backend()
+    # The columnar backends need pyarrow #
+    monkeypatch.setenv(backend_var_name, 'parquet')
+    try: import pyarrow
+    except ImportError:
+        with pytest.raises(ImportError, match='columnar'): current_backend()
+    else: assert current_backend() is backends['parquet']
+
+@pytest.mark.parametrize('name', ['pickle', 'parquet', 'feather'])
+def test_round_trip(name, tmp_path):
+    # Skip the columnar formats when pyarrow is missing #
+    backend = backends[name]
+    if backend.requires: pytest.importorskip(backend.requires)
+    # Write and read back #
+    df   = pandas.DataFrame({'country': ['AT', 'BE'], 'year': [1990, 1991],
+                             'area':    [1.5, 2.5]})
+    path = backend.path(str(tmp_path) + '/df.pickle')
+    backend.write(df, path)
+    assert str(path).endswith(backend.extension)
+    pandas.testing.assert_frame_equal(backend.read(path), df)
+    # Only some columns, in the order asked #
+    projected = backend.read(path, columns=['area', 'country'])
+    pandas.testing.assert_frame_equal(projected, df[['area', 'country']])
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+This test suite can be run with pytest.
+Or you can import it individually:
+
+    >>> from forest_puller.tests.faostat.test_faostat_loader import test_chunked_loader
+    >>> print(test_chunked_loader())
+"""
+
+# Built-in modules #
+import os, io, zipfile, tempfile
+
+# Internal modules #
+import forest_puller.faostat
+from forest_puller.faostat import read_faostat_csv, rename_labels
+
+# First party modules #
+
+# Third party modules #
+import pandas
+
+# A small extract of a normalized bulk CSV #
+csv_text = """Area Code,Area,Item Code,Item,Element Code,Element,Year Code,Year,Unit,Value,Flag
+11,Austria,1861,"Roundwood, coniferous",5516,Production,1990,1990,m3,100.0,
+11,Austria,1634,Veneer sheets,5516,Production,1990,1990,m3,5.0,
+11,Austria,1861,"Roundwood, coniferous",5922,Export Value,1991,1991,1000 US$,2.5,F
+231,United States of America,1861,"Roundwood, coniferous",5516,Production,1990,1990,m3,900.0,
+68,France,1861,"Roundwood, coniferous",5516,Production,1990,1990,m3,300.0,
+"""
+
+###############################################################################
+def test_chunked_loader(monkeypatch):
+    # Parse very small chunks so that there are several of them #
+    monkeypatch.setattr(forest_puller.faostat, 'chunk_size', 2)
+    # Write the archive #
+    with tempfile.TemporaryDirectory() as directory:
+        zip_path = os.path.join(directory, 'test.zip')
+        with zipfile.ZipFile(zip_path, 'w') as archive:
+            archive.writestr('test.csv', csv_text.encode('ISO-8859-1'))
+        # Filter while reading #
+        df = read_faostat_csv(zip_path, 'test.csv', 'ISO-8859-1',
+                              countries = ['Austria', 'France'],
+                              items     = ['Roundwood, coniferous'])
+    # Compare with filtering after reading #
+    expected = pandas.read_csv(io.StringIO(csv_text))
+    expected = expected.query("Area in ['Austria', 'France']")
+    expected = expected.query("Item == 'Roundwood, coniferous'")
+    assert df['Area'].tolist()  == expected['Area'].tolist()
+    assert df['Value'].tolist() == expected['Value'].tolist()
+    assert df['Year'].dtype     == 'int64'
+    # The text columns stay categorical with the categories of every chunk #
+    assert isinstance(df['Area'].dtype, pandas.CategoricalDtype)
+    assert sorted(df['Area'].cat.categories) == ['Austria', 'France']
+    assert df['Flag'].isna().tolist() == [True, False, True]
+
+###############################################################################
+def test_rename_labels():
+    values = pandas.Series(['1000 ha', 'ha', None, '1000 ha', 'kg'], dtype='category')
+    result = rename_labels(values, {'1000 ha': 'ha', 'kg': 'tons'})
+    expected = values.astype(object).replace({'1000 ha': 'ha', 'kg': 'tons'})
+    assert isinstance(result.dtype, pandas.CategoricalDtype)
+    assert sorted(result.cat.categories) == ['ha', 'tons']
+    assert result.tolist()[:2] == expected.tolist()[:2]
+    assert result.isna().tolist() == expected.isna().tolist()
+    assert result.tolist()[3:] == expected.tolist()[3:]
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+This test suite can be run with pytest.
+Or you can import it individually:
+
+    >>> from forest_puller.tests.ipcc.test_headers import test_known_layout
+    >>> print(test_known_layout())
+"""
+
+# Built-in modules #
+from types import SimpleNamespace
+
+# Internal modules #
+import forest_puller.ipcc.headers
+from forest_puller.ipcc.headers import Headers
+from forest_puller.common import extra_data
+
+# First party modules #
+
+# Third party modules #
+import pandas, pytest
+
+###############################################################################
+def make_year():
+    """
+    A fake year whose table 4.A only has a header, with the layout found in
+    the CRF files, where groups of columns are titled on the rows above.
+    """
+    names = list(extra_data.ipcc_columns['ipcc'])
+    names = [name[:-len('_per_area')] if name.endswith('_per_area') else name
+             for name in names]
+    raw = pandas.DataFrame([[None] * len(names)] * 10)
+    raw.iloc[5, 5]  = 'IMPLIED CARBON STOCK CHANGE FACTORS'
+    raw.iloc[5, 12] = 'CARBON STOCK CHANGES'
+    raw.iloc[7] = names
+    return SimpleNamespace(raw_table_4a=raw)
+
+###############################################################################
+def test_headers(monkeypatch):
+    # Start without any parsed layout #
+    monkeypatch.setattr(forest_puller.ipcc.headers, 'layouts', {})
+    headers = Headers(make_year())
+    # Every name maps, but the layout was never examined #
+    monkeypatch.setattr(Headers, 'known', set())
+    with pytest.raises(Exception, match=headers.fingerprint): headers.df
+    # Once registered it is parsed #
+    monkeypatch.setattr(Headers, 'known', {headers.fingerprint})
+    assert headers.df.tolist() == list(extra_data.ipcc_columns['forest_puller'])
+    # A registered layout with an unmapped column still raises #
+    year = make_year()
+    year.raw_table_4a.iloc[7, 2] = 'Something new'
+    headers = Headers(year)
+    monkeypatch.setattr(Headers, 'known', {headers.fingerprint})
+    with pytest.raises(Exception, match='Something new'): headers.df
+
+###############################################################################
+def test_known_layout(monkeypatch):
+    # The layout of the CRF files is in the registry, nothing is patched #
+    monkeypatch.setattr(forest_puller.ipcc.headers, 'layouts', {})
+    headers = Headers(make_year())
+    assert headers.fingerprint in set(extra_data.ipcc_layouts['fingerprint'])
+    assert headers.df.tolist() == list(extra_data.ipcc_columns['forest_puller'])
+    # A moved column changes the fingerprint #
+    year = make_year()
+    year.raw_table_4a.iloc[7, [2, 3]] = year.raw_table_4a.iloc[7, [3, 2]].to_numpy()
+    with pytest.raises(Exception, match='Unknown header layout'): Headers(year).df
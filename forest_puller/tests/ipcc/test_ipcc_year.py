@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+This test suite can be run with pytest.
+Or you can import it individually:
+
+    >>> from forest_puller.tests.ipcc.test_ipcc_year import test_year
+    >>> print(test_year())
+"""
+
+# Built-in modules #
+from types import SimpleNamespace
+
+# Internal modules #
+import forest_puller.ipcc.headers
+from forest_puller.ipcc.headers import Headers
+from forest_puller.ipcc.year import Year
+from forest_puller.common import extra_data
+
+# First party modules #
+
+# Third party modules #
+import numpy, pandas
+
+###############################################################################
+# The row by row version that `Year.df` replaces #
+def loop_df(raw, columns):
+    # The last row #
+    i = 0
+    for i, row in raw.iterrows():
+        if i < 10: continue
+        if row.iloc[0] == '.': break
+    # Rename #
+    df = raw.iloc[9:i].copy()
+    df.columns = columns
+    for i, row in df.iterrows():
+        cat, subcat = row['land_use'], row['subdivision']
+        if pandas.notna(subcat) and subcat != cat:
+            raise Exception("Cat. and subcat. should never differ.")
+    # Short titles, older versions of pandas also inferred the types here #
+    rows = extra_data.ipcc_rows
+    df   = df.replace(list(rows['ipcc']), list(rows['forest_puller'])).infer_objects()
+    # Units #
+    for i, row in extra_data.ipcc_columns.iterrows():
+        col_name, ratio = row['forest_puller'], row['unit_convert_ratio']
+        if numpy.isnan(ratio): continue
+        df[col_name] = df[col_name] * ratio
+    # Return #
+    return df.reset_index(drop=True)
+
+###############################################################################
+def make_raw(rng, n_rows):
+    """A table 4.A with a header, `n_rows` rows of data and a terminator."""
+    # The header, the names that get '_per_area' appended are given without #
+    names = [name[:-len('_per_area')] if name.endswith('_per_area') else name
+             for name in extra_data.ipcc_columns['ipcc']]
+    n_cols = len(names)
+    header = pandas.DataFrame([[numpy.nan] * n_cols] * 9, dtype=object)
+    header.iloc[7] = names
+    header.iloc[2, 0] = '.'
+    # The land uses, some of them repeated as subdivision #
+    land_uses = rng.choice(extra_data.ipcc_rows['ipcc'].to_numpy(), size=n_rows)
+    repeated  = rng.random(n_rows) < 0.5
+    values    = rng.random((n_rows, n_cols - 2)) * 100
+    values[rng.random(values.shape) < 0.2] = numpy.nan
+    body = pandas.DataFrame(values, columns=range(2, n_cols))
+    body.insert(0, 0, land_uses)
+    body.insert(1, 1, numpy.where(repeated, land_uses, None))
+    # The terminator and what follows #
+    footer = pandas.DataFrame([['.'] + [numpy.nan] * (n_cols - 1),
+                               ['Notes'] + [numpy.nan] * (n_cols - 1)])
+    # Return #
+    return pandas.concat([header, body, footer], ignore_index=True)
+
+###############################################################################
+def test_year(monkeypatch):
+    # Start without any parsed layout #
+    monkeypatch.setattr(forest_puller.ipcc.headers, 'layouts', {})
+    rng = numpy.random.default_rng(0)
+    for n_rows in [1, 2, 5, 20]:
+        raw  = make_raw(rng, n_rows)
+        year = Year.__new__(Year)
+        year.country   = SimpleNamespace(iso2_code='AT')
+        year.year      = 1990
+        year.__cache__ = {'raw_table_4a': raw}
+        # This layout is the one we know #
+        monkeypatch.setattr(Headers, 'known', {year.headers.fingerprint})
+        # Compare #
+        assert year.last_row == 9 + n_rows
+        expected = loop_df(raw, year.headers.df)
+        provided = Year.df.func(year)
+        pandas.testing.assert_frame_equal(provided, expected)
+        assert provided['area'].dtype == 'float64'
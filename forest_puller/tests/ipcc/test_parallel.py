@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+This test suite can be run with pytest.
+Or you can import it individually:
+
+    >>> from forest_puller.tests.ipcc.test_parallel import test_build_all
+    >>> print(test_build_all())
+"""
+
+# Built-in modules #
+import os
+
+# Internal modules #
+import forest_puller.ipcc.country
+from forest_puller.ipcc.parallel import build_all
+from forest_puller.store import property_stored_at, backend_var_name
+
+# First party modules #
+
+# Third party modules #
+import pandas
+
+###############################################################################
+class FakeYear:
+    """Parses one small csv file instead of an excel file."""
+
+    calls = []
+
+    def __init__(self, iso2_code, year, directory):
+        self.iso2_code = iso2_code
+        self.year      = year
+        self.directory = directory
+        self.source    = os.path.join(directory, '%s_%i.csv' % (iso2_code, year))
+        with open(self.source, 'w') as handle: handle.write('area\n%i\n' % year)
+
+    @property
+    def df_inputs(self): return [self.source]
+
+    @property
+    def df_cache_path(self):
+        return os.path.join(self.directory, '%s_%i.pickle' % (self.iso2_code, self.year))
+
+    @property_stored_at('df_cache_path', inputs='df_inputs', version=1)
+    def df(self):
+        type(self).calls.append((self.iso2_code, self.year))
+        return pandas.read_csv(self.source)
+
+class FakeCountry:
+    """Just a list of years with an ISO2 code."""
+
+    def __init__(self, iso2_code, years, directory):
+        self.iso2_code = iso2_code
+        self.years     = [FakeYear(iso2_code, year, directory) for year in years]
+
+    def __iter__(self): return iter(self.years)
+
+###############################################################################
+def test_build_all(tmp_path, monkeypatch):
+    # Use the default backend #
+    monkeypatch.delenv(backend_var_name, raising=False)
+    directory = str(tmp_path)
+    # Two fake countries instead of the real ones #
+    fakes = [FakeCountry('AT', [1990, 1991], directory),
+             FakeCountry('BE', [1990],       directory)]
+    monkeypatch.setattr(forest_puller.ipcc.country, 'all_countries', fakes, raising=False)
+    monkeypatch.setattr(forest_puller.ipcc.country, 'countries',
+                        {c.iso2_code: c for c in fakes}, raising=False)
+    FakeYear.calls = []
+    # Only the chosen countries are parsed #
+    assert build_all(countries=['AT'], processes=1) == [('AT', 1990), ('AT', 1991)]
+    assert FakeYear.calls == [('AT', 1990), ('AT', 1991)]
+    # The stored ones are skipped #
+    assert build_all(processes=1) == [('BE', 1990)]
+    assert build_all(processes=1) == []
+    assert len(FakeYear.calls) == 3
+    # Unless they are outdated #
+    with open(fakes[0].years[1].source, 'w') as handle: handle.write('area\n5\n')
+    assert build_all(processes=1) == [('AT', 1991)]
+    # Or we ask for a rerun #
+    assert build_all(countries=['BE'], processes=1, rerun=True) == [('BE', 1990)]
+    assert len(FakeYear.calls) == 5
+    # The new values are read from disk, not from memory #
+    assert fakes[0].years[1].df['area'].tolist() == [5]
+    # Nothing to do #
+    assert build_all(countries=['XX'], processes=1) == []
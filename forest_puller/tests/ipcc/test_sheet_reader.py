@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+This test suite can be run with pytest.
+Or you can import it individually:
+
+    >>> from forest_puller.tests.ipcc.test_sheet_reader import test_sheet_reader
+    >>> print(test_sheet_reader())
+"""
+
+# Built-in modules #
+
+# Internal modules #
+from forest_puller.ipcc.sheet_reader import SheetReader
+
+# First party modules #
+
+# Third party modules #
+import pandas, pytest
+openpyxl = pytest.importorskip('openpyxl')
+from openpyxl.cell.rich_text import CellRichText, TextBlock
+from openpyxl.cell.text import InlineFont
+
+###############################################################################
+def make_workbook(path):
+    """A workbook with a first sheet to skip and a sheet of every kind of cell."""
+    workbook = openpyxl.Workbook()
+    workbook.active.title = 'Other'
+    workbook.active['A1'] = 'Not this one'
+    sheet = workbook.create_sheet('Table4.A')
+    # Shared strings, including one repeated and one that is a NA value #
+    sheet['A1'] = 'Land-use category'
+    sheet['B1'] = 'Land-use category'
+    sheet['C1'] = 'NO'
+    # Inline strings with rich text runs #
+    sheet['A2'] = CellRichText(['Total ', TextBlock(InlineFont(b=True), 'forest')])
+    # Row 3 is skipped, row 4 has holes #
+    sheet['B4'] = 1
+    sheet['E4'] = 'x'
+    # Booleans and error cells #
+    sheet['A5'] = True
+    sheet['B5'] = False
+    sheet['C5'] = '#N/A'
+    sheet['D5'] = '#DIV/0!'
+    # Numeric formats #
+    sheet['A6'] = 1.0
+    sheet['B6'] = 2.5
+    sheet['C6'] = 1e-20
+    sheet['D6'] = 123456789012
+    sheet['E6'] = -0.25
+    sheet['E6'].number_format = '0.00%'
+    sheet['F6'] = 3.14159
+    sheet['F6'].number_format = '0.0'
+    # Trailing empty rows are dropped #
+    sheet['A9'] = None
+    workbook.save(str(path))
+    return path
+
+###############################################################################
+def test_sheet_reader(tmp_path):
+    path = make_workbook(tmp_path / 'test.xlsx')
+    for kwargs in [{}, {'na_values': ['NO', 'x']}]:
+        expected = pandas.read_excel(path, sheet_name='Table4.A', header=None, **kwargs)
+        provided = SheetReader(str(path), 'Table4.A').df(**kwargs)
+        pandas.testing.assert_frame_equal(provided, expected)
+    # File-like objects work too #
+    with open(path, 'rb') as handle:
+        provided = SheetReader(handle, 'Other').df()
+    pandas.testing.assert_frame_equal(provided, pandas.read_excel(path, header=None))
+    # An unknown sheet is an error #
+    with pytest.raises(ValueError): SheetReader(str(path), 'Table4.B').df()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+This test suite can be run with pytest.
+Or you can import it individually:
+
+    >>> from forest_puller.tests.ipcc.test_zip_member import test_zip_member
+    >>> print(test_zip_member())
+"""
+
+# Built-in modules #
+import zipfile
+
+# Internal modules #
+from forest_puller.ipcc.country      import Country
+from forest_puller.ipcc.zip_member   import ZipMember
+from forest_puller.ipcc.sheet_reader import SheetReader
+
+# First party modules #
+
+# Third party modules #
+import pandas, pytest
+openpyxl = pytest.importorskip('openpyxl')
+
+###############################################################################
+def make_zip(tmp_path):
+    """A zip of small excel files, some nested, with a file to ignore."""
+    # The excel files #
+    source = tmp_path / 'source'
+    source.mkdir()
+    names = ['AUT_2019_1991_1004.xlsx', 'AUT_2019_1990_1004.xlsx', 'nested/AUT_2019_1992_1004.xlsx']
+    for i, name in enumerate(names):
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.title = 'Table4.A'
+        sheet.append(['Category', 'Area', 'Stock'])
+        sheet.append(['Forest land', 100.0 + i, 'NO'])
+        sheet.append(['Cropland', 2.5 * i, None])
+        path = source / name
+        path.parent.mkdir(exist_ok=True)
+        workbook.save(path)
+    # Something that is not an excel file #
+    (source / 'readme.txt').write_text('Not an excel file')
+    # The archive, with directory entries #
+    zip_path = tmp_path / 'aut-2019-crf-15apr19.zip'
+    with zipfile.ZipFile(zip_path, 'w') as archive:
+        archive.writestr('nested/', '')
+        for name in names + ['readme.txt']: archive.write(source / name, name)
+    return zip_path, source
+
+###############################################################################
+def test_zip_member(tmp_path):
+    zip_path, source = make_zip(tmp_path)
+    # Only the excel files, sorted, without decompressing #
+    members = ZipMember.all_in(zip_path)
+    assert [m.member for m in members] == ['AUT_2019_1990_1004.xlsx',
+                                           'AUT_2019_1991_1004.xlsx',
+                                           'nested/AUT_2019_1992_1004.xlsx']
+    assert [m.name for m in members] == ['AUT_2019_1990_1004.xlsx',
+                                         'AUT_2019_1991_1004.xlsx',
+                                         'AUT_2019_1992_1004.xlsx']
+    # Extract the archive to compare with the files on disk #
+    extracted = tmp_path / 'extracted'
+    with zipfile.ZipFile(zip_path) as archive: archive.extractall(extracted)
+    for member in members:
+        from_zip  = SheetReader(member.open(), 'Table4.A').df()
+        from_disk = SheetReader(str(extracted / member.member), 'Table4.A').df()
+        pandas.testing.assert_frame_equal(from_zip, from_disk)
+        expected  = pandas.read_excel(source / member.member, sheet_name='Table4.A', header=None)
+        pandas.testing.assert_frame_equal(from_zip, expected, check_dtype=False)
+    # The digest only changes with the contents #
+    assert members[0].digest() != members[1].digest()
+    assert members[0].digest() == ZipMember(zip_path, members[0].member).digest()
+
+###############################################################################
+def test_read_zip(tmp_path, monkeypatch):
+    zip_path, source = make_zip(tmp_path)
+    country = Country('AT', str(tmp_path) + '/')
+    country.__cache__ = {'zip_file': zip_path}
+    # The environment variable is read when accessed, not at import #
+    monkeypatch.delenv('FOREST_PULLER_IPCC_ZIP', raising=False)
+    assert not country.read_zip
+    monkeypatch.setenv('FOREST_PULLER_IPCC_ZIP', '0')
+    assert not country.read_zip
+    monkeypatch.setenv('FOREST_PULLER_IPCC_ZIP', '1')
+    assert country.read_zip
+    # The years then come from the members of the zip #
+    assert [year.year for year in country] == [1990, 1991, 1992]
+    assert all(isinstance(year.xls_file, ZipMember) for year in country)
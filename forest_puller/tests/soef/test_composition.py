@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+This test suite can be run with pytest.
+Or you can import it individually:
+
+    >>> from forest_puller.tests.soef.test_composition import test_composition
+    >>> print(test_composition())
+"""
+
+# Built-in modules #
+
+# Internal modules #
+from forest_puller.soef.composition import CompositionData
+
+# First party modules #
+
+# Third party modules #
+import numpy, pandas
+
+###############################################################################
+def make_composition():
+    """
+    Four groups: AT 1990 is complete, AT 2000 has no total,
+    BE 1990 has no species with a density and BE 2000 has no
+    species without a density but its total does not match.
+    """
+    nan = numpy.nan
+    df = pandas.DataFrame([
+        ('AT', 1990, 1,           'Picea',   'abies',   'Picea abies',   60.0, 0.4),
+        ('AT', 1990, 2,           'Pinus',   'nigra',   'Pinus nigra',   20.0, 0.5),
+        ('AT', 1990, 3,           'Unknown', 'x',       'Unknown x',     15.0, nan),
+        ('AT', 1990, 'remaining', 'missing', 'missing', 'remaining',      5.0, nan),
+        ('AT', 1990, 'total',     'missing', 'missing', 'total',        100.0, nan),
+        ('AT', 2000, 1,           'Picea',   'abies',   'Picea abies',   50.0, 0.4),
+        ('AT', 2000, 2,           'Unknown', 'x',       'Unknown x',     10.0, nan),
+        ('BE', 1990, 1,           'Unknown', 'x',       'Unknown x',     30.0, nan),
+        ('BE', 1990, 'total',     'missing', 'missing', 'total',         30.0, nan),
+        ('BE', 2000, 1,           'Fagus',   'alba',    'Fagus alba',    40.0, 0.6),
+        ('BE', 2000, 'total',     'missing', 'missing', 'total',         50.0, nan)],
+        columns = ['country', 'year', 'rank', 'genus', 'species',
+                   'latin_name', 'growing_stock', 'density'])
+    composition = CompositionData('')
+    composition.__cache__ = {'stock_density': df}
+    return composition
+
+###############################################################################
+def test_composition():
+    composition = make_composition()
+    # The sums of every group #
+    sums = composition.group_sums.set_index(['country', 'year'])
+    assert sums['unassigned'].tolist() == [20.0, 10.0, 30.0, 0.0]
+    assert sums['assigned'].tolist()   == [80.0, 50.0, 0.0, 40.0]
+    assert sums['n_assigned'].tolist() == [2, 1, 0, 1]
+    assert numpy.isnan(sums.loc[('AT', 2000), 'total'])
+    # The unassigned are replaced by one remaining row, last in its group #
+    collapsed = composition.stock_collapsed
+    groups    = collapsed.groupby(['country', 'year'], sort=False)
+    assert [list(g['latin_name']) for _, g in groups] == [
+        ['Picea abies', 'Pinus nigra', 'total', 'remaining'],
+        ['Picea abies', 'remaining'],
+        ['total', 'remaining'],
+        ['Fagus alba', 'total', 'remaining']]
+    remaining = collapsed[collapsed['rank'] == 'remaining']
+    assert remaining['growing_stock'].tolist() == [20.0, 10.0, 30.0, 0.0]
+    assert set(remaining['genus']) == {'missing'}
+    # Only AT 1990 has a total, a remaining and an assigned stock #
+    densities = composition.avg_densities
+    assert densities[['country', 'year']].values.tolist() == [['AT', 1990]]
+    assert numpy.isclose(densities['avg_density'][0], (0.4 * 60 + 0.5 * 20) / 80)
+    assert numpy.isclose(densities['frac_missing'][0], 1.0 - 80 / 100)
+    # Only BE 2000 has a total that does not match #
+    mismatch = composition.sanity_check()
+    assert mismatch[['country', 'year']].values.tolist() == [['BE', 2000]]
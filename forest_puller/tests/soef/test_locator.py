@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+This test suite can be run with pytest.
+Or you can import it individually:
+
+    >>> from forest_puller.tests.soef.test_locator import test_locator
+    >>> print(test_locator())
+"""
+
+# Built-in modules #
+
+# Internal modules #
+from forest_puller.soef.locator import SheetLocator
+
+# First party modules #
+
+# Third party modules #
+import numpy, pandas
+
+###############################################################################
+# The row by row searches that `SheetLocator` replaces #
+def loop_find_title(sheet, title):
+    for i, row in sheet.iterrows():
+        if row[0] == title: return i
+
+def loop_first_empty_row(sheet, start_row):
+    for i, row in sheet.iterrows():
+        if i <= start_row + 3:            continue
+        if all(row.fillna(-999) == -999): return i
+
+def loop_first_empty_col(sheet, start_row, end_row):
+    df = sheet.iloc[start_row:end_row]
+    for i, name in enumerate(df.columns):
+        column = df[name]
+        if all(column.fillna(-999) == -999): return i
+    return len(df.columns)
+
+def loop_first_prefix_row(sheet, prefix, start_row):
+    # The loop failed on cells that are not text, these are skipped here #
+    for i, row in sheet.iterrows():
+        if i <= start_row + 3:               continue
+        if not isinstance(row.iloc[0], str): continue
+        if row.iloc[0].startswith(prefix):   return i
+
+###############################################################################
+def make_sheet(rng, n_rows=30, n_cols=8):
+    """A sheet with titles, notes, numbers, -999 fill values and holes."""
+    choices = ['Table A', 'Table B', 'Note: a', 'Notes', 'text', 1.5, 7, -999, numpy.nan]
+    cells = rng.choice(numpy.array(choices, dtype=object), size=(n_rows, n_cols))
+    sheet = pandas.DataFrame(cells)
+    # Some completely empty rows and columns #
+    sheet.iloc[rng.choice(n_rows, 4, replace=False)] = numpy.nan
+    sheet.iloc[:, rng.choice(n_cols, 2, replace=False)] = -999
+    return sheet
+
+###############################################################################
+def test_locator():
+    rng = numpy.random.default_rng(0)
+    for _ in range(50):
+        sheet   = make_sheet(rng)
+        locator = SheetLocator(sheet)
+        for title in ['Table A', 'Table B', 'Missing']:
+            assert locator.find_title(title) == loop_find_title(sheet, title)
+        for start_row in range(0, len(sheet), 3):
+            assert locator.first_empty_row(after=start_row + 4) == \
+                   loop_first_empty_row(sheet, start_row)
+            for prefix in ['Note:', 'Notes', 'Table']:
+                assert locator.first_prefix_row(prefix, after=start_row + 4) == \
+                       loop_first_prefix_row(sheet, prefix, start_row)
+            for end_row in range(start_row + 1, len(sheet), 5):
+                assert locator.first_empty_col(start_row, end_row) == \
+                       loop_first_empty_col(sheet, start_row, end_row)
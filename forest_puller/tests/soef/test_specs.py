@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+This test suite can be run with pytest.
+Or you can import it individually:
+
+    >>> from forest_puller.tests.soef.test_specs import test_legacy_parsers
+    >>> print(test_legacy_parsers())
+"""
+
+# Built-in modules #
+from types import SimpleNamespace
+
+# Internal modules #
+from forest_puller.soef.specs import registry
+
+# First party modules #
+
+# Third party modules #
+
+###############################################################################
+def test_legacy_parsers():
+    from forest_puller.soef.table_parser        import ForestArea, AgeDist, Fellings
+    from forest_puller.soef.growing_stock       import Stock, StockByType
+    from forest_puller.soef.area_by_forest_type import AreaByType
+    country = SimpleNamespace(iso2_code='AT', xls_file=None)
+    parsers = {'forest_area':   ForestArea,
+               'age_dist':      AgeDist,
+               'fellings':      Fellings,
+               'stock':         Stock,
+               'stock_by_type': StockByType,
+               'area_by_type':  AreaByType}
+    for short_name, parser in parsers.items():
+        spec = registry[short_name]
+        # The class attributes are those of the registry #
+        assert parser.short_name == short_name
+        assert parser.sheet_name == spec.sheet_name
+        assert parser.title      == spec.title
+        # Instantiated with only a country, like before #
+        table = parser(country)
+        assert isinstance(table, spec.parser)
+        assert table.spec is spec
+        assert table.country is country
+        assert table.header_len == spec.header_len
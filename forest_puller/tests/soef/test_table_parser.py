@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+This test suite can be run with pytest.
+Or you can import it individually:
+
+    >>> from forest_puller.tests.soef.test_table_parser import test_table_parser
+    >>> print(test_table_parser())
+"""
+
+# Built-in modules #
+import re
+from types import SimpleNamespace
+
+# Internal modules #
+from forest_puller.common import extra_data
+from forest_puller.soef.table_parser import TableParser
+
+# First party modules #
+
+# Third party modules #
+import numpy, pandas
+
+###############################################################################
+# The row by row versions that `TableParser` replaces #
+def loop_header(cropped, header_len):
+    df = cropped.iloc[0:header_len]
+    df = df[:-1].copy()
+    df = df.T.ffill().T
+    df = df.fillna('')
+    df = list(' '.join(map(str, row.tolist())) for i, row in df.T.iterrows())
+    df = [col.replace("\n", " ").strip() for col in df]
+    df = [re.sub('1 000', '1000', col) for col in df]
+    before = list(extra_data.soef_columns['soef'])
+    after  = list(extra_data.soef_columns['forest_puller'])
+    df     = pandas.Series(df).replace(before, after)
+    def to_numeric(name):
+        try: return pandas.to_numeric(name, downcast='integer')
+        except ValueError: return name
+    return df.apply(to_numeric)
+
+def loop_merged_category(cropped, header_len):
+    # Except that the row that starts a group belongs to it #
+    df = cropped.iloc[header_len:].copy()
+    df = df.reset_index(drop=True)
+    seen, start, text = set(), 0, ""
+    for i, row in df.iterrows():
+        cat, val = row.iloc[0], row.iloc[1]
+        if val in seen:
+            df.iloc[start:i, 0] = text
+            seen, start, text = set(), i, ""
+        if cat is not numpy.nan: text += str(cat)
+        seen.add(val)
+    df.iloc[start:, 0] = text
+    return df
+
+###############################################################################
+def make_parser(cropped, header_len):
+    """A parser of a table that was already cropped from its sheet."""
+    parser = TableParser(SimpleNamespace(xls_file='test.xls', iso2_code='AT'))
+    parser.header_len = header_len
+    parser.__cache__  = {'cropped_sheet': cropped}
+    return parser
+
+###############################################################################
+def test_table_parser():
+    rng   = numpy.random.default_rng(0)
+    known = extra_data.soef_columns['soef'].iloc[0]
+    names = numpy.array(['Area', 'Growing\nstock', 'Total area (1 000 ha)', known,
+                         '1990', 1990, 2000.0, 2005.5, '', numpy.nan], dtype=object)
+    cats  = numpy.array(['Forest', 'available', 'Other', 'land', numpy.nan], dtype=object)
+    years = numpy.array([1990, 2000, 2005, 2010, numpy.nan], dtype=object)
+    for _ in range(200):
+        n_cols, header_len, n_rows = rng.integers(2, 6), rng.integers(2, 5), rng.integers(1, 15)
+        header = rng.choice(names, size=(header_len, n_cols))
+        body   = numpy.column_stack([rng.choice(cats,  size=n_rows),
+                                     rng.choice(years, size=n_rows),
+                                     rng.random((n_rows, n_cols - 2))]).astype(object)
+        cropped = pandas.DataFrame(numpy.vstack([header, body]), dtype=object)
+        parser  = make_parser(cropped, header_len)
+        pandas.testing.assert_series_equal(parser.header, loop_header(cropped, header_len),
+                                           check_dtype=False)
+        pandas.testing.assert_frame_equal(parser.merged_category,
+                                          loop_merged_category(cropped, header_len))
+
+###############################################################################
+def loop_number_groups(vals):
+    groups, seen, group = [], set(), 0
+    for val in vals:
+        key = 'nan' if pandas.isna(val) else val
+        if key in seen: seen, group = set(), group + 1
+        seen.add(key)
+        groups.append(group)
+    return groups
+
+def test_number_groups():
+    rng = numpy.random.default_rng(1)
+    assert TableParser.number_groups(pandas.Series([], dtype=object)).tolist() == []
+    vals = pandas.Series([1990, 2000, 1990, 2000, 2005, 2000, numpy.nan, numpy.nan, 2005])
+    assert TableParser.number_groups(vals).tolist() == [0, 0, 1, 1, 1, 2, 2, 3, 3]
+    for _ in range(500):
+        vals = pandas.Series(rng.choice([1990, 2000, 2005, 2010, numpy.nan], size=rng.integers(1, 30)))
+        assert TableParser.number_groups(vals).tolist() == loop_number_groups(vals)
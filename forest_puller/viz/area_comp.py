@@ -109,17 +109,17 @@ class AreaCompData:
         # Filter #
         df = df.query("scenario == 1")
         # Sum all the different categories (FAWS, FNAWS, FRAWS) #
-        df = (df.groupby(['country', 'year'])
+        df = (df.groupby(['country', 'year'], observed=True)
               .agg({'area': 'sum'})
               .reset_index())
         # Columns #
         df = df[['country', 'year', 'area']]
         # Take only the minimum year for each country #
-        selector  = df.groupby('country')['year'].idxmin()
+        selector  = df.groupby('country', observed=True)['year'].idxmin()
         df = df.loc[selector]
         # Extend the line to the end year #
         other     = pandas.concat([self.ipcc, self.soef], ignore_index=True)
-        selector  = other.groupby('country')['year'].idxmax()
+        selector  = other.groupby('country', observed=True)['year'].idxmax()
         other     = other.loc[selector][['country', 'year']]
         other     = other.left_join(df[['area', 'country']], on='country')
         other     = other.dropna()
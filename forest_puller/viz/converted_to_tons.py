@@ -20,6 +20,7 @@ from forest_puller.viz.increments    import GainsLossNetGraph, GainsLossNetLegen
 from forest_puller.common            import country_codes
 from forest_puller                   import cache_dir
 from forest_puller.viz.increments_df import increments_data as gain_loss_net_data
+from forest_puller.conversion.carbon import CarbonConverter, carbon_converter
 
 # First party modules #
 from plumbing.cache  import property_cached
@@ -36,15 +37,18 @@ class ConvertedTonsData:
     * The following is considered in each country per year per hectare.
     * Start with: cubic meter in [m^3].
     * Obtain: the tons per carbon in [kg].
+
+    All sources are converted together by `forest_puller.conversion.carbon`.
+    The conversion chain is chosen by the unit of each source, so a new
+    source in the increments data frame is converted without changes here.
     """
 
-    # This value comes from:
-    # https://www.unece.org/fileadmin/DAM/timber/publications/DP-49.pdf
-    bark_correction_factor = 0.88
+    # See the conversion engine #
+    bark_correction_factor = CarbonConverter.bark_correction_factor
+    carbon_fraction        = CarbonConverter.carbon_fraction
 
-    # This value comes from:
-    # https://www.ipcc-nggip.iges.or.jp/public/2006gl/pdf/4_Volume4/V4_04_Ch4_Forest_Land.pdf
-    carbon_fraction = 0.47
+    # The variables of the increments data frame #
+    variables = ['gain_per_ha', 'loss_per_ha', 'net_per_ha']
 
     #----------------------------- Data sources ------------------------------#
     @property
@@ -67,6 +71,56 @@ class ConvertedTonsData:
         # Return #
         return df
 
+    #------------------------------- Convert ---------------------------------#
+    @property_cached
+    def long_volumes(self):
+        """
+        Every source of the increments data frame in long format, before
+        any conversion. The `row` column is the position of the row in the
+        original data frame. Columns are:
+
+            ['row', 'source', 'unit', 'country', 'year', 'variable', 'value']
+        """
+        # Load #
+        df = gain_loss_net_data.df.reset_index(names='row')
+        # Unpivot #
+        df = df.melt(id_vars    = ['row', 'source', 'unit', 'country', 'year'],
+                     value_vars = self.variables,
+                     var_name   = 'variable',
+                     value_name = 'value')
+        # Return #
+        return df
+
+    @property_cached
+    def long(self):
+        """Same as `self.long_volumes` with volumes converted to tons of carbon."""
+        return carbon_converter.convert(self.long_volumes)
+
+    def uncertainty(self, n_draws=10000, quantiles=(0.05, 0.5, 0.95), **kwargs):
+        """
+        The quantiles of the tons of carbon of every source, country, year
+        and variable, obtained by drawing the conversion coefficients
+        `n_draws` times. The spreads of the coefficients must be given as
+        keyword arguments, see `forest_puller.conversion.uncertainty`.
+        """
+        # Import #
+        from forest_puller.conversion.uncertainty import monte_carlo
+        # Compute #
+        df = monte_carlo.quantiles(self.long_volumes, n_draws, quantiles, **kwargs)
+        # Return #
+        return df.drop(columns=['row'])
+
+    def wide(self, source):
+        """One source of `self.long` back in wide format, in its original order."""
+        # Select #
+        df = self.long.query("source == @source")
+        # Pivot #
+        df = df.pivot(index=['row', 'country', 'year'], columns='variable', values='value')
+        df = df.reset_index().drop(columns=['row'])
+        df.columns.name = None
+        # Return #
+        return df
+
     #------------------------ Data sources modified --------------------------#
     @property
     def soef(self):
@@ -76,16 +130,7 @@ class ConvertedTonsData:
         SOEF data is over bark.
         """
         # Load #
-        df = gain_loss_net_data.soef.copy()
-        # Join the biomass conversion and expansion factors bcef #
-        index = ['country', 'year']
-        df = df.left_join(self.bcef, on=index)
-        # Join the root to shoot ratio #
-        df = df.left_join(self.root_ratio, on=index)
-        # Convert the gains to tons of carbon #
-        df['gain_per_ha'] *= df['bcefi'] * (1 + df['root_ratio']) * self.carbon_fraction
-        # Convert the losses to tons of carbon #
-        df['loss_per_ha'] *= df['bcefr'] * (1 + df['root_ratio']) * self.carbon_fraction
+        df = self.wide('soef')
         # Compute the net again #
         df['net_per_ha'] = df['gain_per_ha'] + df['loss_per_ha']
         # Remove unnecessary columns #
@@ -99,16 +144,7 @@ class ConvertedTonsData:
     def faostat(self):
         """FAOSTAT data is under bark."""
         # Load #
-        df = gain_loss_net_data.faostat.copy()
-        # Join the biomass conversion and expansion factors bcef #
-        index = ['country', 'year']
-        df = df.left_join(self.bcef, on=index)
-        # Join the root to shoot ratio #
-        df = df.left_join(self.root_ratio, on=index)
-        # Convert the losses to tons of carbon #
-        df['loss_per_ha'] *= df['bcefr'] * (1 + df['root_ratio']) * self.carbon_fraction
-        # Bark correction factor #
-        df['loss_per_ha'] /= self.bark_correction_factor
+        df = self.wide('fao')
         # Remove unnecessary columns #
         df = df[gain_loss_net_data.faostat.columns]
         # Add source #
@@ -120,14 +156,7 @@ class ConvertedTonsData:
     def hpffre(self):
         """HPFFRE data is over bark."""
         # Load #
-        df = gain_loss_net_data.hpffre.copy()
-        # Join the biomass conversion and expansion factors bcef #
-        index = ['country', 'year']
-        df = df.left_join(self.bcef, on=index)
-        # Join the root to shoot ratio #
-        df = df.left_join(self.root_ratio, on=index)
-        # Convert the losses to tons of carbon #
-        df['loss_per_ha'] *= df['bcefr'] * (1 + df['root_ratio']) * self.carbon_fraction
+        df = self.wide('hpffre')
         # Remove unnecessary columns #
         columns_to_keep = ['country', 'year', 'loss_per_ha']
         df = df[columns_to_keep]
@@ -42,7 +42,7 @@ class CorrelationData:
         # Drop missing values #
         df = df.dropna()
         # Drop countries with less than 5 values #
-        df = df.groupby(['country']).filter(lambda x: len(x) > 4)
+        df = df.groupby(['country'], observed=True).filter(lambda x: len(x) > 4)
         # Return #
         return df
 
@@ -51,7 +51,7 @@ class CorrelationData:
         # Load #
         df = self.ipcc_faos
         # Correlate #
-        groups = (df.groupby(['country'])[['loss_per_ha_ipcc', 'loss_per_ha_faos']])
+        groups = (df.groupby(['country'], observed=True)[['loss_per_ha_ipcc', 'loss_per_ha_faos']])
         corr   = groups.corr()
         corr   = corr.unstack().iloc[:, 1].reset_index()
         # Rename columns #
@@ -59,7 +59,7 @@ class GenusAggregate(Graph):
         # Assert there are no NaNs #
         assert not df.isna().any().any()
         # Aggregate #
-        df = df.groupby(['genus'])
+        df = df.groupby(['genus'], observed=True)
         df = df.agg(pandas.DataFrame.sum, skipna=False)
         df = df.reset_index()
         # Columns #
@@ -100,7 +100,7 @@ class GenusComposition:
         # Join #
         df = df.left_join(comp_data.latin_mapping, on='latin_name')
         # Sum rows that are the same genus #
-        df = df.groupby(['genus', 'year']).aggregate({'stock_m3': 'sum'})
+        df = df.groupby(['genus', 'year'], observed=True).aggregate({'stock_m3': 'sum'})
         # Reset index #
         df = df.reset_index()
         # Sort the dataframe #
@@ -264,7 +264,7 @@ class GenusBarstackLegend(SoloLegend):
         # All the stock fractions data together #
         df = pandas.concat(cntrys)
         # Sum all the growing stock in all countries #
-        df = df.groupby(['genus']).aggregate({'stock_m3': 'sum'})
+        df = df.groupby(['genus'], observed=True).aggregate({'stock_m3': 'sum'})
         df = df.reset_index()
         # Import #
         from forest_puller.conversion.tree_species_info import df as species_info
@@ -225,7 +225,7 @@ class IncAggregateFAOSTAT(IncAggregate):
         fell = fell.query("element == 'Production'")
         fell = fell.query("unit == 'm3'")
         # Group fell #
-        fell = (fell.groupby(['country', 'year'])
+        fell = (fell.groupby(['country', 'year'], observed=True)
                 .agg({'value': sum})
                 .reset_index())
         # Filter area #
@@ -244,7 +244,7 @@ class IncAggregateFAOSTAT(IncAggregate):
         # Sort the result #
         df = df.sort_values(['country', 'year'])
         # Compute common years #
-        common_years = df.groupby('country').apply(lambda x: set(x.year))
+        common_years = df.groupby('country', observed=True).apply(lambda x: set(x.year))
         common_years = set.intersection(*common_years.values)
         # Filter by common years #
         df = df.query("year in @common_years")
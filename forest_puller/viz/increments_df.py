@@ -97,7 +97,7 @@ class GainsLossNetData:
         fell = fell.query("element == 'Production'")
         fell = fell.query("unit == 'm3'")
         # Group forestry #
-        fell = (fell.groupby(['country', 'year'])
+        fell = (fell.groupby(['country', 'year'], observed=True)
                 .agg({'value': sum})
                 .reset_index())
         # Filter land #
@@ -134,14 +134,14 @@ class GainsLossNetData:
         df = df.query("scenario == 1")
         # Sum all the different categories #
         df = (df
-              .groupby(['country', 'year'])
+              .groupby(['country', 'year'], observed=True)
               .agg({'fellings_per_ha':            'sum',
                     'growing_stock_volume_total': 'sum',
                     'area':                       'sum',})
               .reset_index())
         # The growth reported here is the total stock, not the delta
         # So we need to operate a rolling subtraction and divide by years
-        group           = df.groupby(['country'])
+        group           = df.groupby(['country'], observed=True)
         df['net_diff']  = group['growing_stock_volume_total'].diff()
         df['year_diff'] = group['year'].diff()
         df['area_diff'] = group['area'].diff()
@@ -189,7 +189,9 @@ class GainsLossNetData:
         # Combine all data sources #
         sources = [ipcc, soef, faostat, hpffre]
         df = pandas.concat(sources, ignore_index=True)
-        return df
+        # Use categoricals and compact years #
+        from forest_puller.schema import schema
+        return schema.apply(df)
 
 ###############################################################################
 # Create the singleton #
@@ -44,7 +44,7 @@ class GainsLossNetExtra:
         df = df.dropna()
         # The growth reported here is the total stock, not the delta
         # So we need to operate a rolling subtraction and divide by years
-        group           = df.groupby(['country'])
+        group           = df.groupby(['country'], observed=True)
         df['net_diff']  = group['total_stock'].diff()
         df['year_diff'] = group['year'].diff()
         df['area_diff'] = group['area'].diff()
@@ -97,7 +97,7 @@ class GainsLossNetExtra:
         # Sort the dataframe so that years are ascending #
         df = df.sort_values(['country', 'year'])
         # Operate a rolling subtraction and divide by years #
-        group           = df.groupby(['country'])
+        group           = df.groupby(['country'], observed=True)
         df['net_diff']  = group['stock'].diff()
         df['year_diff'] = group['year'].diff()
         df['area_diff'] = group['area'].diff()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+A script to compare the speed of `pandas.read_excel` with the speed of the
+single sheet reader used for the IPCC CRF files, on every country and every
+year. It also checks that both readers produce identical data frames.
+
+Typically you would run this file from a command line like this:
+
+     ipython3 -i -- ~/deploy/forest_puller/scripts/dev/bench_table_4a.py
+"""
+
+# Built-in modules #
+import time
+
+# Third party modules #
+from tqdm import tqdm
+from pandas.testing import assert_frame_equal
+
+# Internal modules #
+from forest_puller.ipcc.country import all_countries
+
+###############################################################################
+all_years = [y for c in all_countries for y in c]
+timings   = {'pandas': 0.0, 'stream': 0.0}
+
+for y in tqdm(all_years):
+    # The original reader #
+    start    = time.perf_counter()
+    expected = y.raw_table_4a_pandas
+    timings['pandas'] += time.perf_counter() - start
+    # The streaming reader #
+    start    = time.perf_counter()
+    provided = y.raw_table_4a
+    timings['stream'] += time.perf_counter() - start
+    # Compare #
+    assert_frame_equal(expected, provided)
+    # Free memory #
+    del y.raw_table_4a
+
+###############################################################################
+print("Files read: %i" % len(all_years))
+for name, seconds in timings.items():
+    print("%-8s %8.1f s total, %6.1f ms per file" % (name, seconds, 1000 * seconds / len(all_years)))
+print("Speed-up: %.1fx" % (timings['pandas'] / timings['stream']))
@@ -12,55 +12,51 @@ A script to regenerate all the pickle files in `puller_cache`
 Typically you would run this file from a command line like this:
 
      ipython3 -i -- ~/deploy/forest_puller/scripts/dev/regen_prop_pickled.py
+
+Only the files whose inputs have changed (source files, mapping CSVs or
+parser versions) are regenerated. To regenerate every file instead:
+
+     ipython3 -i -- ~/deploy/forest_puller/scripts/dev/regen_prop_pickled.py --all
 """
 
 # Built-in modules #
+import sys
+
+# Internal modules #
+from forest_puller.store import store_all
 
 # Third party modules #
 from tqdm import tqdm
 
+# Should we rebuild everything or only what is out of date #
+rerun = '--all' in sys.argv
+
 ###############################################################################
-from forest_puller.ipcc.country import all_countries
-for c in tqdm(all_countries, desc='Countries'):
-    for y in tqdm(c, desc='Years', leave=False):
-        del y.df
-        df = y.df
+# Every country-year is parsed on its own process #
+from forest_puller.ipcc.parallel import build_all
+build_all(rerun=rerun)
 
 ###############################################################################
+# Each source below is split by country once and every country is stored #
 from forest_puller.faostat.land.country import all_countries
-for country in tqdm(all_countries):
-    del country.df
-    df = country.df
+store_all(tqdm(all_countries), rerun=rerun)
 
 ###############################################################################
 from forest_puller.faostat.forestry.country import all_countries
-for country in tqdm(all_countries):
-    del country.df
-    df = country.df
+store_all(tqdm(all_countries), rerun=rerun)
 
 ###############################################################################
 from forest_puller.fra.country import all_countries
-for country in tqdm(all_countries):
-    del country.df
-    df = country.df
+store_all(tqdm(all_countries), rerun=rerun)
 
 ###############################################################################
 from forest_puller.hpffre.country import all_countries
-for country in tqdm(all_countries):
-    del country.df
-    df = country.df
+store_all(tqdm(all_countries), rerun=rerun)
 
 ###############################################################################
-from forest_puller.soef.country import all_countries
-for country in tqdm(all_countries):
-    del country.forest_area
-    del country.age_dist
-    del country.fellings
-    del country.stock_comp
-    table1 = country.forest_area
-    table2 = country.age_dist
-    table3 = country.fellings
-    table4 = country.stock_comp
+# Every country is parsed on its own process #
+from forest_puller.soef.parallel import build_all
+build_all(rerun=rerun)
 
 ###############################################################################
 from forest_puller.soef.composition import composition_data
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Written by Lucas Sinclair and Paul Rougieux.
+
+JRC Biomass Project.
+Unit D1 Bioeconomy.
+
+Script to find the header layouts of every year of every country in
+`forest_puller.ipcc` that are not yet in `ipcc_layouts.csv`. The column
+names of each new layout are displayed and it is only added to the
+registry once you have examined them and confirmed.
+
+Typically you would run this file from a command line like this:
+
+     ipython3 -i -- ~/deploy/forest_puller/scripts/ipcc/register_layouts.py
+"""
+
+# Built-in modules #
+
+# Third party modules #
+import pandas
+from tqdm import tqdm
+
+# Internal modules #
+from forest_puller.common import extra_data
+from forest_puller.ipcc.country import all_countries
+
+###############################################################################
+# The layouts already registered #
+registered = extra_data.ipcc_layouts
+known      = set(registered['fingerprint'])
+
+# Go through every year, the column names must all be mapped #
+found = {}
+for country in tqdm(all_countries):
+    for year in country:
+        headers = year.headers
+        if headers.fingerprint in known or headers.fingerprint in found: continue
+        found[headers.fingerprint] = ('%s %i' % (country.iso2_code, year.year), headers)
+
+# Display each new one and ask #
+confirmed = []
+for fingerprint, (first_seen, headers) in found.items():
+    print("\nNew layout '%s' first seen in %s:" % (fingerprint, first_seen))
+    for i, (name, short) in enumerate(zip(headers.names, headers.parse())):
+        print("  %2i  %-60s -> %s" % (i, name, short))
+    answer = input("Add this layout to the registry? [y/N] ")
+    if answer.strip().lower() != 'y': continue
+    confirmed.append({'fingerprint': fingerprint,
+                      'first_seen':  first_seen,
+                      'names':       ' | '.join(map(str, headers.names))})
+
+# Write #
+if confirmed:
+    df = pandas.concat([registered, pandas.DataFrame(confirmed)], ignore_index=True)
+    df.to_csv(extra_data.path('ipcc_layouts'), index=False)
+print("\nAdded %i layouts out of %i new ones." % (len(confirmed), len(found)))
@@ -11,9 +11,11 @@ setup(
         author           = 'Lucas Sinclair',
         author_email     = 'lucas.sinclair@me.com',
         packages         = find_namespace_packages(),
-        install_requires = ['pandas>=1.0.0', 'matplotlib>=3.0.0', 'tqdm>=4.41.1',
+        install_requires = ['pandas>=2.1.0', 'matplotlib>=3.0.0', 'tqdm>=4.41.1',
                             'numpy>=1.16', 'brewer2mpl>=1.4.1', 'lxml>=4.3.0',
                             'requests', 'seaborn', 'sh',
                             'autopaths==1.4.6', 'plumbing==2.9.8', 'pymarktex==1.4.6'],
+        extras_require   = {'columnar': ['pyarrow']},
         include_package_data = True,
+        entry_points     = {'console_scripts': ['forest_puller = forest_puller.build:main']},
 )